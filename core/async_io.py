@@ -0,0 +1,246 @@
+import asyncio
+import functools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from core.engine_config import ASYNC_IO_CONFIG
+
+
+class IORequest:
+    """Handle for one request submitted to the engine I/O loop.
+
+    Results are only ever consumed on the engine thread: polling nodes call
+    take(), fire-and-forget callers pass on_done and get it called from
+    drain_io_completions() at the start of a later tick.
+    """
+    __slots__ = ('owner', 'future', 'generation', 'on_done', 'label', 'wake')
+
+    def __init__(self, owner, future, generation, on_done=None, label='', wake=None):
+        self.owner = owner
+        self.future = future
+        self.generation = generation
+        self.on_done = on_done
+        self.label = label
+        self.wake = wake  # node_id to post_wake() when finished
+
+    def done(self):
+        return self.future.done()
+
+    def cancel(self):
+        self.future.cancel()
+
+    def take(self):
+        """(True, value) / (False, exception) once finished, None while pending or cancelled."""
+        if not self.future.done() or self.future.cancelled():
+            return None
+        if self.generation != self.owner.run_generation():
+            return None  # RUN이 재시작된 뒤 도착한 이전 실행의 결과는 버림
+        exc = self.future.exception()
+        if exc is not None:
+            return (False, exc)
+        return (True, self.future.result())
+
+
+class EngineIOLoop:
+    """asyncio loop on a daemon thread, owned by the engine.
+
+    Coroutine functions run directly on the loop; plain (blocking) callables such as
+    urllib calls run in a small executor and are awaited from the loop. Every request
+    gets an asyncio.wait_for timeout, and cancel_all() drops everything in flight when
+    RUN stops.
+
+    The loop is also where wake sources live (event-driven runner): one-shot socket
+    readers (watch_readable) and cheap periodic probes (add_probe) that call
+    engine.post_wake(node_id) instead of the node polling every tick.
+
+    This module does not import core.engine (it is imported by it); the engine wires
+    its run state and post_wake()/write_log() into the hooks below at import time.
+    """
+    def __init__(self, max_workers=8, default_timeout=3.0):
+        self.max_workers = max(1, int(max_workers))
+        self.default_timeout = float(default_timeout)
+        self._loop = None
+        self._thread = None
+        self._executor = None
+        self._start_lock = threading.Lock()
+        self._pending = set()
+        self._completed = deque()
+        self._watched = {}   # fd -> node_id (armed one-shot readers)
+        self._probes = {}    # key -> asyncio.TimerHandle
+        self.probe_interval = max(0.001, float(ASYNC_IO_CONFIG.get('probe_interval_ms', 5.0)) / 1000.0)
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'timeouts': 0, 'cancelled': 0}
+        self._stats_lock = threading.Lock()   # submit()은 엔진/워커 스레드, 완료 카운트는 루프 스레드
+        # engine 훅 (core.engine이 설정)
+        self.log_fn = print
+        self.post_wake = None
+        self.run_generation = lambda: 0
+        self.is_running = lambda: True
+        self.has_node = lambda node_id: True
+
+    def _ensure_started(self):
+        if self._loop is not None and self._thread is not None and self._thread.is_alive():
+            return self._loop
+        with self._start_lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="engine-io")
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._run_loop, name="EngineIOLoop", daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _run(self, fn, args, timeout):
+        if asyncio.iscoroutinefunction(fn):
+            coro = fn(*args)
+        else:
+            loop = asyncio.get_running_loop()
+            coro = loop.run_in_executor(self._executor, functools.partial(fn, *args))
+        return await asyncio.wait_for(coro, timeout=timeout)
+
+    def submit(self, fn, *args, timeout=None, on_done=None, label='', wake=None):
+        loop = self._ensure_started()
+        timeout = self.default_timeout if timeout is None else max(0.05, float(timeout))
+        future = asyncio.run_coroutine_threadsafe(self._run(fn, args, timeout), loop)
+        req = IORequest(self, future, self.run_generation(), on_done, label or getattr(fn, '__name__', 'io'), wake)
+        self._pending.add(req)
+        with self._stats_lock:
+            self.stats['submitted'] += 1
+        future.add_done_callback(lambda _f, r=req: self._on_finished(r))
+        return req
+
+    def _on_finished(self, req):
+        self._pending.discard(req)
+        fut = req.future
+        if fut.cancelled():
+            key = 'cancelled'
+        else:
+            exc = fut.exception()
+            if exc is None:
+                key = 'completed'
+            elif isinstance(exc, asyncio.TimeoutError):
+                key = 'timeouts'
+            else:
+                key = 'failed'
+        with self._stats_lock:
+            self.stats[key] += 1
+        if key == 'cancelled':
+            return
+        if req.on_done is not None:
+            self._completed.append(req)
+        if req.wake is not None and self.post_wake is not None:
+            self.post_wake(req.wake)
+
+    def drain_completions(self):
+        """Run on_done callbacks of finished requests (engine thread, once per tick)."""
+        while self._completed:
+            req = self._completed.popleft()
+            result = req.take()
+            if result is None:
+                continue
+            try:
+                req.on_done(*result)
+            except Exception as e:
+                self.log_fn(f"[Engine IO] callback error ({req.label}): {e}")
+
+    def cancel_all(self):
+        pending = list(self._pending)
+        for req in pending:
+            req.cancel()
+        self._completed.clear()
+        return len(pending)
+
+    def pending_count(self):
+        return len(self._pending)
+
+    # ---- wake sources ----
+    def watch_readable(self, fileobj, node_id):
+        """post_wake(node_id) once when fileobj becomes readable; re-arm after draining it."""
+        try:
+            fd = fileobj.fileno()
+        except (AttributeError, OSError, ValueError):
+            return
+        if fd < 0 or self._watched.get(fd) == node_id:
+            return
+        self._watched[fd] = node_id
+        self._ensure_started().call_soon_threadsafe(self._arm_reader, fd, node_id)
+
+    def unwatch(self, fileobj):
+        """Call before closing a watched socket."""
+        try:
+            fd = fileobj.fileno()
+        except (AttributeError, OSError, ValueError):
+            return
+        if self._watched.pop(fd, None) is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.remove_reader, fd)
+
+    def _arm_reader(self, fd, node_id):
+        try:
+            self._loop.add_reader(fd, self._on_readable, fd, node_id)
+        except (ValueError, OSError):
+            # 닫힌 소켓의 fd 번호가 재사용된 경우: 남아 있던 등록을 지우고 다시 시도
+            try:
+                self._loop.remove_reader(fd)
+                self._loop.add_reader(fd, self._on_readable, fd, node_id)
+            except (ValueError, OSError):
+                self._watched.pop(fd, None)
+
+    def _on_readable(self, fd, node_id):
+        self._loop.remove_reader(fd)
+        self._watched.pop(fd, None)
+        if self.post_wake is not None:
+            self.post_wake(node_id)
+
+    def add_probe(self, node_id, fn):
+        """Call fn() on the loop every probe_interval; post_wake(node_id) when it returns True.
+
+        fn must be cheap and non-blocking (os.stat, a counter compare). The probe
+        removes itself once node_id is no longer in node_registry.
+        """
+        if node_id in self._probes:
+            return
+        loop = self._ensure_started()
+        self._probes[node_id] = None
+        loop.call_soon_threadsafe(self._run_probe, node_id, fn)
+
+    def remove_probe(self, node_id):
+        handle = self._probes.pop(node_id, None)
+        if handle is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(handle.cancel)
+
+    def _run_probe(self, node_id, fn):
+        if node_id not in self._probes:
+            return
+        if not self.has_node(node_id):
+            self._probes.pop(node_id, None)
+            return
+        try:
+            if self.is_running() and fn() and self.post_wake is not None:
+                self.post_wake(node_id)
+        except Exception:
+            pass
+        self._probes[node_id] = self._loop.call_later(self.probe_interval, self._run_probe, node_id, fn)
+
+
+engine_io = EngineIOLoop(
+    max_workers=ASYNC_IO_CONFIG.get('max_workers', 8),
+    default_timeout=ASYNC_IO_CONFIG.get('default_timeout_sec', 3.0),
+)
+
+
+def submit_io(fn, *args, timeout=None, on_done=None, label='', wake=None):
+    return engine_io.submit(fn, *args, timeout=timeout, on_done=on_done, label=label, wake=wake)
+
+
+def drain_io_completions():
+    engine_io.drain_completions()
+
+
+def cancel_all_io():
+    count = engine_io.cancel_all()
+    if count:
+        engine_io.log_fn(f"[Engine IO] cancelled {count} pending request(s)")
+    return count
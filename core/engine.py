@@ -1,21 +1,34 @@
 import os
+import threading
+import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from enum import Enum, auto
 
-class HwStatus(Enum):
-    OFFLINE = auto()
-    ONLINE = auto()
-    SIMULATION = auto()
-
-class PortType(Enum):
-    FLOW = auto()
-    DATA = auto()
+from core.engine_config import PARALLEL_CONFIG, PRIORITY_CONFIG
+from core.engine_types import HwStatus, PortType, ExecRole, FlowVisit, Priority  # 노드 모듈은 core.engine에서 import
+from core.profiler import node_profiler
+from core.async_io import engine_io  # engine 상태는 아래에서 훅으로 연결
+from core.watchdog import tick_watchdog
+from core.timers import engine_timers
+from core.quarantine import node_quarantine
+from core.frames import Frame
+from core.graph_compiler import compile_graph
 
 node_registry = {}
 link_registry = {}
+# Incremental link indexes kept in sync by add_link/remove_link/clear_links.
+#   link_out_index: out-port -> {link_id: dst_node_id}
+#   link_in_index:  in-port  -> {link_id: (src_node_id, out-port)}
+link_out_index = {}
+link_in_index = {}
 is_running = False
 run_generation = 0  # RUN 버튼 누를 때마다 증가 → RECV 재시작 감지용
+# Held by the engine thread for a whole tick and by the GUI while it mutates the
+# registries or syncs widget values into node.state.
+graph_lock = threading.RLock()
+# Bumped on every node/link add/remove; cached tick plans are rebuilt when it changes.
+graph_version = 0
 SAVE_DIR = "Node_Files"
 if not os.path.exists(SAVE_DIR): 
     os.makedirs(SAVE_DIR)
@@ -43,6 +56,57 @@ def generate_uuid():
         if uid not in node_registry and uid not in link_registry:
             return uid
 
+def mark_graph_changed():
+    global graph_version
+    graph_version += 1
+
+def register_node(node):
+    node_registry[node.node_id] = node
+    mark_graph_changed()
+    return node
+
+def unregister_node(node_id):
+    node = node_registry.pop(node_id, None)
+    mark_graph_changed()
+    return node
+
+def clear_nodes():
+    node_registry.clear()
+    mark_graph_changed()
+
+def add_link(lid, src, dst, src_node_id, dst_node_id):
+    mark_graph_changed()
+    link_registry[lid] = {'source': src, 'target': dst, 'src_node_id': src_node_id, 'dst_node_id': dst_node_id}
+    link_out_index.setdefault(src, {})[lid] = dst_node_id
+    link_in_index.setdefault(dst, {})[lid] = (src_node_id, src)
+    return lid
+
+def remove_link(lid):
+    link = link_registry.pop(lid, None)
+    if link is None:
+        return None
+    mark_graph_changed()
+    for index, port in ((link_out_index, link['source']), (link_in_index, link['target'])):
+        entries = index.get(port)
+        if entries is not None:
+            entries.pop(lid, None)
+            if not entries:
+                del index[port]
+    return link
+
+def clear_links():
+    mark_graph_changed()
+    link_registry.clear()
+    link_out_index.clear()
+    link_in_index.clear()
+
+def get_link_source(input_attr_id):
+    """Return (src_node_id, out-port) of the first link into input_attr_id, or None."""
+    entries = link_in_index.get(input_attr_id)
+    if not entries:
+        return None
+    return next(iter(entries.values()))
+
 def write_log(msg):
     timestamp = datetime.now().strftime("%H:%M:%S")
     line = f"[{timestamp}] {msg}"
@@ -54,91 +118,494 @@ def write_log(msg):
     # except Exception:
     #     pass
 
-def execute_graph_once():
-    start_node = next((n for n in node_registry.values() if n.type_str == "START"), None)
+tick_watchdog.log_fn = write_log
+node_quarantine.log_fn = write_log
+# 백그라운드(강등) 실행의 예외/성공도 같은 격리 카운터로
+tick_watchdog.on_error = node_quarantine.report
+tick_watchdog.on_success = node_quarantine.success
+tick_watchdog.is_live = lambda node: node_registry.get(node.node_id) is node
+_perf_counter = time.perf_counter
 
-    def _parse_flow_out(result):
-        if result is None:
+# ================= [Pure node memoization] =================
+memo_stats = {'skipped': 0, 'executed': 0}
+_memo_stats_lock = threading.Lock()   # 워커 스레드(병렬 컴포넌트)에서도 증가
+_SCALAR_TYPES = (int, float, str, bool, type(None))
+
+def _value_sig(value):
+    # 스칼라(및 스칼라 튜플)는 값으로 비교. 그 외(list/dict/ndarray 등)는 제자리 변경을
+    # 감지할 수 없으므로 매번 새 객체를 반환해 항상 "변경됨"으로 처리한다.
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, tuple) and all(isinstance(v, _SCALAR_TYPES) for v in value):
+        return value
+    if isinstance(value, Frame):
+        return ('frame', value.seq)  # 같은 Frame을 다시 내보내면 변경 없음
+    return object()
+
+def node_output_version(node):
+    """Version counter of node.output_data, bumped lazily when its value signature changes."""
+    sig = tuple((k, _value_sig(v)) for k, v in node.output_data.items())
+    if sig != node._out_sig:
+        node._out_sig = sig
+        node.output_version += 1
+    return node.output_version
+
+def _settings_sig(state):
+    try:
+        return frozenset(state.items())
+    except TypeError:
+        return repr(sorted(state.items(), key=lambda kv: str(kv[0])))
+
+def _memo_key(node):
+    parts = []
+    for port, ptype in node.inputs.items():
+        if ptype != PortType.DATA:
+            continue
+        src = get_link_source(port)
+        src_node = node_registry.get(src[0]) if src else None
+        parts.append((src[0], node_output_version(src_node)) if src_node is not None else None)
+    # 출력 포트에 링크가 새로 연결되면 건너뛰던 출력을 계산하도록 다시 실행
+    return (tuple(parts), _settings_sig(node.state), node.demanded_outputs)
+
+def _exec_node(node):
+    """node.execute() with per-node timing (core.profiler). Exceptions still propagate
+    (callers hand them to node_quarantine.report()).
+
+    PURE nodes whose inputs/settings are unchanged since the last run are skipped, and
+    quarantined nodes (core/quarantine.py) are skipped until their retry time.
+    """
+    if node.node_id in node_quarantine.failing:
+        if node_quarantine.blocked(node.node_id):
+            return None
+        result = _exec_node_memo(node)
+        node_quarantine.success(node)
+        return result
+    return _exec_node_memo(node)
+
+def _exec_node_memo(node):
+    if node.PURE:
+        key = _memo_key(node)
+        if key == node._memo_key and node.memo_ready():
+            with _memo_stats_lock:
+                memo_stats['skipped'] += 1
             return None
-        if isinstance(result, (int, str)):
-            return result
-        if isinstance(result, dict):
-            return next((k for k, v in result.items() if v == PortType.FLOW), None)
+        node._memo_key = None  # execute()가 예외로 끝나면 다음 틱에 다시 실행
+        with _memo_stats_lock:
+            memo_stats['executed'] += 1
+        result = _exec_node_timed(node)
+        node._memo_key = key
+        return result
+    return _exec_node_timed(node)
+
+def _is_demotable(node):
+    # 매 틱 실행되는 SOURCE/DATA 노드만 백그라운드로 내릴 수 있다. FLOW/POLL 노드는 Flow 순서가
+    # 바뀌면 안 되고, SAFETY_CRITICAL(드라이버)은 항상 틱 주기대로 실행되어야 한다.
+    # 자기 러너 스레드에서 도는 주기 그룹 노드는 이미 control 틱과 분리되어 있으므로 제외.
+    if rate_group_runners_active and node.node_id in _grouped_node_ids:
+        return False
+    return ((node.EXEC_ROLE == ExecRole.DATA or node.EXEC_ROLE == ExecRole.SOURCE)
+            and not node.SAFETY_CRITICAL and node.PRIORITY is not Priority.SAFETY)
+
+def _exec_node_timed(node):
+    watch = tick_watchdog.enabled and _is_demotable(node)
+    if not node_profiler.enabled and not watch:
+        return node.execute()
+    t0 = _perf_counter()
+    try:
+        return node.execute()
+    finally:
+        dt = _perf_counter() - t0
+        if node_profiler.enabled:
+            node_profiler.record(node, dt)
+        if watch:
+            tick_watchdog.observe(node, dt)
+
+# ================= [Execution plan (core/graph_compiler.py)] =================
+_tick_plan = None
+_grouped_node_ids = frozenset()
+_gated_components = frozenset()  # component indexes that contain TIMER_GATED nodes
+_safety_components = frozenset()  # component indexes that contain Priority.SAFETY nodes
+_reported_plan_version = None
+
+def _report_plan(plan, force=False):
+    global _reported_plan_version
+    if not force and _reported_plan_version == plan.version:
+        return
+    _reported_plan_version = plan.version
+    for msg in plan.errors:
+        write_log(f"[Compile] ERROR {msg}")
+    for msg in plan.warnings:
+        write_log(f"[Compile] {msg}")
+
+def compile_plan():
+    """Compile the current graph now (RUN). Returns the ExecutionPlan; check plan.ok."""
+    with graph_lock:
+        plan = _set_tick_plan(compile_graph(node_registry, link_registry, graph_version))
+    _report_plan(plan, force=True)
+    return plan
+
+def _set_tick_plan(plan):
+    global _tick_plan, _grouped_node_ids, _gated_components, _safety_components
+    _grouped_node_ids = frozenset(n.node_id for nodes in plan.rate_groups.values() for n in nodes)
+    _gated_components = frozenset(i for i, comp in enumerate(plan.components) if any(n.TIMER_GATED for n in comp))
+    _safety_components = frozenset(plan.component_of[nid] for nid, n in node_registry.items()
+                                   if n.PRIORITY is Priority.SAFETY and nid in plan.component_of) if _priority_on else frozenset()
+    _tick_plan = plan
+    demanded = plan.demanded
+    for nid, node in node_registry.items():
+        node.demanded_outputs = demanded.get(nid, frozenset())
+    live_ids = set(node_registry)
+    tick_watchdog.forget(live_ids)
+    engine_timers.forget(live_ids)
+    node_quarantine.forget(live_ids)
+    return plan
+
+def get_tick_plan():
+    """Plan for the current graph_version; recompiled only after the graph changed.
+
+    Edits made while RUN is on are compiled here and their issues logged once; the
+    plan is still used (MAX_STEPS stays as the backstop for flow cycles).
+    """
+    global _tick_plan
+    plan = _tick_plan
+    if plan is None or plan.version != graph_version:
+        with graph_lock:
+            if _tick_plan is None or _tick_plan.version != graph_version:
+                _set_tick_plan(compile_graph(node_registry, link_registry, graph_version))
+            plan = _tick_plan
+        if is_running:
+            _report_plan(plan)
+    return plan
+
+# Per-tick flow activations dropped or coalesced by ONCE/MERGE nodes.
+flow_visit_stats = {'last_tick_avoided': 0, 'avoided': 0, 'merged_runs': 0}
+
+# ================= [Worker pool for independent components] =================
+_worker_pool = None
+
+def _get_worker_pool():
+    global _worker_pool
+    workers = int(PARALLEL_CONFIG.get('workers', 0))
+    if workers <= 1:
         return None
+    if _worker_pool is None:
+        _worker_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="engine-worker")
+    return _worker_pool
 
-    def _enqueue_targets_by_out(out_id, queue):
-        if not out_id:
-            return
-        for link in link_registry.values():
-            if link.get('source') == out_id:
-                dst_node_id = link.get('dst_node_id')
-                if dst_node_id in node_registry:
-                    queue.append(node_registry[dst_node_id])
+def shutdown_worker_pool():
+    global _worker_pool
+    if _worker_pool is not None:
+        _worker_pool.shutdown(wait=False)
+        _worker_pool = None
+
+def _parse_flow_out(result):
+    if result is None:
+        return None
+    if isinstance(result, (int, str)):
+        return result
+    if isinstance(result, dict):
+        return next((k for k, v in result.items() if v == PortType.FLOW), None)
+    return None
+
+def _run_component(plan, tick_nodes, seeds):
+    """Per-tick nodes of one component, then its flow chain.
+
+    seeds: nodes reached by START's flow pulse in this component.
+    Components never share nodes, so the visit bookkeeping here is per tick.
+    Returns (avoided activations, merged runs).
+    """
+    done = set()          # ONCE/MERGE nodes that already ran this tick
+    merge_pending = {}    # node_id -> [node, flow triggers]
+    avoided = 0
+    merged_runs = 0
+    queue = deque()
+    urgent = deque()      # Priority.SAFETY nodes reached by a pulse run before anything queued
+
+    def push(targets):
+        for target in targets:
+            if target.PRIORITY is Priority.SAFETY and _priority_on:
+                urgent.append(target)
+            else:
+                queue.append(target)
 
     preexec_flow_outs = []
-    for node in node_registry.values():
-        # LOGIC_LOOP must not auto-start. Only poll active loops in pre-exec.
-        if node.type_str == "LOGIC_LOOP":
-            if not getattr(node, 'is_active', False):
+    for node in tick_nodes:
+        # POLL (LOGIC_LOOP, *_MISSION_RECV): the returned flow out is propagated below.
+        # LOGIC_LOOP must not auto-start, so it only polls while active (should_poll()).
+        if node.EXEC_ROLE == ExecRole.POLL:
+            if not node.should_poll():
                 continue
             try:
-                res = node.execute()
-                out_id = _parse_flow_out(res)
+                out_id = _parse_flow_out(_exec_node(node))
                 if out_id:
                     preexec_flow_outs.append(out_id)
             except Exception as e:
-                print(f"[{node.label}] Error: {e}")
+                node_quarantine.report(node, e)
             continue
 
-        # GO1_MISSION_RECV polls for new missions and must propagate flow when one arrives.
-        # Running it without capturing the result (like the block below) would consume the
-        # one-shot pulse, leaving nothing for the main flow chain. Treat it like LOGIC_LOOP.
-        if node.type_str == "GO1_MISSION_RECV":
-            try:
-                res = node.execute()
-                out_id = _parse_flow_out(res)
-                if out_id:
-                    preexec_flow_outs.append(out_id)
-            except Exception as e:
-                print(f"[{node.label}] Error: {e}")
+        # 워치독이 백그라운드로 내린 노드는 인라인 실행 대신 백그라운드 실행만 요청(최신 결과 사용)
+        if tick_watchdog.is_demoted(node.node_id):
+            if not node_quarantine.blocked(node.node_id):
+                tick_watchdog.kick(node)
             continue
 
-        if node.type_str == "EP01_MISSION_RECV":
-            try:
-                res = node.execute()
-                out_id = _parse_flow_out(res)
-                if out_id:
-                    preexec_flow_outs.append(out_id)
-            except Exception as e:
-                print(f"[{node.label}] Error: {e}")
+        visit = node.FLOW_VISIT
+        if visit is FlowVisit.MERGE:
+            merge_pending[node.node_id] = [node, 0]
             continue
+        if visit is FlowVisit.ONCE:
+            done.add(node.node_id)
 
-        if node.type_str in ["COND_KEY", "MT4_DRIVER", "GO1_DRIVER", "EP_DRIVER", "TELLO_DRIVER", "VIDEO_SRC", "VIS_FISHEYE", "VIS_DEPTH_DA2", "VIS_ARUCO", "VIS_FLASK", "MT4_UNITY", "GO1_UNITY", "GO1_UNITY_KEYBOARD", "GO1_UNITY_AUTO", "GO1_SERVER_JSON_RECV", "EP_SERVER_JSON_RECV", "UDP_RECV", "LOGGER", "CONSTANT", "MT4_SAG", "MT4_CALIB", "MT4_TOOLTIP", "MT4_BACKLASH", "MT4_KEYBOARD", "GO1_KEYBOARD", "EP_KEYBOARD", "TELLO_KEYBOARD", "TELLO_ACTION", "EP_CAM_SRC", "EP_CAM_STREAM"]:
-            try:
-                node.execute()
-            except Exception as e:
-                print(f"[{node.label}] Error: {e}")
-
-    if not start_node and not preexec_flow_outs:
-        return
+        try:
+            _exec_node(node)
+        except Exception as e:
+            node_quarantine.report(node, e)
 
-    queue = []
-    if start_node:
-        _enqueue_targets_by_out(start_node.execute(), queue)
+    flow_targets = plan.flow_targets
+    push(seeds)
     for out_id in preexec_flow_outs:
-        _enqueue_targets_by_out(out_id, queue)
+        push(flow_targets.get(out_id, ()))
 
     steps = 0
     MAX_STEPS = 300
-    while queue and steps < MAX_STEPS:
-        current_node = queue.pop(0)
+    while steps < MAX_STEPS:
+        if not queue and not urgent:
+            if not merge_pending:
+                break
+            # Flow 큐가 비었으면 모아 둔 MERGE 노드를 각각 1회 실행
+            pending = list(merge_pending.values())
+            merge_pending.clear()
+            for node, triggers in pending:
+                done.add(node.node_id)
+                node.flow_triggers = triggers
+                merged_runs += 1
+                try:
+                    result = _exec_node(node)
+                except Exception as e:
+                    node_quarantine.report(node, e)
+                    continue
+                if triggers:
+                    # 틱 실행만 있었던 경우는 기존처럼 Flow 출력을 전파하지 않음
+                    push(flow_targets.get(_parse_flow_out(result), ()))
+            steps += len(pending)
+            continue
+
+        current_node = urgent.popleft() if urgent else queue.popleft()
+        visit = current_node.FLOW_VISIT
+        if visit is not FlowVisit.PER_TRIGGER:
+            nid = current_node.node_id
+            if nid in done:
+                avoided += 1
+                continue
+            if visit is FlowVisit.MERGE:
+                entry = merge_pending.get(nid)
+                if entry is None:
+                    merge_pending[nid] = [current_node, 1]
+                else:
+                    entry[1] += 1
+                    avoided += 1
+                continue
+            done.add(nid)
+
         try:
-            result = current_node.execute()
+            result = _exec_node(current_node)
         except Exception as e:
-            print(f"[{current_node.label}] Error: {e}")
+            node_quarantine.report(current_node, e)
             steps += 1
             continue
 
         next_out_id = _parse_flow_out(result)
-        _enqueue_targets_by_out(next_out_id, queue)
+        if next_out_id:
+            push(flow_targets.get(next_out_id, ()))
         steps += 1
+    return avoided, merged_runs
+
+# ================= [Priority lane] =================
+# Priority.SAFETY tick nodes (plan.priority_lane) run on the engine thread before START,
+# the components and inline rate groups, so a stop decision is never queued behind
+# vision or logging work: input -> driver command latency is bounded by one tick period
+# plus the lane time (priority.lane_budget_ms).
+_priority_on = bool(PRIORITY_CONFIG.get('enabled', True))
+_lane_budget_sec = float(PRIORITY_CONFIG.get('lane_budget_ms', 2.0)) / 1000.0
+priority_stats = {'last_lane_ms': 0.0, 'max_lane_ms': 0.0, 'over_budget': 0}
+
+def _run_priority_lane(lane, affected, now):
+    t0 = _perf_counter()
+    for node in lane:
+        if affected is not None and node.node_id not in affected:
+            continue
+        if node.TIMER_GATED and not engine_timers.due(node.node_id, now):
+            continue
+        try:
+            _exec_node(node)
+        except Exception as e:
+            node_quarantine.report(node, e)
+    dt = _perf_counter() - t0
+    priority_stats['last_lane_ms'] = dt * 1000.0
+    if dt * 1000.0 > priority_stats['max_lane_ms']:
+        priority_stats['max_lane_ms'] = dt * 1000.0
+    if dt > _lane_budget_sec:
+        priority_stats['over_budget'] += 1
+
+def execute_graph_once(woken=None):
+    """One tick. woken: node_ids from post_wake(); if given, only those nodes and
+    their downstream closure run (wake tick) instead of the whole graph."""
+    # 이전 틱 이후 완료된 비동기 I/O 콜백(on_done)을 엔진 스레드에서 먼저 반영
+    engine_io.drain_completions()
+    if tick_watchdog.generation != run_generation:
+        tick_watchdog.reset(run_generation)  # RUN을 새로 시작하면 강등 상태 초기화
+    if engine_timers.generation != run_generation:
+        engine_timers.reset(run_generation)  # 이전 RUN에서 걸어 둔 타이머는 버림
+    if node_quarantine.generation != run_generation:
+        node_quarantine.reset(run_generation)  # RUN을 새로 시작하면 격리 해제 (사용자가 고쳤을 수 있음)
+
+    plan = get_tick_plan()
+    start_node = plan.start
+    components = plan.components
+    affected = plan.affected_by(woken) if woken is not None else None
+    now = time.monotonic()
+    if plan.priority_lane:
+        _run_priority_lane(plan.priority_lane, affected, now)
+
+    seeds = [[] for _ in components]
+    # 웨이크 틱에서는 영향받는 노드로 이어지는 경우에만 START를 실행
+    if start_node and (affected is None or any(
+            n.node_id in affected for out in start_node.outputs for n in plan.flow_targets.get(out, ()))):
+        out_id = _parse_flow_out(_exec_node(start_node))
+        for node in plan.flow_targets.get(out_id, ()):
+            if affected is None or node.node_id in affected:
+                seeds[plan.component_of[node.node_id]].append(node)
+
+    # 그룹 러너 스레드가 없으면(GUI 틱 모드 등) 다른 주기 그룹 노드도 이 틱에서 실행.
+    # 우선 레인이 켜져 있으면 control 컴포넌트 뒤에 실행해(그룹 러너와 같은 최신 값 전달)
+    # Flow로 실행되는 SAFETY 노드가 비전 작업 뒤에 밀리지 않게 함
+    inline_groups = affected is None and not rate_group_runners_active and plan.rate_groups
+    if inline_groups and not _priority_on:
+        for nodes in plan.rate_groups.values():
+            _run_group_nodes(nodes)
+
+    # 타이머 대기 중인 노드(TIMER_GATED)는 마감 전까지 execute()를 부르지 않고, 모두 대기 중인
+    # 컴포넌트는 워커 풀에 넘기지도 않음 (core/timers.py)
+    gated = _gated_components
+    jobs = []
+    for i, comp in enumerate(components):
+        tick_nodes = comp if affected is None else [n for n in comp if n.node_id in affected]
+        if i in gated:
+            tick_nodes = [n for n in tick_nodes if not n.TIMER_GATED or engine_timers.due(n.node_id, now)]
+        if tick_nodes or seeds[i]:
+            if i in _safety_components:
+                jobs.insert(0, (tick_nodes, seeds[i]))  # 엔진 스레드에서 가장 먼저 실행
+            else:
+                jobs.append((tick_nodes, seeds[i]))
+    pool = _get_worker_pool() if len(jobs) > 1 else None
+    if pool is None:
+        results = [_run_component(plan, tick_nodes, comp_seeds) for tick_nodes, comp_seeds in jobs]
+    else:
+        futures = [pool.submit(_run_component, plan, tick_nodes, comp_seeds) for tick_nodes, comp_seeds in jobs[1:]]
+        results = [_run_component(plan, *jobs[0])] if jobs else []  # 첫 컴포넌트는 엔진 스레드에서 직접 실행
+        for fut in futures:
+            try:
+                results.append(fut.result())
+            except Exception as e:
+                write_log(f"[Engine] component error: {type(e).__name__}: {e}")
+
+    if inline_groups and _priority_on:
+        for nodes in plan.rate_groups.values():
+            _run_group_nodes(nodes)
+
+    avoided = sum(r[0] for r in results)
+    flow_visit_stats['last_tick_avoided'] = avoided
+    flow_visit_stats['avoided'] += avoided
+    flow_visit_stats['merged_runs'] += sum(r[1] for r in results)
+
+def run_tick():
+    """One engine tick under graph_lock. No-op while RUN is off."""
+    if not is_running:
+        return False
+    with graph_lock:
+        execute_graph_once()
+    return True
+
+# ================= [Rate groups] =================
+# Non-default rate groups (vision, telemetry, ...) are ticked by their own runner threads
+# (core.engine_runner). Values cross groups as the latest output_data a node published:
+# readers never wait, and a group that is still busy simply skips its next slot.
+rate_group_runners_active = False
+
+def _run_group_nodes(nodes, plan=None):
+    for node in nodes:
+        # 러너 스레드(plan 지정)는 graph_lock 없이 돌므로 노드마다 그래프 변경 여부를 확인:
+        # 편집 중 삭제된 노드나 이전 plan의 노드는 실행하지 않고 다음 틱에 새 plan으로 진행
+        if plan is not None and (plan.version != graph_version or node_registry.get(node.node_id) is not node):
+            return
+        if node.TIMER_GATED and not engine_timers.due(node.node_id):
+            continue
+        if tick_watchdog.is_demoted(node.node_id):
+            if not node_quarantine.blocked(node.node_id):
+                tick_watchdog.kick(node)
+            continue
+        try:
+            _exec_node(node)
+        except Exception as e:
+            node_quarantine.report(node, e)
+
+def run_group_tick(name):
+    """One tick of rate group `name` on its own thread.
+
+    graph_lock is not held while the nodes run (same contract as watchdog background
+    execution), so a slow vision group never delays the control tick. Instead each node
+    is checked against the registry and graph_version right before it runs, and the
+    rest of the group is skipped once the GUI has edited the graph.
+    """
+    if not is_running:
+        return False
+    plan = get_tick_plan()
+    nodes = plan.rate_groups.get(name)
+    if not nodes:
+        return False
+    _run_group_nodes(nodes, plan)
+    return True
+
+# ================= [Wake events: event-driven ticks] =================
+# Sources (UDP socket readable, key edge, HTTP result, new frame) call post_wake(node_id)
+# from any thread. In event-driven runner mode the engine then runs only the woken nodes
+# and their downstream closure right away; a heartbeat full tick keeps drivers alive.
+wake_event = threading.Event()
+_wake_lock = threading.Lock()
+_wake_pending = set()
+wake_stats = {'posted': 0, 'wake_ticks': 0, 'woken_nodes': 0}
+
+def post_wake(node_id):
+    engine_timers.expire(node_id)  # 타이머 대기 중인 노드도 다음 틱에 바로 실행
+    with _wake_lock:
+        _wake_pending.add(node_id)
+        wake_stats['posted'] += 1
+    wake_event.set()
+
+# core.async_io는 engine을 import하지 않으므로 RUN 상태와 웨이크/로그 함수를 여기서 연결
+engine_io.log_fn = write_log
+engine_io.post_wake = post_wake
+engine_io.run_generation = lambda: run_generation
+engine_io.is_running = lambda: is_running
+engine_io.has_node = lambda node_id: node_id in node_registry
+
+def take_wakes():
+    """Pending woken node_ids (cleared). Called by the runner thread only."""
+    global _wake_pending
+    with _wake_lock:
+        woken, _wake_pending = _wake_pending, set()
+        wake_event.clear()
+    return woken
+
+def run_wake_tick(woken):
+    """Partial tick for woken nodes under graph_lock. No-op while RUN is off."""
+    if not is_running:
+        return False
+    with graph_lock:
+        woken = {nid for nid in woken if nid in node_registry}
+        if not woken:
+            return False
+        execute_graph_once(woken)
+    wake_stats['wake_ticks'] += 1
+    wake_stats['woken_nodes'] += len(woken)
+    return True
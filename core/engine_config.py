@@ -0,0 +1,130 @@
+import copy
+import json
+import os
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CONFIG_DIR = os.path.join(BASE_DIR, 'nodes', 'engine_config')
+
+# ================= [Engine Runner Config] =================
+ENGINE_CONFIG_DEFAULT = {
+    'runner': {
+        'mode': 'thread',          # 'thread': 전용 엔진 스레드 / 'gui': DPG 렌더 루프 안에서 틱 (기존 방식)
+        'tick_rate_hz': 50.0,
+        'jitter_window': 250,      # jitter 통계에 사용할 최근 틱 수
+        'stats_log_interval_sec': 10.0,  # headless 실행 시 통계 로그 주기
+        'event_driven': False,     # True: 소스 웨이크 이벤트 때만 영향받는 하위 그래프 실행 + heartbeat 전체 틱
+        'heartbeat_hz': 20.0,      # event_driven일 때 전체 틱 주기 (드라이버 keepalive)
+        'min_wake_interval_ms': 2.0,  # 웨이크 틱 최소 간격 (패킷 버스트를 한 틱으로 합침)
+    },
+    'parallel': {
+        'workers': 4,              # 독립 컴포넌트 병렬 실행 스레드 수 (0/1 = 직렬 실행). 같은 COMPONENT_GROUP 노드는 한 컴포넌트
+    },
+    'async_io': {
+        'max_workers': 8,          # 블로킹 I/O(urllib 등)를 대신 실행할 스레드 수
+        'default_timeout_sec': 3.0,
+        'probe_interval_ms': 5.0,  # 웨이크 프로브(폴더 mtime 등) 검사 주기
+    },
+    'rate_groups': {
+        # default 그룹(control)은 엔진 러너 틱(runner.tick_rate_hz, Flow 포함)에서 실행되고,
+        # groups의 그룹은 각자 전용 스레드에서 자기 주기(Hz)로 실행된다 (그룹 간 데이터는 최신 값 전달).
+        'default': 'control',
+        'groups': {'vision': 15.0, 'telemetry': 1.0},
+        'assign': {},              # 노드 타입별 그룹 지정 (예: {"VIS_ARUCO": "control"}), 클래스 기본값보다 우선
+    },
+    'priority': {
+        # Priority.SAFETY 노드(E-STOP/회피 판단/키보드/드라이버)를 매 틱 가장 먼저 실행하는 전용 레인
+        'enabled': True,
+        'lane_budget_ms': 2.0,     # 레인 실행 시간 상한 (입력 → 드라이버 명령 지연 = 틱 주기 + 이 값)
+    },
+    'watchdog': {
+        'enabled': True,
+        'node_slice_ms': 10.0,     # 노드 1회 실행 허용 시간 (기본 틱 20 ms의 절반)
+        'strikes_to_demote': 5,    # 초과 누적 횟수 (예산 내 실행마다 1씩 감소)
+        'promote_after': 50,       # 백그라운드에서 연속 예산 내 실행 시 인라인 복귀
+        'background_workers': 2,
+        'log_interval_sec': 5.0,   # 노드별 초과 로그 최소 간격
+    },
+    'quarantine': {
+        'enabled': True,           # False: 오류 집계/로그 제한만 하고 노드를 격리하지 않음
+        'failures_to_quarantine': 5,  # 연속 예외 횟수 → 격리
+        'backoff_initial_sec': 1.0,   # 격리 후 첫 재시도까지 대기 (재시도 실패마다 2배)
+        'backoff_max_sec': 60.0,
+        'log_interval_sec': 5.0,   # 같은 노드/같은 오류 메시지 로그 최소 간격
+    },
+    'frame_pool': {
+        'enabled': True,           # 비전 노드 출력/복사 버퍼 재사용 (core/frames.py, numpy 필요)
+        'max_buffers_per_shape': 8,  # (해상도, dtype)별 보관 버퍼 수 (초과분은 일회성 할당)
+    },
+    'derived_cache': {
+        'enabled': True,           # 프레임별 gray/RGB/축소본을 한 번만 계산해 비전 노드끼리 공유
+        'max_frames': 4,           # 파생 이미지를 보관할 최근 프레임(seq) 수, 더 새 프레임이 오면 오래된 것부터 제거
+    },
+    'decode_pool': {
+        'enabled': True,           # 카메라 JPEG를 도착 즉시 백그라운드 스레드에서 디코딩 (엔진 틱 밖)
+        'workers': 2,
+        'reduced_decode': True,    # 축소본만 쓰이면 IMREAD_REDUCED_COLOR_2/4/8로 작게 디코딩
+        'demand_ttl_sec': 2.0,     # 이 시간 안에 요청된 해상도만 미리 디코딩
+    },
+    'frame_bus': {
+        'enabled': True,           # 카메라 프레임을 공유 메모리 링으로 전달 (core/frame_bus.py), False = 기존 /dev/shm JPEG 파일
+        'name_prefix': 'pygui_',   # 공유 메모리 세그먼트 이름 접두사
+        'slots': 8,                # 링 슬롯 수 (읽는 쪽이 이만큼 뒤처지기 전까지 뷰가 유효)
+        'jpeg_slot_bytes': 1048576,  # JPEG 링 슬롯 크기 (Go1 카메라, VIS_SAVE 송신)
+        'raw_slot_bytes': 4194304,   # 이미지 링 슬롯 크기 (EP 카메라 BGR, 1280x720x3 = 2.7 MB)
+        'poll_sec': 0.005,         # 엔진 밖 리더(서버 송신기)의 latest seq 확인 주기
+    },
+    'slot_store': {
+        'enabled': True,           # 파일 핸드오프(frame_bus 꺼짐)일 때 프레임마다 새 파일 대신 고정 슬롯 파일 + latest.idx (core/slot_store.py)
+        'slots': 8,                # Go1 수신 폴더 슬롯 수 (VIS_SAVE는 Max Frames를 슬롯 수로 사용)
+        'poll_sec': 0.005,         # 엔진 밖 리더(서버 송신기)의 latest.idx 확인 주기
+    },
+    'profiler': {
+        'enabled': True,
+        'window': 256,             # 노드/타입별 p50/p95/max 계산에 쓰는 최근 실행 횟수
+    },
+}
+
+
+def _deep_merge(base, override):
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return copy.deepcopy(override)
+
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def _load_json_compatible_config(filename, default):
+    path = os.path.join(CONFIG_DIR, filename)
+    if not os.path.isfile(path):
+        return copy.deepcopy(default)
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            loaded = json.load(f)
+        if isinstance(loaded, dict):
+            return _deep_merge(default, loaded)
+    except Exception:
+        pass
+
+    return copy.deepcopy(default)
+
+
+ENGINE_CONFIG = _load_json_compatible_config('engine_config.yaml', ENGINE_CONFIG_DEFAULT)
+RUNNER_CONFIG = dict(ENGINE_CONFIG.get('runner', {}))
+PROFILER_CONFIG = dict(ENGINE_CONFIG.get('profiler', {}))
+PARALLEL_CONFIG = dict(ENGINE_CONFIG.get('parallel', {}))
+ASYNC_IO_CONFIG = dict(ENGINE_CONFIG.get('async_io', {}))
+WATCHDOG_CONFIG = dict(ENGINE_CONFIG.get('watchdog', {}))
+RATE_GROUP_CONFIG = dict(ENGINE_CONFIG.get('rate_groups', {}))
+PRIORITY_CONFIG = dict(ENGINE_CONFIG.get('priority', {}))
+QUARANTINE_CONFIG = dict(ENGINE_CONFIG.get('quarantine', {}))
+FRAME_POOL_CONFIG = dict(ENGINE_CONFIG.get('frame_pool', {}))
+DERIVED_CACHE_CONFIG = dict(ENGINE_CONFIG.get('derived_cache', {}))
+DECODE_POOL_CONFIG = dict(ENGINE_CONFIG.get('decode_pool', {}))
+FRAME_BUS_CONFIG = dict(ENGINE_CONFIG.get('frame_bus', {}))
+SLOT_STORE_CONFIG = dict(ENGINE_CONFIG.get('slot_store', {}))
@@ -0,0 +1,240 @@
+import functools
+import threading
+import time
+from collections import deque
+
+import core.engine as engine_module
+from core.engine import write_log
+from core.engine_config import RUNNER_CONFIG, RATE_GROUP_CONFIG
+
+
+class EngineRunner:
+    """Ticks the node graph on a dedicated thread at a fixed rate.
+
+    - Deadlines are absolute (start + k * period), so sleep error does not accumulate.
+    - A tick that starts more than one period late is counted as an overrun and the
+      schedule is re-anchored instead of bursting the missed ticks back to back.
+    - Works without DearPyGui; the GUI only reads snapshot().
+    - event_driven: instead of a full tick every period, sleep until a source calls
+      engine.post_wake() and run only the woken subgraph; a full heartbeat tick still
+      runs at heartbeat_hz. Wake ticks are spaced at least min_wake_interval_ms apart
+      so a packet burst coalesces into one tick.
+    """
+    def __init__(self, tick_fn=None, rate_hz=None, name="EngineRunner", event_driven=None, group=None):
+        self.tick_fn = tick_fn or engine_module.run_tick
+        self.wake_fn = engine_module.run_wake_tick
+        self.name = name
+        self.group = group
+        self._period = 1.0 / max(1.0, float(rate_hz or RUNNER_CONFIG.get('tick_rate_hz', 50.0)))
+        self.event_driven = bool(RUNNER_CONFIG.get('event_driven', False) if event_driven is None else event_driven)
+        self._heartbeat = 1.0 / max(0.1, float(RUNNER_CONFIG.get('heartbeat_hz', 20.0)))
+        self._min_wake_interval = max(0.0, float(RUNNER_CONFIG.get('min_wake_interval_ms', 2.0))) / 1000.0
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+        window = max(10, int(RUNNER_CONFIG.get('jitter_window', 250)))
+        self._jitter = deque(maxlen=window)
+        self._durations = deque(maxlen=window)
+        self.tick_count = 0
+        self.overrun_count = 0
+        self.skipped_ticks = 0
+        self.error_count = 0
+        self.heartbeat_count = 0
+        self.wake_tick_count = 0
+        self.started_at = 0.0
+
+    @property
+    def rate_hz(self):
+        return 1.0 / self._period
+
+    def set_rate(self, rate_hz):
+        with self._lock:
+            self._period = 1.0 / max(1.0, float(rate_hz))
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_alive():
+            return
+        self._stop_event.clear()
+        self.started_at = time.monotonic()
+        target = self._run_events if self.event_driven else self._run
+        self._thread = threading.Thread(target=target, name=self.name, daemon=True)
+        self._thread.start()
+        if self.event_driven:
+            write_log(f"[Engine] runner started: event-driven, heartbeat {1.0 / self._heartbeat:.1f} Hz")
+        elif self.group:
+            write_log(f"[Engine] rate group '{self.group}' started: {self.rate_hz:.1f} Hz")
+        else:
+            write_log(f"[Engine] runner started: {self.rate_hz:.1f} Hz")
+
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        engine_module.wake_event.set()  # 이벤트 대기 중인 러너를 깨움
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _run(self):
+        next_deadline = time.monotonic()
+        while not self._stop_event.is_set():
+            period = self._period
+            now = time.monotonic()
+            if now < next_deadline:
+                if self._stop_event.wait(next_deadline - now):
+                    break
+                now = time.monotonic()
+
+            lateness = now - next_deadline
+            if lateness > period:
+                # Missed at least one slot: drop them and re-anchor on the current time.
+                missed = int(lateness // period)
+                self.skipped_ticks += missed
+                self.overrun_count += 1
+                next_deadline += missed * period
+                lateness -= missed * period
+
+            t0 = time.perf_counter()
+            try:
+                self.tick_fn()
+            except Exception as e:
+                self.error_count += 1
+                write_log(f"[Engine] tick error: {e}")
+            duration = time.perf_counter() - t0
+
+            with self._lock:
+                self._jitter.append(lateness)
+                self._durations.append(duration)
+                self.tick_count += 1
+            if duration > period:
+                self.overrun_count += 1
+            next_deadline += period
+
+    def _timed_call(self, fn, *args):
+        t0 = time.perf_counter()
+        try:
+            fn(*args)
+        except Exception as e:
+            self.error_count += 1
+            write_log(f"[Engine] tick error: {e}")
+        duration = time.perf_counter() - t0
+        with self._lock:
+            self._durations.append(duration)
+            self.tick_count += 1
+        return duration
+
+    def _run_events(self):
+        wake_event = engine_module.wake_event
+        timers = engine_module.engine_timers
+        next_heartbeat = time.monotonic()
+        last_wake = 0.0
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            if now < next_heartbeat:
+                # 타이머 마감(core/timers.py)이 heartbeat보다 빠르면 그때 깨어나 해당 노드만 실행
+                until = next_heartbeat
+                deadline = timers.next_deadline()
+                if deadline is not None and deadline < until:
+                    until = deadline
+                if until > now:
+                    wake_event.wait(until - now)
+                if self._stop_event.is_set():
+                    break
+                now = time.monotonic()
+
+            if now >= next_heartbeat:
+                lateness = now - next_heartbeat
+                engine_module.take_wakes()  # 전체 틱이 대기 중인 웨이크를 모두 포함
+                self._timed_call(self.tick_fn)
+                with self._lock:
+                    self._jitter.append(lateness)
+                self.heartbeat_count += 1
+                next_heartbeat += self._heartbeat
+                if time.monotonic() - next_heartbeat > self._heartbeat:
+                    self.overrun_count += 1
+                    next_heartbeat = time.monotonic() + self._heartbeat
+                continue
+
+            # 웨이크 틱: 직전 웨이크 틱과 최소 간격을 두고, 그동안 들어온 웨이크를 한 번에 처리
+            wait = last_wake + self._min_wake_interval - now
+            if wait > 0 and self._stop_event.wait(min(wait, next_heartbeat - now)):
+                break
+            woken = engine_module.take_wakes() | timers.pop_due()
+            if not woken:
+                continue
+            last_wake = time.monotonic()
+            self._timed_call(self.wake_fn, woken)
+            self.wake_tick_count += 1
+
+    def snapshot(self):
+        with self._lock:
+            jitter = list(self._jitter)
+            durations = list(self._durations)
+        uptime = time.monotonic() - self.started_at if self.started_at else 0.0
+        return {
+            'alive': self.is_alive(),
+            'rate_hz': round(self.rate_hz, 2),
+            'ticks': self.tick_count,
+            'actual_hz': round(self.tick_count / uptime, 2) if uptime > 0 else 0.0,
+            'overruns': self.overrun_count,
+            'event_driven': self.event_driven,
+            'heartbeats': self.heartbeat_count,
+            'wake_ticks': self.wake_tick_count,
+            'skipped_ticks': self.skipped_ticks,
+            'errors': self.error_count,
+            'jitter_avg_ms': round(sum(jitter) / len(jitter) * 1000.0, 3) if jitter else 0.0,
+            'jitter_max_ms': round(max(jitter) * 1000.0, 3) if jitter else 0.0,
+            'tick_avg_ms': round(sum(durations) / len(durations) * 1000.0, 3) if durations else 0.0,
+            'tick_max_ms': round(max(durations) * 1000.0, 3) if durations else 0.0,
+        }
+
+
+engine_runner = None
+group_runners = {}   # non-default rate group name -> EngineRunner
+
+
+def start_group_runners():
+    """One runner thread per non-default rate group in engine_config.yaml."""
+    default = RATE_GROUP_CONFIG.get('default', 'control')
+    for name, hz in RATE_GROUP_CONFIG.get('groups', {}).items():
+        if name == default:
+            continue
+        runner = group_runners.get(name)
+        if runner is None:
+            runner = group_runners[name] = EngineRunner(
+                tick_fn=functools.partial(engine_module.run_group_tick, name), rate_hz=hz,
+                name=f"EngineRunner-{name}", event_driven=False, group=name)
+        runner.start()
+    engine_module.rate_group_runners_active = True
+
+
+def stop_group_runners():
+    engine_module.rate_group_runners_active = False
+    for runner in group_runners.values():
+        runner.stop()
+
+
+def rate_group_snapshot():
+    return {name: runner.snapshot() for name, runner in group_runners.items()}
+
+
+def start_engine_runner(rate_hz=None):
+    """Create (once) and start the shared runner and the rate group runners. Returns it."""
+    global engine_runner
+    if engine_runner is None:
+        engine_runner = EngineRunner(rate_hz=rate_hz)
+    elif rate_hz:
+        engine_runner.set_rate(rate_hz)
+    engine_runner.start()
+    start_group_runners()
+    return engine_runner
+
+
+def stop_engine_runner():
+    stop_group_runners()
+    if engine_runner is not None:
+        engine_runner.stop()
+    engine_module.shutdown_worker_pool()
+    engine_module.tick_watchdog.shutdown()
@@ -0,0 +1,26 @@
+from enum import Enum, auto
+
+
+class HwStatus(Enum):
+    OFFLINE = auto()
+    ONLINE = auto()
+    SIMULATION = auto()
+
+class PortType(Enum):
+    FLOW = auto()
+    DATA = auto()
+
+class ExecRole(Enum):
+    FLOW = auto()     # Flow 신호가 도달했을 때만 실행
+    SOURCE = auto()   # 매 틱 실행, 외부(키보드/네트워크/카메라)에서 데이터를 가져옴
+    POLL = auto()     # 매 틱 should_poll()이 True면 실행, 반환한 Flow 출력을 전파함
+    DATA = auto()     # 매 틱 실행, 데이터 링크 위상 순서(상류 → 하류)로 실행
+
+class FlowVisit(Enum):
+    PER_TRIGGER = auto()  # Flow가 도달할 때마다 실행 (LOGIC_LOOP Loop Back, PRINT 등)
+    ONCE = auto()         # 틱당 최초 1회만 실행, 이후 도달은 버림
+    MERGE = auto()        # 틱 안의 모든 활성화(틱 실행 + Flow 도달)를 모아 Flow 큐가 빈 뒤 1회 실행
+
+class Priority(Enum):
+    SAFETY = auto()   # 매 틱 가장 먼저 실행 (틱 노드는 우선 레인, Flow 노드는 Flow 큐 맨 앞)
+    NORMAL = auto()
@@ -1,5 +1,5 @@
 import importlib
-from core.engine import generate_uuid, node_registry
+from core.engine import generate_uuid, node_registry, register_node
 from core.config import GO1_MODULE_NAME
 from nodes.common import (
     StartNode, ConditionKeyNode, LogicIfNode, LogicLoopNode,
@@ -174,5 +174,5 @@ class NodeFactory:
                 node = EP01MissionActionNode(node_id)
         
         if node: 
-            node_registry[node_id] = node
+            register_node(node)
         return node
@@ -0,0 +1,478 @@
+"""Shared-memory frame ring: one writer process, any number of readers.
+
+Replaces the JPEG-files-in-/dev/shm handoff between the camera receiver and
+the graph (glob + sort + stat + unlink per frame). Each ring is a
+multiprocessing.shared_memory segment:
+
+    header  : magic, version, slots, slot_bytes, latest seq, token
+    slot[i] : begin seq, end seq, ts, nbytes, kind, height, width, channels
+    data[i] : slot_bytes of payload (JPEG bytes or a BGR/gray image)
+
+Frame n goes to slot n % slots. The writer stamps `begin`, copies the payload,
+then stamps `end` and publishes n as the latest seq; a reader that sees
+begin == end == n before and after using the payload knows the writer did not
+touch it in between. Readers get views straight into the segment (no copy);
+anything that keeps a frame longer than the ring takes to wrap around (graph
+Frames, HTTP uploads) copies it once with to_frame()/bytes().
+
+Writers: `python -m core.frame_bus gst` (Go1 RTP/JPEG receiver), the EP worker
+camera thread (nodes/robots/ep01.py) and `python -m core.frame_bus synthetic`.
+"""
+import argparse
+import atexit
+import secrets
+import signal
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+from core.engine_config import FRAME_BUS_CONFIG
+from core.frames import Frame, frame_pool
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+    HAS_SHARED_MEMORY = True
+except ImportError:
+    shared_memory = None
+    resource_tracker = None
+    HAS_SHARED_MEMORY = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+KIND_JPEG = 1
+KIND_IMAGE = 2
+
+_MAGIC = b'PGFB'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIIQQ8s')        # magic, version, slots, slot_bytes, latest, token
+_SLOT = struct.Struct('<QQdQIIII')          # begin, end, ts, nbytes, kind, height, width, channels
+_HEADER_SIZE = 64
+_SLOT_SIZE = 64
+_LATEST_OFFSET = 4 + 4 + 4 + 8
+_LATEST = struct.Struct('<Q')
+_SEQ = struct.Struct('<Q')
+
+# latest seq check period for readers outside the engine tick (uploaders)
+POLL_SEC = float(FRAME_BUS_CONFIG.get('poll_sec', 0.005))
+
+
+def ring_name(key):
+    """Segment name for a ring key ('go1_front', 'ep_front', ...)."""
+    return f"{FRAME_BUS_CONFIG.get('name_prefix', 'pygui_')}{key}"
+
+
+class RingSlot:
+    """A frame inside the ring: `data` is a view into shared memory (memoryview for
+    JPEG, read-only ndarray for images), valid while ring.still_valid(slot)."""
+    __slots__ = ('seq', 'ts', 'kind', 'data', 'shape')
+
+    def __init__(self, seq, ts, kind, data, shape):
+        self.seq = seq
+        self.ts = ts
+        self.kind = kind
+        self.data = data
+        self.shape = shape
+
+
+class FrameRing:
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self._buf = shm.buf
+        self.owner = owner
+        magic, version, self.slots, self.slot_bytes, _, self.token = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f'{shm.name} is not a frame ring (v{_VERSION})')
+        self.name = shm.name
+        self._data_offset = _HEADER_SIZE + self.slots * _SLOT_SIZE
+        self.stats = {'written': 0, 'dropped': 0, 'read': 0, 'torn': 0}
+
+    # ---- create / attach ----
+    @classmethod
+    def create(cls, key, slots=None, slot_bytes=None):
+        if not HAS_SHARED_MEMORY:
+            raise RuntimeError('multiprocessing.shared_memory is not available')
+        slots = max(2, int(slots or FRAME_BUS_CONFIG.get('slots', 8)))
+        slot_bytes = max(4096, int(slot_bytes or FRAME_BUS_CONFIG.get('jpeg_slot_bytes', 1048576)))
+        name = ring_name(key)
+        try:
+            stale = shared_memory.SharedMemory(name=name)  # 이전 실행이 남긴 세그먼트
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_HEADER_SIZE + slots * (_SLOT_SIZE + slot_bytes))
+        shm.buf[:_HEADER_SIZE + slots * _SLOT_SIZE] = bytes(_HEADER_SIZE + slots * _SLOT_SIZE)
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, _VERSION, slots, slot_bytes, 0, secrets.token_bytes(8))
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, key):
+        """Reader side; None while no writer has created the ring."""
+        if not HAS_SHARED_MEMORY:
+            return None
+        try:
+            shm = shared_memory.SharedMemory(name=ring_name(key))
+        except FileNotFoundError:
+            return None
+        try:
+            # 3.11: attach도 resource_tracker에 등록되어 읽는 프로세스 종료 시 세그먼트가 삭제됨 -> 등록 해제
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        except Exception:
+            pass
+        try:
+            return cls(shm, owner=False)
+        except ValueError:
+            shm.close()
+            return None
+
+    def close(self):
+        self._buf = None
+        try:
+            if self.owner:
+                self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            self._shm.close()
+        except BufferError:
+            # 아직 살아 있는 RingSlot 뷰가 매핑을 참조 중: 프로세스 종료까지 매핑 유지
+            _retired.append(self._shm)
+
+    # ---- writer ----
+    def write_jpeg(self, data, ts=None):
+        data = memoryview(data).cast('B')  # bytes, bytearray 또는 cv2.imencode 결과 (N, 1) 배열
+        n = len(data)
+        if n > self.slot_bytes:
+            self.stats['dropped'] += 1
+            return None
+        return self._write(KIND_JPEG, n, (0, 0, 0), ts, lambda view: view.__setitem__(slice(0, n), data))
+
+    def write_image(self, image, ts=None):
+        if not HAS_NUMPY:
+            raise RuntimeError('numpy is required for image frames')
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        if image.nbytes > self.slot_bytes:
+            self.stats['dropped'] += 1
+            return None
+        h, w = image.shape[:2]
+        c = image.shape[2] if image.ndim == 3 else 1
+        return self._write(KIND_IMAGE, image.nbytes, (h, w, c), ts,
+                           lambda view: np.copyto(np.frombuffer(view, np.uint8, image.nbytes).reshape(image.shape), image))
+
+    def _write(self, kind, nbytes, shape, ts, fill):
+        seq = self.latest_seq() + 1
+        slot = seq % self.slots
+        head = _HEADER_SIZE + slot * _SLOT_SIZE
+        data = self._data_offset + slot * self.slot_bytes
+        _SEQ.pack_into(self._buf, head, seq)                     # begin: 읽는 쪽은 이 슬롯을 버림
+        fill(self._buf[data:data + self.slot_bytes])
+        _SLOT.pack_into(self._buf, head, seq, seq, time.time() if ts is None else float(ts), nbytes, kind, *shape)
+        _LATEST.pack_into(self._buf, _LATEST_OFFSET, seq)
+        self.stats['written'] += 1
+        return seq
+
+    # ---- reader ----
+    def latest_seq(self):
+        return _LATEST.unpack_from(self._buf, _LATEST_OFFSET)[0]
+
+    def read(self, seq=None):
+        """RingSlot for `seq` (default: latest), or None if empty/overwritten."""
+        if seq is None:
+            seq = self.latest_seq()
+        if seq <= 0:
+            return None
+        slot = seq % self.slots
+        begin, end, ts, nbytes, kind, h, w, c = _SLOT.unpack_from(self._buf, _HEADER_SIZE + slot * _SLOT_SIZE)
+        if begin != seq or end != seq:
+            self.stats['torn'] += 1
+            return None
+        offset = self._data_offset + slot * self.slot_bytes
+        if kind == KIND_IMAGE and HAS_NUMPY:
+            shape = (h, w, c) if c > 1 else (h, w)
+            data = np.frombuffer(self._buf, np.uint8, nbytes, offset).reshape(shape)
+            data.flags.writeable = False
+        else:
+            shape = None
+            data = self._buf[offset:offset + nbytes].toreadonly()
+        self.stats['read'] += 1
+        return RingSlot(seq, ts, kind, data, shape)
+
+    def still_valid(self, rs):
+        """True if the writer has not started overwriting rs's slot."""
+        return _SEQ.unpack_from(self._buf, _HEADER_SIZE + (rs.seq % self.slots) * _SLOT_SIZE)[0] == rs.seq
+
+    def to_frame(self, rs, source=''):
+        """Copy a slot out into a core.frames.Frame (JPEG bytes or a pooled image), None if torn meanwhile."""
+        if rs.kind == KIND_JPEG:
+            frame = Frame.from_jpeg(rs.data, rs.ts, source)
+        else:
+            image = frame_pool.acquire(rs.data.shape, np.uint8, 'frame_bus')
+            np.copyto(image, rs.data)
+            frame = Frame(image, rs.ts, source)
+        if not self.still_valid(rs):
+            self.stats['torn'] += 1
+            return None
+        return frame
+
+    def token_changed(self):
+        """True if the segment under this name was recreated (writer restarted)."""
+        fresh = FrameRing.attach(self.name[len(ring_name('')):])
+        if fresh is None:
+            return False
+        changed = fresh.token != self.token
+        fresh.close()
+        return changed
+
+    def snapshot(self):
+        return dict(self.stats, name=self.name, slots=self.slots, slot_bytes=self.slot_bytes, latest=self.latest_seq())
+
+
+# ---- in-process ring registry ----
+_lock = threading.Lock()
+_retired = []
+_writers = {}
+_readers = {}
+_attach_retry_at = {}
+
+
+def enabled():
+    return bool(FRAME_BUS_CONFIG.get('enabled', True)) and HAS_SHARED_MEMORY and HAS_NUMPY
+
+
+def open_writer(key, raw=False):
+    """Ring this process writes into (created on first use)."""
+    with _lock:
+        ring = _writers.get(key)
+        if ring is None:
+            if not _writers:
+                atexit.register(close_all)   # owned segments are unlinked when the process exits
+            slot_bytes = FRAME_BUS_CONFIG.get('raw_slot_bytes' if raw else 'jpeg_slot_bytes')
+            ring = _writers[key] = FrameRing.create(key, slot_bytes=slot_bytes)
+        return ring
+
+
+def open_reader(key):
+    """Ring written by this or another process, None until it exists (re-tried once a second)."""
+    with _lock:
+        ring = _writers.get(key) or _readers.get(key)
+        if ring is not None:
+            return ring
+        now = time.monotonic()
+        if now < _attach_retry_at.get(key, 0.0):
+            return None
+        _attach_retry_at[key] = now + 1.0
+        ring = FrameRing.attach(key)
+        if ring is not None:
+            _readers[key] = ring
+        return ring
+
+
+def reopen_reader(key):
+    """Drop a reader whose writer restarted (new segment, same name) so the next open_reader() re-attaches."""
+    with _lock:
+        ring = _readers.get(key)
+        if ring is None or not ring.token_changed():
+            return False
+        del _readers[key]
+        _attach_retry_at.pop(key, None)
+    ring.close()
+    return True
+
+
+def close_all():
+    with _lock:
+        rings = list(_writers.values()) + list(_readers.values())
+        _writers.clear()
+        _readers.clear()
+    for ring in rings:
+        ring.close()
+
+
+def snapshot():
+    with _lock:
+        rings = list(_writers.items()) + list(_readers.items())
+    return {key: ring.snapshot() for key, ring in rings}
+
+
+# ---- writers (helper processes) ----
+class JpegStreamSplitter:
+    """Splits a byte stream of concatenated JPEGs (gst fdsink) into whole images.
+
+    Walks the marker segments instead of searching for FFD9, so table bytes
+    that happen to look like EOI do not cut an image short.
+    """
+    def __init__(self, max_bytes=8 * 1048576):
+        self._buf = bytearray()
+        self.max_bytes = max_bytes
+
+    def feed(self, chunk):
+        self._buf += chunk
+        out = []
+        while True:
+            start = self._buf.find(b'\xff\xd8')
+            if start < 0:
+                del self._buf[:-1]
+                break
+            end = _jpeg_end(self._buf, start)
+            if end == -1:
+                if start:
+                    del self._buf[:start]
+                if len(self._buf) > self.max_bytes:
+                    self._buf.clear()
+                break
+            if end == -2:
+                del self._buf[:start + 2]  # 깨진 데이터: 다음 SOI부터
+                continue
+            out.append(bytes(self._buf[start:end]))
+            del self._buf[:end]
+        return out
+
+
+def _jpeg_end(buf, start):
+    """Index just past the EOI of the JPEG at `start`; -1 if incomplete, -2 if malformed."""
+    n = len(buf)
+    i = start + 2
+    while True:
+        if i + 2 > n:
+            return -1
+        if buf[i] != 0xFF:
+            return -2
+        marker = buf[i + 1]
+        if marker == 0xFF:
+            i += 1
+            continue
+        if marker == 0xD9:
+            return i + 2
+        if 0xD0 <= marker <= 0xD7 or marker == 0x01:
+            i += 2
+            continue
+        if i + 4 > n:
+            return -1
+        seg_end = i + 2 + ((buf[i + 2] << 8) | buf[i + 3])
+        if marker != 0xDA:
+            i = seg_end
+            continue
+        # SOS 뒤 엔트로피 데이터: FF00(스터핑)과 RSTn을 건너뛰고 다음 마커까지
+        j = seg_end
+        while True:
+            j = buf.find(b'\xff', j)
+            if j < 0 or j + 1 >= n:
+                return -1
+            m = buf[j + 1]
+            if m == 0x00 or 0xD0 <= m <= 0xD7:
+                j += 2
+            elif m == 0xFF:
+                j += 1
+            else:
+                break
+        i = j
+
+
+def iter_gst_jpegs(port, caps=None):
+    """Depayloaded JPEGs from gst (RTP/JPEG on `port`) as (bytes, arrival time); gst is stopped on close."""
+    caps = caps or "application/x-rtp,media=video,encoding-name=JPEG,payload=26"
+    cmd = ['gst-launch-1.0', '-q', 'udpsrc', f'port={int(port)}', f'caps={caps}',
+           '!', 'rtpjpegdepay', '!', 'fdsink', 'fd=1', 'sync=false']
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=0)
+    splitter = JpegStreamSplitter()
+    try:
+        while True:
+            chunk = proc.stdout.read(262144)
+            if not chunk:
+                break
+            now = time.time()
+            for jpeg in splitter.feed(chunk):
+                yield jpeg, now
+    finally:
+        if proc.poll() is None:
+            proc.terminate()
+        proc.wait()
+
+
+def run_gst_writer(key, port, caps=None):
+    """Go1 receiver: RTP/JPEG on `port` -> depayloaded JPEGs -> ring. Blocks until gst exits."""
+    ring = open_writer(key)
+    print(f"[frame_bus] gst RTP/JPEG :{port} -> {ring.name}", flush=True)
+    try:
+        for jpeg, ts in iter_gst_jpegs(port, caps):
+            ring.write_jpeg(jpeg, ts)
+    finally:
+        close_all()
+    return 0
+
+
+def run_synthetic_writer(key, fps=30.0, width=640, height=480, raw=False, seconds=0.0):
+    """Test pattern producer (no robot needed): a moving bar, JPEG-encoded unless raw."""
+    import cv2
+    ring = open_writer(key, raw=raw)
+    period = 1.0 / max(1.0, float(fps))
+    base = np.zeros((height, width, 3), np.uint8)
+    base[:, :, 0] = np.linspace(0, 255, width, dtype=np.uint8)[None, :]
+    print(f"[frame_bus] synthetic {width}x{height} @ {fps:.0f} fps ({'raw' if raw else 'jpeg'}) -> {ring.name}", flush=True)
+    t_end = time.monotonic() + seconds if seconds > 0 else None
+    next_t = time.monotonic()
+    i = 0
+    try:
+        while t_end is None or time.monotonic() < t_end:
+            image = base.copy()
+            x = (i * 8) % width
+            image[:, x:x + 16] = 255
+            if raw:
+                ring.write_image(image)
+            else:
+                ok, buf = cv2.imencode('.jpg', image)
+                if ok:
+                    ring.write_jpeg(buf)
+            i += 1
+            next_t += period
+            time.sleep(max(0.0, next_t - time.monotonic()))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        close_all()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="shared-memory frame ring writers / inspector")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('gst', help='Go1 RTP/JPEG receiver -> ring')
+    p.add_argument('--ring', default='go1_front')
+    p.add_argument('--port', type=int, required=True)
+    p = sub.add_parser('synthetic', help='test pattern -> ring')
+    p.add_argument('--ring', default='go1_front')
+    p.add_argument('--fps', type=float, default=30.0)
+    p.add_argument('--size', default='640x480')
+    p.add_argument('--raw', action='store_true', help='write BGR images instead of JPEG')
+    p.add_argument('--seconds', type=float, default=0.0)
+    p = sub.add_parser('info', help='print a ring header')
+    p.add_argument('--ring', default='go1_front')
+    args = parser.parse_args(argv)
+    # pkill/terminate() from the camera worker: unwind through the writers' finally (gst child, unlink)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    if args.cmd == 'gst':
+        return run_gst_writer(args.ring, args.port)
+    if args.cmd == 'synthetic':
+        width, height = (int(v) for v in args.size.lower().split('x'))
+        run_synthetic_writer(args.ring, args.fps, width, height, args.raw, args.seconds)
+        return 0
+    ring = FrameRing.attach(args.ring)
+    if ring is None:
+        print(f"{ring_name(args.ring)}: not found")
+        return 1
+    rs = ring.read()
+    print(ring.snapshot(), f"latest age {time.time() - rs.ts:.3f}s" if rs is not None else "empty")
+    ring.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,581 @@
+import atexit
+import itertools
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+
+from core.engine_config import FRAME_POOL_CONFIG, DERIVED_CACHE_CONFIG, DECODE_POOL_CONFIG
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+try:
+    import cv2
+    HAS_CV2 = True
+except ImportError:
+    cv2 = None
+    HAS_CV2 = False
+
+_seq_counter = itertools.count(1)
+
+
+def _freeze(image):
+    # Frame에 실린 이미지는 읽기 전용: 그리려면 Frame.writable()로 복사본을 받아야 함
+    flags = getattr(image, 'flags', None)
+    if flags is not None:
+        try:
+            flags.writeable = False
+        except ValueError:
+            pass
+    return image
+
+
+# JPEG 통과/인코딩/지연 디코딩 횟수 (Performance 탭, 벤치마크)
+codec_stats = {'passthrough': 0, 'encoded': 0, 'decoded': 0, 'decoded_reduced': 0, 'decode_failed': 0}
+
+
+def is_complete_jpeg(data):
+    """True for a whole JPEG stream (SOI ... EOI), e.g. a file that has finished being written."""
+    return len(data) > 4 and data[:2] == b'\xff\xd8' and data[-2:] == b'\xff\xd9'
+
+
+class Frame:
+    """An image travelling between vision nodes.
+
+    seq is unique per image content: a source assigns a new one only when it
+    actually got a new image, and a node that transforms a frame publishes a new
+    Frame (new seq, same capture ts). Re-publishing the same Frame object across
+    ticks keeps its seq, so consumers can tell "no new frame" with one comparison
+    (BaseNode.fetch_frame()). ts is the capture time (time.time() domain).
+
+    The image is made read-only, so every consumer can share it without copying;
+    a node that wants to draw on it asks for a copy explicitly (writable()), which
+    comes from frame_pool.
+
+    A frame read from a JPEG file (from_jpeg()) keeps the encoded bytes and
+    decodes them only when something first reads .image; consumers that only
+    need JPEG (stream, save, upload) take frame_jpeg() and never decode.
+    Frames derived from it carry pixels only, since their content differs.
+    Camera frames submitted to decode_pool are usually decoded by a worker
+    before any node reads them.
+    """
+    __slots__ = ('_image', 'jpeg', '_decoded', '_lock', 'seq', 'ts', 'source')
+
+    def __init__(self, image, ts=None, source='', jpeg=None):
+        self._image = None if image is None else _freeze(image)
+        self.jpeg = jpeg
+        self._decoded = image is not None
+        self._lock = None if image is not None else threading.Lock()
+        self.seq = next(_seq_counter)
+        self.ts = time.time() if ts is None else ts
+        self.source = source
+
+    @classmethod
+    def from_jpeg(cls, data, ts=None, source=''):
+        """Frame for encoded JPEG bytes; pixels are decoded on first access."""
+        return cls(None, ts, source, jpeg=bytes(data))
+
+    @property
+    def image(self):
+        if self.jpeg is not None:
+            decode_pool.note_demand(self.source, 0)
+        if not self._decoded:
+            self._decode()
+        return self._image
+
+    @property
+    def decoded(self):
+        return self._decoded
+
+    def _decode(self, inline=True):
+        lock = self._lock
+        if not lock.acquire(blocking=False):
+            # 다른 스레드(디코드 풀 워커, 병렬 노드)가 디코딩 중: 끝나기를 기다림 (디코딩은 한 번)
+            t0 = time.perf_counter()
+            lock.acquire()
+            if inline:
+                decode_pool.record('wait', time.perf_counter() - t0)
+        try:
+            if self._decoded:
+                return
+            t0 = time.perf_counter()
+            image = None
+            if HAS_CV2 and HAS_NUMPY and self.jpeg is not None:
+                image = cv2.imdecode(np.frombuffer(self.jpeg, np.uint8), cv2.IMREAD_COLOR)
+            if image is None:
+                codec_stats['decode_failed'] += 1
+            else:
+                codec_stats['decoded'] += 1
+                image = _freeze(image)
+                decode_pool.record('full', time.perf_counter() - t0, inline)
+            self._image = image
+            self._decoded = True
+        finally:
+            lock.release()
+
+    def derive(self, image):
+        """Result of processing this frame: new seq, same capture time and source."""
+        return Frame(image, self.ts, self.source)
+
+    def writable(self, owner=''):
+        """Copy-on-write: a pooled, writable copy of the image."""
+        return frame_pool.copy(self.image, owner)
+
+    @property
+    def shape(self):
+        return self.image.shape
+
+    def __repr__(self):
+        shape = getattr(self._image, 'shape', None) if self._decoded else 'not decoded'
+        jpeg = f", jpeg={len(self.jpeg)} B" if self.jpeg is not None else ""
+        return f"Frame(seq={self.seq}, ts={self.ts:.3f}, source={self.source!r}, shape={shape}{jpeg})"
+
+
+def frame_image(value):
+    """ndarray of a Frame; raw images (older nodes, EP camera) pass through."""
+    return value.image if isinstance(value, Frame) else value
+
+
+def derive_frame(src, image):
+    """Output for `image` computed from input `src`: a Frame if src was one, else the raw image."""
+    return src.derive(image) if isinstance(src, Frame) else image
+
+
+def frame_seq(value):
+    """seq of a Frame, None for raw images (always treated as new)."""
+    return value.seq if isinstance(value, Frame) else None
+
+
+class FramePool:
+    """Reusable image buffers for vision nodes' outputs and copies.
+
+    acquire() hands out a lease: a fresh array over a pooled block of memory.
+    Every numpy view taken from it (Frame images, output_data, slices) shares
+    the lease's base array, and a weakref finalizer on that base returns the
+    block to the pool once the last of them is gone. So nodes never release
+    anything by hand; dropping the last Frame that carries a buffer frees it.
+    Blocks are kept per (shape, dtype), at most `max_buffers_per_shape` of them;
+    beyond that acquire() falls back to a plain allocation.
+    """
+    def __init__(self, config=None):
+        cfg = dict(config or {})
+        self.enabled = bool(cfg.get('enabled', True)) and HAS_NUMPY
+        self.max_per_shape = max(1, int(cfg.get('max_buffers_per_shape', 8)))
+        self._lock = threading.Lock()
+        self._free = {}         # (shape, dtype.str) -> [block, ...] 반납된 메모리 블록
+        self._pooled = {}       # (shape, dtype.str) -> 풀이 관리하는 블록 수 (사용 중 + 반납)
+        self._owners = {}       # id(block) -> owner (노드 타입, 파이프라인별 메모리 집계용)
+        self._nbytes = {}       # id(block) -> 크기
+        self._generation = 0    # clear() 이전에 빌려 간 블록은 반납되어도 버림
+        self.stats = {'allocated': 0, 'reused': 0, 'overflow': 0}
+
+    def acquire(self, shape, dtype=None, owner=''):
+        """A writable buffer of `shape`/`dtype` (contents undefined)."""
+        if not HAS_NUMPY:
+            raise RuntimeError('numpy is required for FramePool')
+        dtype = np.dtype(np.uint8 if dtype is None else dtype)
+        shape = tuple(int(v) for v in shape)
+        if not self.enabled:
+            self.stats['allocated'] += 1
+            return np.empty(shape, dtype)
+        key = (shape, dtype.str)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                block = free.pop()
+                self.stats['reused'] += 1
+            elif self._pooled.get(key, 0) < self.max_per_shape:
+                block = np.empty(int(np.prod(shape)) * dtype.itemsize, np.uint8)
+                self._pooled[key] = self._pooled.get(key, 0) + 1
+                self._nbytes[id(block)] = block.nbytes
+                self.stats['allocated'] += 1
+            else:
+                self.stats['overflow'] += 1  # 모두 사용 중: 풀에 넣지 않고 일회성 할당
+                return np.empty(shape, dtype)
+            self._owners[id(block)] = owner
+            generation = self._generation
+        # 블록 위의 새 배열: 이후 만든 뷰는 모두 base가 lease라서 마지막 뷰가 사라질 때 반납됨
+        lease = np.frombuffer(block.data, dtype)
+        weakref.finalize(lease, self._release, key, block, generation).atexit = False
+        return lease.reshape(shape)
+
+    def _release(self, key, block, generation):
+        with self._lock:
+            if generation == self._generation:
+                self._free.setdefault(key, []).append(block)
+
+    def copy(self, image, owner=''):
+        """Writable pooled copy of `image` (copy-on-write for nodes that draw)."""
+        if not HAS_NUMPY or not hasattr(image, 'shape'):
+            return image.copy()
+        buf = self.acquire(image.shape, image.dtype, owner)
+        np.copyto(buf, image)
+        return buf
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._free.clear()
+            self._pooled.clear()
+            self._owners.clear()
+            self._nbytes.clear()
+
+    def snapshot(self):
+        """Pool size, buffers in use and pooled bytes per owner (node type)."""
+        by_owner = {}
+        with self._lock:
+            buffers = sum(self._pooled.values())
+            in_use = buffers - sum(len(free) for free in self._free.values())
+            pooled_bytes = sum(self._nbytes.values())
+            for bid, nbytes in self._nbytes.items():
+                owner = self._owners.get(bid, '') or '-'
+                by_owner[owner] = by_owner.get(owner, 0) + nbytes
+        return dict(self.stats, buffers=buffers, in_use=in_use, pooled_bytes=pooled_bytes, bytes_by_owner=by_owner)
+
+
+def resident_memory_bytes():
+    """Process RSS (Linux /proc), or None where unavailable."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        import resource
+        return pages * resource.getpagesize()
+    except Exception:
+        return None
+
+
+frame_pool = FramePool(FRAME_POOL_CONFIG)
+
+
+class DerivedImageCache:
+    """Derived images of a frame (gray, RGB, downscaled pyramid levels, JPEG), computed once.
+
+    Entries are keyed on Frame.seq: whichever vision node asks first computes the
+    derivative into a pooled, read-only buffer, and every other node asking for
+    the same frame gets that array back. Only the `max_frames` newest seqs are
+    kept; when a newer frame gets its first derivative the oldest frame's entries
+    are evicted, and their buffers go back to frame_pool once no output still
+    holds them. Raw images (no seq) are converted on every call.
+    """
+    def __init__(self, config=None):
+        cfg = dict(config or {})
+        self.enabled = bool(cfg.get('enabled', True))
+        self.max_frames = max(1, int(cfg.get('max_frames', 4)))
+        self._lock = threading.Lock()
+        self._entries = {}   # seq -> {kind: ndarray}
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'uncached': 0}
+
+    def get(self, value, kind, compute, decode=True):
+        """compute(image) for `value` (Frame or raw image), shared per Frame.seq.
+        decode=False passes the Frame itself (compute from its JPEG without a full decode)."""
+        seq = frame_seq(value)
+        if seq is None or not self.enabled:
+            self.stats['uncached'] += 1
+            return _freeze(compute(frame_image(value) if decode else value))
+        entry = self._entries.get(seq)
+        if entry is not None:
+            cached = entry.get(kind)
+            if cached is not None:
+                self.stats['hits'] += 1
+                return cached
+        result = _freeze(compute(frame_image(value) if decode else value))
+        with self._lock:
+            entry = self._entries.get(seq)
+            if entry is None:
+                entry = self._entries[seq] = {}
+                self._evict_locked()
+            # 병렬 워커가 같은 프레임을 동시에 계산했다면 먼저 저장된 쪽을 공유
+            result = entry.setdefault(kind, result)
+            self.stats['misses'] += 1
+        return result
+
+    def peek(self, value, kind):
+        """Cached derivative or None (never computes)."""
+        entry = self._entries.get(frame_seq(value))
+        return entry.get(kind) if entry is not None else None
+
+    def _evict_locked(self):
+        while len(self._entries) > self.max_frames:
+            del self._entries[min(self._entries)]
+            self.stats['evictions'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self):
+        with self._lock:
+            frames = len(self._entries)
+            cached_bytes = sum(len(img) if isinstance(img, bytes) else img.nbytes
+                               for entry in self._entries.values() for img in entry.values())
+        return dict(self.stats, frames=frames, cached_bytes=cached_bytes)
+
+
+derived_cache = DerivedImageCache(DERIVED_CACHE_CONFIG)
+
+
+def _to_gray(image):
+    if image.ndim == 2:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=frame_pool.acquire(image.shape[:2], image.dtype, 'derived'))
+
+
+def _to_rgb(image):
+    code = cv2.COLOR_GRAY2RGB if image.ndim == 2 else cv2.COLOR_BGR2RGB
+    return cv2.cvtColor(image, code, dst=frame_pool.acquire(image.shape[:2] + (3,), image.dtype, 'derived'))
+
+
+def _pyr_down(image):
+    h, w = image.shape[:2]
+    shape = ((h + 1) // 2, (w + 1) // 2) + tuple(image.shape[2:])
+    return cv2.pyrDown(image, dst=frame_pool.acquire(shape, image.dtype, 'derived'))
+
+
+def frame_gray(value):
+    """Grayscale image of a BGR frame (shared per frame; read-only)."""
+    if not HAS_CV2:
+        raise RuntimeError('OpenCV is required for derived images')
+    return derived_cache.get(value, 'gray', _to_gray)
+
+
+def frame_rgb(value):
+    """RGB image of a BGR frame (shared per frame; read-only)."""
+    if not HAS_CV2:
+        raise RuntimeError('OpenCV is required for derived images')
+    return derived_cache.get(value, 'rgb', _to_rgb)
+
+
+def _encode_jpeg(image):
+    ok, buf = cv2.imencode('.jpg', image)
+    if not ok:
+        raise RuntimeError('JPEG encoding failed')
+    codec_stats['encoded'] += 1
+    return buf.tobytes()
+
+
+def frame_jpeg(value, level=0):
+    """JPEG bytes of a frame at a pyramid level (see frame_scaled()).
+
+    A full-size frame that still carries its source JPEG returns those bytes as
+    they are (no decode, no re-encode); otherwise the frame is encoded once and
+    shared per frame like the other derivatives.
+    """
+    level = max(0, int(level))
+    if level == 0 and isinstance(value, Frame) and value.jpeg is not None:
+        codec_stats['passthrough'] += 1
+        return value.jpeg
+    if not HAS_CV2:
+        raise RuntimeError('OpenCV is required for JPEG encoding')
+    scaled = frame_scaled(value, level)
+    return derived_cache.get(value, ('jpeg', level), lambda _image: _encode_jpeg(scaled))
+
+
+_REDUCED_FLAGS = {
+    1: cv2.IMREAD_REDUCED_COLOR_2,
+    2: cv2.IMREAD_REDUCED_COLOR_4,
+    3: cv2.IMREAD_REDUCED_COLOR_8,
+} if HAS_CV2 else {}
+
+
+def _scaled_from_jpeg(frame, level, inline=True):
+    # 한 단계 큰 축소본이 이미 있으면 그것을 pyrDown, 없으면 JPEG에서 바로 축소 디코딩 (DCT 스케일링)
+    parent = derived_cache.peek(frame, ('scaled', level - 1)) if level > 1 else None
+    if parent is not None:
+        return _pyr_down(parent)
+    t0 = time.perf_counter()
+    image = cv2.imdecode(np.frombuffer(frame.jpeg, np.uint8), _REDUCED_FLAGS[min(level, 3)])
+    if image is None:
+        codec_stats['decode_failed'] += 1
+        raise RuntimeError('JPEG decoding failed')
+    codec_stats['decoded_reduced'] += 1
+    decode_pool.record('reduced', time.perf_counter() - t0, inline)
+    for _ in range(level - 3):
+        image = _pyr_down(image)
+    return image
+
+
+def frame_scaled(value, level):
+    """Pyramid level of a frame: 0 = full size, each level halves width and height.
+
+    Level n is built from level n-1, so the levels a stream and a saver ask for
+    share their intermediate steps too. A camera JPEG that nothing needs at
+    full size is decoded straight to the requested level
+    (IMREAD_REDUCED_COLOR_2/4/8), skipping the full decode.
+    """
+    level = max(0, int(level))
+    if level == 0:
+        return frame_image(value)
+    if not HAS_CV2:
+        raise RuntimeError('OpenCV is required for derived images')
+    if isinstance(value, Frame) and value.jpeg is not None:
+        decode_pool.note_demand(value.source, level)
+        if (not value.decoded and derived_cache.enabled and decode_pool.reduced_decode
+                and not decode_pool.wants(value.source, 0)):
+            return derived_cache.get(value, ('scaled', level), lambda frame: _scaled_from_jpeg(frame, level), decode=False)
+    if frame_seq(value) is None or not derived_cache.enabled:
+        image = frame_image(value)
+        for _ in range(level):
+            image = _pyr_down(image)
+        derived_cache.stats['uncached'] += level
+        return _freeze(image)
+    parent = frame_scaled(value, level - 1)
+    return derived_cache.get(value, ('scaled', level), lambda _image: _pyr_down(parent))
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+class JpegDecodePool:
+    """Decodes camera JPEGs on worker threads as they arrive, outside the engine tick.
+
+    A receiver (RTP thread, folder watcher) calls submit(key, jpeg) for every
+    frame; the Frame goes into the latest-frame slot for `key` (latest()), and a
+    worker decodes it at the resolutions the graph asked for within the last
+    `demand_ttl_sec`: full size if any node read Frame.image, otherwise only the
+    pyramid levels nodes took through frame_scaled()/frame_jpeg(), with
+    IMREAD_REDUCED_*. Only the newest waiting frame per key is kept: a frame not
+    yet picked up by a worker when the next one arrives is dropped. A node that
+    reads a frame while a worker is still on it waits for that decode instead of
+    starting its own; with no recent demand nothing is decoded in advance.
+    """
+    def __init__(self, config=None):
+        cfg = dict(config or {})
+        self.enabled = bool(cfg.get('enabled', True)) and HAS_CV2 and HAS_NUMPY
+        self.workers = max(1, int(cfg.get('workers', 2)))
+        self.reduced_decode = bool(cfg.get('reduced_decode', True)) and HAS_CV2
+        self.demand_ttl = float(cfg.get('demand_ttl_sec', 2.0))
+        self._cond = threading.Condition()
+        self._latest = {}              # key -> (count, Frame)
+        self._pending = OrderedDict()  # key -> (Frame, submit time): 키마다 최신 한 장만 대기
+        self._threads = []
+        self._closed = False
+        self._demand = {}              # (source, level) -> 마지막 요청 시각 (monotonic), demand_ttl이 지난 항목은 정리
+        self._demand_pruned_at = 0.0
+        self.stats = {'submitted': 0, 'dropped': 0, 'full_pool': 0, 'full_inline': 0,
+                      'reduced_pool': 0, 'reduced_inline': 0, 'waited': 0, 'failed': 0}
+        self._times = {kind: deque(maxlen=256) for kind in ('full', 'reduced', 'ready', 'wait')}
+        atexit.register(self.close)  # 워커를 다시 띄워도 한 번만 등록
+
+    # ---- demand (which resolutions the graph reads) ----
+    def note_demand(self, source, level):
+        now = time.monotonic()
+        with self._cond:  # 노드(엔진/워커 스레드)와 디코드 워커가 함께 읽고 씀
+            demand = self._demand
+            demand[(source, level)] = now
+            if len(demand) > 64 and now - self._demand_pruned_at > self.demand_ttl:
+                # source가 계속 바뀌는 경우(파일 경로 등) 오래된 요청을 정리해 무한히 늘지 않게 함
+                self._demand_pruned_at = now
+                for key in [k for k, t in demand.items() if now - t > self.demand_ttl]:
+                    del demand[key]
+
+    def wants(self, source, level):
+        with self._cond:
+            t = self._demand.get((source, level))
+        return t is not None and time.monotonic() - t <= self.demand_ttl
+
+    def wanted_levels(self, source):
+        now = time.monotonic()
+        with self._cond:
+            t = self._demand.get((source, 0))
+            if t is not None and now - t <= self.demand_ttl:
+                return [0]
+            return sorted(level for (src, level), t in self._demand.items()
+                          if src == source and now - t <= self.demand_ttl)
+
+    # ---- producer / reader side ----
+    def submit(self, key, jpeg, ts=None):
+        """New camera JPEG for `key`: publish it as the latest Frame and queue its decode."""
+        frame = Frame.from_jpeg(jpeg, ts, source=key)
+        with self._cond:
+            count = self._latest.get(key, (0, None))[0] + 1
+            self._latest[key] = (count, frame)
+            self.stats['submitted'] += 1
+            if self.enabled and self.wanted_levels(key):
+                if self._pending.pop(key, None) is not None:
+                    self.stats['dropped'] += 1
+                self._pending[key] = (frame, time.perf_counter())
+                if not self._threads:
+                    self._start_workers_locked()
+                self._cond.notify()
+        return frame
+
+    def latest(self, key):
+        """(count, Frame) of the newest submitted frame for `key`; (0, None) before the first."""
+        with self._cond:
+            return self._latest.get(key, (0, None))
+
+    def clear(self, key):
+        with self._cond:
+            self._latest.pop(key, None)
+            self._pending.pop(key, None)
+
+    def close(self):
+        """Stop the workers (atexit): a decode still running in cv2 at interpreter exit aborts the process."""
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._cond.notify_all()
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout=1.0)
+
+    def _start_workers_locked(self):
+        if self._closed:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f'jpeg-decode-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                key, (frame, submitted) = self._pending.popitem(last=False)
+            try:
+                for level in self.wanted_levels(key):
+                    if level == 0:
+                        frame._decode(inline=False)
+                    else:
+                        derived_cache.get(frame, ('scaled', level),
+                                          lambda f, level=level: _scaled_from_jpeg(f, level, inline=False), decode=False)
+                self._times['ready'].append((time.perf_counter() - submitted) * 1000.0)
+            except Exception:
+                self.stats['failed'] += 1
+
+    # ---- stats (Performance tab, bench) ----
+    def record(self, kind, seconds, inline=True):
+        self._times[kind].append(seconds * 1000.0)
+        if kind == 'wait':
+            self.stats['waited'] += 1
+        else:
+            self.stats[f"{kind}_{'inline' if inline else 'pool'}"] += 1
+
+    def reset_stats(self):
+        for key in self.stats:
+            self.stats[key] = 0
+        for times in self._times.values():
+            times.clear()
+
+    def snapshot(self):
+        snap = dict(self.stats)
+        for kind, times in self._times.items():
+            values = list(times)
+            snap[f'{kind}_p50_ms'] = _percentile(values, 0.5)
+            snap[f'{kind}_p95_ms'] = _percentile(values, 0.95)
+        return snap
+
+
+decode_pool = JpegDecodePool(DECODE_POOL_CONFIG)
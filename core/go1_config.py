@@ -185,6 +185,7 @@ CAMERA_CONFIG_DEFAULT = {
     'gstreamer': {
         'udp_port': 9400,
         'ssh_key_path': '~/.ssh/id_rsa',
+        'receiver': 'native',   # native = core/rtp_jpeg.py 수신기 (프로세스 내), gst = gst-launch 수신 프로세스
     },
     'timing': {
         'first_frame_wait_sec': 5.0,
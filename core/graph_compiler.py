@@ -0,0 +1,338 @@
+from collections import deque
+from types import MappingProxyType
+
+from core.engine_types import PortType, ExecRole, FlowVisit, Priority
+from core.engine_config import RATE_GROUP_CONFIG, PRIORITY_CONFIG
+
+
+class ExecutionPlan:
+    """Immutable result of compile_graph(), reused by every tick until graph_version changes.
+
+    Tuples and read-only mappings only, so worker threads running components in
+    parallel can share one plan without locking.
+      start         START node or None
+      order         per-tick (SOURCE/POLL/DATA) nodes in data-link topological order
+      priority_lane Priority.SAFETY SOURCE/DATA nodes of the default group, in `order`;
+                    run first in every tick and not part of any component's tick list
+      components    per-component slices of `order` (default rate group only)
+      rate_groups   other rate group name -> its per-tick nodes in `order`
+      component_of  node_id -> component index (START excluded)
+      flow_targets  FLOW out-port -> tuple of destination nodes
+      downstream    node_id -> tuple of node_ids it links to (DATA and FLOW), for wake ticks
+      errors        problems that block RUN (type mismatch, dangling links)
+      warnings      problems that are only reported (unreachable nodes, flow cycles
+                    without LOGIC_LOOP, which MAX_STEPS cuts off at run time)
+      unreachable   node_ids of FLOW nodes no flow pulse can ever reach
+      demanded      node_id -> frozenset of its output ports that have at least one valid link
+                    (nodes skip work for outputs nobody reads, see BaseNode.output_demanded())
+    """
+    __slots__ = ('version', 'start', 'order', 'priority_lane', 'components', 'component_of', 'flow_targets',
+                 'downstream', 'rate_groups', 'errors', 'warnings', 'unreachable', 'demanded')
+
+    def __init__(self, version, start, order, priority_lane, components, component_of, flow_targets,
+                 downstream, rate_groups, errors, warnings, unreachable, demanded):
+        setattr_ = object.__setattr__
+        setattr_(self, 'version', version)
+        setattr_(self, 'start', start)
+        setattr_(self, 'order', tuple(order))
+        setattr_(self, 'priority_lane', tuple(priority_lane))
+        setattr_(self, 'components', tuple(tuple(c) for c in components))
+        setattr_(self, 'component_of', MappingProxyType(dict(component_of)))
+        setattr_(self, 'flow_targets', MappingProxyType({k: tuple(v) for k, v in flow_targets.items()}))
+        setattr_(self, 'downstream', MappingProxyType({k: tuple(v) for k, v in downstream.items()}))
+        setattr_(self, 'rate_groups', MappingProxyType({k: tuple(v) for k, v in rate_groups.items()}))
+        setattr_(self, 'errors', tuple(errors))
+        setattr_(self, 'warnings', tuple(warnings))
+        setattr_(self, 'unreachable', frozenset(unreachable))
+        setattr_(self, 'demanded', MappingProxyType({k: frozenset(v) for k, v in demanded.items()}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ExecutionPlan is immutable")
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def affected_by(self, node_ids):
+        """node_ids plus everything reachable from them over DATA/FLOW links."""
+        affected = set(node_ids)
+        pending = list(affected)
+        downstream = self.downstream
+        while pending:
+            for dst_id in downstream.get(pending.pop(), ()):
+                if dst_id not in affected:
+                    affected.add(dst_id)
+                    pending.append(dst_id)
+        return affected
+
+    def summary(self):
+        return {
+            'version': self.version,
+            'tick_nodes': len(self.order),
+            'priority_lane': len(self.priority_lane),
+            'components': len(self.components),
+            'rate_groups': {name: len(nodes) for name, nodes in self.rate_groups.items()},
+            'flow_ports': len(self.flow_targets),
+            'errors': len(self.errors),
+            'warnings': len(self.warnings),
+            'unreachable': len(self.unreachable),
+        }
+
+
+def _node_desc(node):
+    return f"{node.label} ({node.type_str})"
+
+
+def _validate_links(nodes, links):
+    """Port existence/type checks. Returns (valid_links, errors, warnings)."""
+    valid, errors, warnings = [], [], []
+    data_inputs = {}
+    for lid, link in links.items():
+        src = nodes.get(link.get('src_node_id'))
+        dst = nodes.get(link.get('dst_node_id'))
+        if src is None or dst is None:
+            errors.append(f"link {lid}: endpoint node missing")
+            continue
+        out_type = src.outputs.get(link['source'])
+        in_type = dst.inputs.get(link['target'])
+        if out_type is None or in_type is None:
+            errors.append(f"link {_node_desc(src)} -> {_node_desc(dst)}: port no longer exists")
+            continue
+        if out_type != in_type:
+            errors.append(f"type mismatch: {_node_desc(src)} {out_type.name} out -> {_node_desc(dst)} {in_type.name} in")
+            continue
+        if in_type == PortType.DATA:
+            data_inputs.setdefault(link['target'], []).append(src)
+        valid.append(link)
+    for port, sources in data_inputs.items():
+        if len(sources) > 1:
+            dst = nodes[next(l['dst_node_id'] for l in valid if l['target'] == port)]
+            warnings.append(f"{_node_desc(dst)}: DATA input has {len(sources)} links, only the first is read")
+    return valid, errors, warnings
+
+
+def _flow_cycles(flow_adj, barrier_ids):
+    """Strongly connected components of the flow graph with barrier nodes removed (Tarjan).
+
+    A flow cycle that passes through LOGIC_LOOP is fine: the loop defers its next
+    emission to a later tick. Any cycle left after removing those nodes would spin
+    inside a single tick until MAX_STEPS, so it is reported as a warning.
+    """
+    index, low, on_stack, stack, cycles = {}, {}, set(), [], []
+    counter = [0]
+    adj = {nid: [d for d in dsts if d not in barrier_ids] for nid, dsts in flow_adj.items() if nid not in barrier_ids}
+
+    for root in adj:
+        if root in index:
+            continue
+        # iterative Tarjan (그래프가 커도 재귀 한도에 걸리지 않도록)
+        work = [(root, 0)]
+        while work:
+            nid, i = work.pop()
+            if i == 0:
+                index[nid] = low[nid] = counter[0]
+                counter[0] += 1
+                stack.append(nid)
+                on_stack.add(nid)
+            dsts = adj.get(nid, [])
+            if i < len(dsts):
+                work.append((nid, i + 1))
+                nxt = dsts[i]
+                if nxt not in index:
+                    work.append((nxt, 0))
+                elif nxt in on_stack:
+                    low[nid] = min(low[nid], index[nxt])
+                continue
+            if low[nid] == index[nid]:
+                scc = []
+                while True:
+                    w = stack.pop()
+                    on_stack.discard(w)
+                    scc.append(w)
+                    if w == nid:
+                        break
+                if len(scc) > 1 or nid in adj.get(nid, ()):
+                    cycles.append(scc)
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[nid])
+    return cycles
+
+
+def _build_tick_order(nodes, links):
+    """SOURCE/POLL/DATA nodes sorted topologically over DATA links (Kahn).
+
+    Ties keep node_registry order with SOURCE nodes first, so upstream producers
+    always run before their consumers in the same tick. Nodes on a data cycle are
+    appended afterwards in registry order.
+    """
+    tick_nodes = [n for n in nodes.values() if n.EXEC_ROLE != ExecRole.FLOW]
+    ids = {n.node_id for n in tick_nodes}
+    indeg = {nid: 0 for nid in ids}
+    downstream = {nid: [] for nid in ids}
+    for link in links:
+        src_id, dst_id = link['src_node_id'], link['dst_node_id']
+        if src_id not in ids or dst_id not in ids or src_id == dst_id:
+            continue
+        if nodes[dst_id].inputs.get(link['target']) != PortType.DATA:
+            continue
+        downstream[src_id].append(dst_id)
+        indeg[dst_id] += 1
+
+    ready = deque(n.node_id for n in tick_nodes if indeg[n.node_id] == 0 and n.EXEC_ROLE == ExecRole.SOURCE)
+    ready.extend(n.node_id for n in tick_nodes if indeg[n.node_id] == 0 and n.EXEC_ROLE != ExecRole.SOURCE)
+    order = []
+    while ready:
+        nid = ready.popleft()
+        order.append(nodes[nid])
+        for dst_id in downstream[nid]:
+            indeg[dst_id] -= 1
+            if indeg[dst_id] == 0:
+                ready.append(dst_id)
+    if len(order) < len(tick_nodes):
+        placed = {n.node_id for n in order}
+        order.extend(n for n in tick_nodes if n.node_id not in placed)
+    return order
+
+
+def _build_components(nodes, links, start_node, order):
+    """Split the graph into independent components (union-find over all links).
+
+    START's own links are ignored: it only fans a flow pulse out, so branches that
+    merely share START stay separate. Nodes with the same COMPONENT_GROUP (a robot's
+    driver/action/teleop nodes writing its intent globals) are kept in one component
+    even when unlinked; vision nodes stay separate and can run in parallel. Each component
+    keeps its per-tick nodes in the global topological order, so ordering within a
+    component is unchanged.
+    """
+    parent = {nid: nid for nid in nodes}
+
+    def find(nid):
+        while parent[nid] != nid:
+            parent[nid] = parent[parent[nid]]
+            nid = parent[nid]
+        return nid
+
+    start_id = start_node.node_id if start_node is not None else None
+    for link in links:
+        a, b = link['src_node_id'], link['dst_node_id']
+        if a == start_id:
+            continue
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[rb] = ra
+    first_of_group = {}
+    for nid, node in nodes.items():
+        group = node.COMPONENT_GROUP
+        if nid == start_id or group is None:
+            continue
+        ra, rb = find(first_of_group.setdefault(group, nid)), find(nid)
+        if ra != rb:
+            parent[rb] = ra
+
+    index = {}
+    components = []
+    component_of = {}
+    for nid in nodes:
+        if nid == start_id:
+            continue
+        root = find(nid)
+        if root not in index:
+            index[root] = len(components)
+            components.append([])
+        component_of[nid] = index[root]
+    for node in order:
+        components[component_of[node.node_id]].append(node)
+    return components, component_of
+
+
+def rate_group_of(node, config=RATE_GROUP_CONFIG):
+    """Rate group name for a node: config 'assign' by type > node.RATE_GROUP > default.
+
+    FLOW and POLL nodes always stay in the default group, since they run inside the
+    tick that carries flow pulses; so do Priority.SAFETY nodes (priority lane).
+    """
+    default = config.get('default', 'control')
+    if node.EXEC_ROLE in (ExecRole.FLOW, ExecRole.POLL) or node.PRIORITY is Priority.SAFETY:
+        return default
+    return config.get('assign', {}).get(node.type_str) or getattr(node, 'RATE_GROUP', None) or default
+
+
+def _split_rate_groups(order, warnings):
+    default = RATE_GROUP_CONFIG.get('default', 'control')
+    known = RATE_GROUP_CONFIG.get('groups', {})
+    inline, groups = [], {}
+    for node in order:
+        group = rate_group_of(node)
+        if group != default and group not in known:
+            warnings.append(f"{_node_desc(node)}: unknown rate group '{group}', runs in '{default}'")
+            group = default
+        if group == default:
+            inline.append(node)
+        else:
+            groups.setdefault(group, []).append(node)
+    return inline, groups
+
+
+def compile_graph(nodes, links, version=None):
+    """Validate the graph and build the ExecutionPlan the engine ticks with.
+
+    nodes/links: node_registry / link_registry (read only; call under graph_lock).
+    """
+    valid_links, errors, warnings = _validate_links(nodes, links)
+
+    starts = [n for n in nodes.values() if n.type_str == "START"]
+    start = starts[0] if starts else None
+    if len(starts) > 1:
+        warnings.append(f"{len(starts)} START nodes, only the first one runs")
+
+    flow_targets = {}
+    flow_adj = {nid: [] for nid in nodes}
+    downstream = {}
+    demanded = {}
+    for link in valid_links:
+        downstream.setdefault(link['src_node_id'], []).append(link['dst_node_id'])
+        demanded.setdefault(link['src_node_id'], set()).add(link['source'])
+    for link in valid_links:
+        if nodes[link['dst_node_id']].inputs[link['target']] != PortType.FLOW:
+            continue
+        flow_targets.setdefault(link['source'], []).append(nodes[link['dst_node_id']])
+        flow_adj[link['src_node_id']].append(link['dst_node_id'])
+
+    loop_ids = {nid for nid, n in nodes.items() if n.type_str == "LOGIC_LOOP"}
+    for scc in _flow_cycles(flow_adj, loop_ids):
+        names = " -> ".join(_node_desc(nodes[nid]) for nid in scc[::-1])
+        warnings.append(f"flow cycle without LOGIC_LOOP (capped at MAX_STEPS per tick): {names}")
+
+    # Flow 펄스는 START와 POLL 노드(LOGIC_LOOP, *_MISSION_RECV)에서만 시작됨
+    roots = [n.node_id for n in nodes.values() if n is start or n.EXEC_ROLE == ExecRole.POLL]
+    reached = set(roots)
+    pending = list(roots)
+    while pending:
+        for dst_id in flow_adj.get(pending.pop(), ()):
+            if dst_id not in reached:
+                reached.add(dst_id)
+                pending.append(dst_id)
+    # 포트가 없는 표시 전용 노드(GO1_SC_LOGGER 등)는 제외
+    unreachable = [nid for nid, n in nodes.items()
+                   if n.EXEC_ROLE == ExecRole.FLOW and n is not start and nid not in reached
+                   and (n.inputs or n.outputs)]
+    for nid in unreachable:
+        warnings.append(f"unreachable: {_node_desc(nodes[nid])} is never reached by a flow pulse")
+
+    order = _build_tick_order(nodes, valid_links)
+    inline, rate_groups = _split_rate_groups(order, warnings)
+    # POLL 노드(반환한 Flow 출력을 컴포넌트에서 전파)와 Flow 입력이 있는 ONCE/MERGE 노드(틱 실행과
+    # Flow 도달을 컴포넌트 안에서 합쳐야 함)는 레인에 넣지 않음. 이들은 자기 컴포넌트가 엔진 스레드에서
+    # 먼저 실행됨. Flow 입력이 없는 MERGE 노드(로봇 드라이버)는 펄스가 닿지 않으므로 레인 1회 = 병합 1회
+    lane = []
+    if PRIORITY_CONFIG.get('enabled', True):
+        lane = [n for n in inline if n.PRIORITY is Priority.SAFETY and n.EXEC_ROLE != ExecRole.POLL
+                and (n.FLOW_VISIT is FlowVisit.PER_TRIGGER
+                     or (n.FLOW_VISIT is FlowVisit.MERGE and PortType.FLOW not in n.inputs.values()))]
+        if lane:
+            lane_ids = {n.node_id for n in lane}
+            inline = [n for n in inline if n.node_id not in lane_ids]
+    components, component_of = _build_components(nodes, valid_links, start, inline)
+    return ExecutionPlan(version, start, order, lane, components, component_of, flow_targets,
+                         downstream, rate_groups, errors, warnings, unreachable, demanded)
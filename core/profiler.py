@@ -0,0 +1,108 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from core.engine_config import PROFILER_CONFIG
+
+
+class _Stat:
+    __slots__ = ('name', 'type_str', 'samples', 'count', 'total')
+
+    def __init__(self, name, type_str, window):
+        self.name = name
+        self.type_str = type_str
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+    def summary(self):
+        samples = sorted(self.samples)
+        n = len(samples)
+        if n == 0:
+            return None
+        return {
+            'name': self.name,
+            'type': self.type_str,
+            'calls': self.count,
+            'p50_ms': round(samples[(n - 1) // 2] * 1000.0, 4),
+            'p95_ms': round(samples[min(n - 1, int(n * 0.95))] * 1000.0, 4),
+            'max_ms': round(samples[-1] * 1000.0, 4),
+            'avg_ms': round(self.total / self.count * 1000.0, 4),
+        }
+
+
+class NodeProfiler:
+    """Rolling execute() latency per node and per node type.
+
+    record() is on the hot path (every node, every tick): two dict lookups and
+    two deque appends, ~1 us. Percentiles are computed only when snapshot() is called.
+    record() is called from the engine, worker-pool and rate-group threads, so it
+    takes a lock.
+    """
+    def __init__(self, window=256, enabled=True):
+        self.window = max(16, int(window))
+        self.enabled = bool(enabled)
+        self._nodes = {}
+        self._types = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, node, dt):
+        with self._lock:
+            st = self._nodes.get(node.node_id)
+            if st is None:
+                st = self._nodes[node.node_id] = _Stat(node.label, node.type_str, self.window)
+            st.samples.append(dt)
+            st.count += 1
+            st.total += dt
+
+            ts = self._types.get(node.type_str)
+            if ts is None:
+                ts = self._types[node.type_str] = _Stat(node.type_str, node.type_str, self.window)
+            ts.samples.append(dt)
+            ts.count += 1
+            ts.total += dt
+
+    def reset(self):
+        with self._lock:
+            self._nodes = {}
+            self._types = {}
+            self.started_at = time.time()
+
+    def snapshot(self, live_node_ids=None):
+        """Return {'nodes': [...], 'types': [...]} sorted by p95 (slowest first).
+
+        live_node_ids: if given, nodes deleted from the graph are dropped from the result.
+        """
+        nodes = []
+        for nid, st in list(self._nodes.items()):
+            if live_node_ids is not None and nid not in live_node_ids:
+                continue
+            row = st.summary()
+            if row is not None:
+                row['node_id'] = nid
+                nodes.append(row)
+        types = [row for row in (st.summary() for st in list(self._types.values())) if row is not None]
+        nodes.sort(key=lambda r: r['p95_ms'], reverse=True)
+        types.sort(key=lambda r: r['p95_ms'], reverse=True)
+        return {'window': self.window, 'since': self.started_at, 'nodes': nodes, 'types': types}
+
+    def dump_json(self, directory, live_node_ids=None):
+        """Write snapshot() to <directory>/profile_YYYYmmdd_HHMMSS.json and return the path."""
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        path = os.path.join(directory, f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        data = self.snapshot(live_node_ids)
+        data['dumped_at'] = datetime.now().isoformat(timespec='seconds')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return path
+
+
+node_profiler = NodeProfiler(
+    window=PROFILER_CONFIG.get('window', 256),
+    enabled=PROFILER_CONFIG.get('enabled', True),
+)
@@ -0,0 +1,141 @@
+import threading
+import time
+
+from core.engine_config import QUARANTINE_CONFIG
+
+
+class NodeQuarantine:
+    """Per-node error accounting for the engine tick.
+
+    report() is fed every exception a node's execute() raises. Identical errors
+    (same node, exception type and message) are logged at most once per
+    `log_interval_sec`, with the number suppressed in between. After
+    `failures_to_quarantine` consecutive failures the node is quarantined: the
+    engine skips it until its retry time, then lets one probation run through.
+    A failed probation doubles the backoff (up to `backoff_max_sec`); a successful
+    run releases the node and clears its counters.
+    """
+    def __init__(self, config=None, log_fn=None):
+        cfg = dict(config or {})
+        self.enabled = bool(cfg.get('enabled', True))
+        self.failure_limit = max(1, int(cfg.get('failures_to_quarantine', 5)))
+        self.backoff_initial = max(0.05, float(cfg.get('backoff_initial_sec', 1.0)))
+        self.backoff_max = max(self.backoff_initial, float(cfg.get('backoff_max_sec', 60.0)))
+        self.log_interval_sec = float(cfg.get('log_interval_sec', 5.0))
+        self.log_fn = log_fn or print
+
+        self._lock = threading.Lock()
+        # node_id -> {'label', 'type', 'consecutive', 'errors', 'last_error',
+        #             'quarantined', 'retry_at', 'backoff'}
+        # Only nodes whose last run failed are present, so the engine's hot path is one dict lookup.
+        self.failing = {}
+        self.error_totals = {}   # node_id -> errors since RUN (kept after recovery)
+        self._error_log = {}     # node_id -> {message: [last_log_time, suppressed_count]}
+        self.generation = None
+        self.stats = {'errors': 0, 'suppressed_logs': 0, 'quarantines': 0, 'recoveries': 0, 'skipped_runs': 0}
+
+    # ---- engine hot path ----
+    def blocked(self, node_id):
+        """True while a quarantined node waits for its retry time."""
+        entry = self.failing.get(node_id)
+        if entry is None or not entry['quarantined']:
+            return False
+        if time.monotonic() < entry['retry_at']:
+            with self._lock:
+                self.stats['skipped_runs'] += 1
+            return True
+        return False  # probation run
+
+    def success(self, node):
+        if node.node_id not in self.failing:
+            return
+        with self._lock:
+            entry = self.failing.pop(node.node_id, None)
+            recovered = entry is not None and entry['quarantined']
+            if recovered:
+                self.stats['recoveries'] += 1
+        if recovered:
+            self.log_fn(f"[Quarantine] {node.label} ({node.type_str}) recovered after {entry['errors']} errors")
+
+    def report(self, node, exc):
+        now = time.monotonic()
+        message = f"{type(exc).__name__}: {exc}"
+        with self._lock:
+            self.stats['errors'] += 1
+            self.error_totals[node.node_id] = self.error_totals.get(node.node_id, 0) + 1
+            entry = self.failing.get(node.node_id)
+            if entry is None:
+                entry = self.failing[node.node_id] = {
+                    'label': node.label, 'type': node.type_str, 'consecutive': 0, 'errors': 0,
+                    'last_error': '', 'quarantined': False, 'retry_at': 0.0,
+                    'backoff': self.backoff_initial,
+                }
+            entry['consecutive'] += 1
+            entry['errors'] += 1
+            entry['last_error'] = message
+
+            if entry['quarantined']:
+                # 재시도 실패: 대기 시간을 두 배로
+                entry['backoff'] = min(entry['backoff'] * 2.0, self.backoff_max)
+                entry['retry_at'] = now + entry['backoff']
+                line = (f"[Quarantine] {node.label} ({node.type_str}) retry failed ({message}),"
+                        f" next retry in {entry['backoff']:.1f}s")
+            elif self.enabled and entry['consecutive'] >= self.failure_limit:
+                entry['quarantined'] = True
+                entry['retry_at'] = now + entry['backoff']
+                self.stats['quarantines'] += 1
+                line = (f"[Quarantine] {node.label} ({node.type_str}) quarantined after {entry['consecutive']}"
+                        f" consecutive errors ({message}), retry in {entry['backoff']:.1f}s")
+            else:
+                line = self._rate_limited(node, message, now)
+        if line:
+            self.log_fn(line)
+
+    def _rate_limited(self, node, message, now):
+        # 간헐적으로 실패하는 노드도 같은 메시지는 주기당 한 번만 (성공해도 로그 상태는 유지)
+        log = self._error_log.get(node.node_id)
+        if log is None:
+            log = self._error_log[node.node_id] = {}
+        state = log.get(message)
+        if state is None:
+            if len(log) >= 8:
+                log.clear()  # 메시지가 계속 바뀌는 노드(좌표 포함 등)가 메모리를 늘리지 않도록
+            state = log[message] = [0.0, 0]
+        if now - state[0] < self.log_interval_sec:
+            state[1] += 1
+            self.stats['suppressed_logs'] += 1
+            return None
+        suppressed = state[1]
+        state[0], state[1] = now, 0
+        extra = f" (+{suppressed} more since last report)" if suppressed else ""
+        return f"[Error] {node.label} ({node.type_str}) {message}{extra}"
+
+    # ---- housekeeping ----
+    def quarantined_ids(self):
+        with self._lock:
+            return {nid for nid, e in self.failing.items() if e['quarantined']}
+
+    def reset(self, generation=None):
+        with self._lock:
+            self.failing.clear()
+            self.error_totals.clear()
+            self._error_log.clear()
+        self.generation = generation
+
+    def forget(self, live_node_ids):
+        with self._lock:
+            for d in (self.failing, self.error_totals, self._error_log):
+                for nid in [nid for nid in d if nid not in live_node_ids]:
+                    del d[nid]
+
+    def snapshot(self):
+        now = time.monotonic()
+        with self._lock:
+            quarantined = [{'node_id': nid, 'label': e['label'], 'type': e['type'], 'errors': e['errors'],
+                            'retry_in': max(0.0, e['retry_at'] - now), 'last_error': e['last_error']}
+                           for nid, e in self.failing.items() if e['quarantined']]
+            failing = len(self.failing)
+        return {'quarantined': quarantined, 'failing': failing, **self.stats}
+
+
+node_quarantine = NodeQuarantine(QUARANTINE_CONFIG)
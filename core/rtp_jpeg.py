@@ -0,0 +1,555 @@
+"""RTP/JPEG (RFC 2435) receiver and test sender, no GStreamer needed.
+
+The Go1 camera Nanos stream `rtpjpegpay` packets to UDP GST_UDP_PORT. The
+receiver reassembles each frame from its fragments (by fragment offset, so
+reordered packets are fine), rebuilds the JPEG headers that RFC 2435 strips
+(DQT from the in-band tables or from Q, SOF0, the standard DHT, DRI, SOS) and
+keeps the newest complete frame in memory:
+
+    receiver = RtpJpegReceiver(9400)
+    receiver.start()
+    seq, ts, jpeg = receiver.latest()
+
+Counters (snapshot()): packets, frames, lost / reordered / duplicate packets
+(from the RTP sequence number), incomplete and late frames, malformed packets.
+
+`python -m core.rtp_jpeg send` replays JPEG files (or a test pattern) as
+RTP/JPEG; `python -m core.rtp_jpeg recv` prints the counters or, with --ring,
+feeds a core.frame_bus ring.
+"""
+import argparse
+import glob
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+RTP_PAYLOAD_JPEG = 26
+RTP_CLOCK_HZ = 90000
+DEFAULT_MTU_PAYLOAD = 1400
+
+_RTP = struct.Struct('!BBHII')          # v/p/x/cc, m/pt, seq, ts, ssrc
+_JPEG_HDR = struct.Struct('!I4B')       # type-specific + 24-bit offset, type, q, width/8, height/8
+_RESTART_HDR = struct.Struct('!HH')     # restart interval, F/L/restart count
+_QTABLE_HDR = struct.Struct('!BBH')     # mbz, precision, length
+
+# JPEG zigzag scan order -> natural (row-major) index
+_ZIGZAG = (
+    0, 1, 8, 16, 9, 2, 3, 10, 17, 24, 32, 25, 18, 11, 4, 5,
+    12, 19, 26, 33, 40, 48, 41, 34, 27, 20, 13, 6, 7, 14, 21, 28,
+    35, 42, 49, 56, 57, 50, 43, 36, 29, 22, 15, 23, 30, 37, 44, 51,
+    58, 59, 52, 45, 38, 31, 39, 46, 53, 60, 61, 54, 47, 55, 62, 63,
+)
+
+# ITU T.81 Annex K.1 quantizers (natural order), scaled by Q for Q 1..99 (RFC 2435 Appendix A)
+_LUMA_QUANT = (
+    16, 11, 10, 16, 24, 40, 51, 61,
+    12, 12, 14, 19, 26, 58, 60, 55,
+    14, 13, 16, 24, 40, 57, 69, 56,
+    14, 17, 22, 29, 51, 87, 80, 62,
+    18, 22, 37, 56, 68, 109, 103, 77,
+    24, 35, 55, 64, 81, 104, 113, 92,
+    49, 64, 78, 87, 103, 121, 120, 101,
+    72, 92, 95, 98, 112, 100, 103, 99,
+)
+_CHROMA_QUANT = (
+    17, 18, 24, 47, 99, 99, 99, 99,
+    18, 21, 26, 66, 99, 99, 99, 99,
+    24, 26, 56, 99, 99, 99, 99, 99,
+    47, 66, 99, 99, 99, 99, 99, 99,
+) + (99,) * 32
+
+# ITU T.81 Annex K.3 Huffman tables (the ones every RFC 2435 payload is coded with)
+_DC_LUMA_BITS = (0, 1, 5, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0)
+_DC_CHROMA_BITS = (0, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0)
+_DC_VALUES = tuple(range(12))
+_AC_LUMA_BITS = (0, 2, 1, 3, 3, 2, 4, 3, 5, 5, 4, 4, 0, 0, 1, 0x7d)
+_AC_LUMA_VALUES = bytes.fromhex(
+    '01020300041105122131410613516107227114328191a1082342b1c11552d1f0'
+    '2433627282090a161718191a25262728292a3435363738393a43444546474849'
+    '4a535455565758595a636465666768696a737475767778797a83848586878889'
+    '8a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5'
+    'c6c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8'
+    'f9fa'
+)
+_AC_CHROMA_BITS = (0, 2, 1, 2, 4, 4, 3, 4, 7, 5, 4, 4, 0, 1, 2, 0x77)
+_AC_CHROMA_VALUES = bytes.fromhex(
+    '000102031104052131061241510761711322328108144291a1b1c109233352f0'
+    '156272d10a162434e125f11718191a262728292a35363738393a434445464748'
+    '494a535455565758595a636465666768696a737475767778797a828384858687'
+    '88898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3'
+    'c4c5c6c7c8c9cad2d3d4d5d6d7d8d9dae2e3e4e5e6e7e8e9eaf2f3f4f5f6f7f8'
+    'f9fa'
+)
+
+
+def _segment(marker, payload):
+    return struct.pack('!BBH', 0xFF, marker, len(payload) + 2) + payload
+
+
+def _dht(table_class, table_id, bits, values):
+    return bytes([(table_class << 4) | table_id]) + bytes(bits) + bytes(values)
+
+
+_DHT_SEGMENT = _segment(0xC4, b''.join((
+    _dht(0, 0, _DC_LUMA_BITS, _DC_VALUES),
+    _dht(1, 0, _AC_LUMA_BITS, _AC_LUMA_VALUES),
+    _dht(0, 1, _DC_CHROMA_BITS, _DC_VALUES),
+    _dht(1, 1, _AC_CHROMA_BITS, _AC_CHROMA_VALUES),
+)))
+
+
+def default_qtables(q):
+    """RFC 2435 Appendix A: luma + chroma tables (zigzag order, 8-bit) for Q 1..99."""
+    factor = min(max(int(q), 1), 99)
+    scale = 5000 // factor if factor < 50 else 200 - factor * 2
+    tables = bytearray()
+    for base in (_LUMA_QUANT, _CHROMA_QUANT):
+        tables += bytes(min(max((base[_ZIGZAG[i]] * scale + 50) // 100, 1), 255) for i in range(64))
+    return bytes(tables)
+
+
+def build_jpeg_headers(jpeg_type, width, height, qtables, precision=0, restart_interval=0):
+    """SOI .. SOS for an RFC 2435 scan. qtables: concatenated tables in zigzag order."""
+    dqt = bytearray()
+    offset = 0
+    table_count = 0
+    while offset < len(qtables) and table_count < 4:
+        size = 128 if precision & (1 << table_count) else 64
+        dqt.append(((1 if size == 128 else 0) << 4) | table_count)
+        dqt += qtables[offset:offset + size]
+        offset += size
+        table_count += 1
+    chroma_table = 1 if table_count > 1 else 0
+    # type 0: 4:2:2 (Y 2x1), type 1: 4:2:0 (Y 2x2)
+    luma_sampling = 0x21 if (jpeg_type & 0x3F) == 0 else 0x22
+    sof = struct.pack('!BHHB', 8, height, width, 3) + bytes((
+        1, luma_sampling, 0,
+        2, 0x11, chroma_table,
+        3, 0x11, chroma_table,
+    ))
+    parts = [b'\xff\xd8', _segment(0xDB, bytes(dqt)), _segment(0xC0, sof), _DHT_SEGMENT]
+    if restart_interval:
+        parts.append(_segment(0xDD, struct.pack('!H', restart_interval)))
+    parts.append(_segment(0xDA, bytes((3, 1, 0x00, 2, 0x11, 3, 0x11, 0, 63, 0))))
+    return b''.join(parts)
+
+
+# ---- receiver ----
+class _PendingFrame:
+    __slots__ = ('rtp_ts', 'fragments', 'size', 'header', 'first_arrival')
+
+    def __init__(self, rtp_ts, now):
+        self.rtp_ts = rtp_ts
+        self.fragments = {}          # fragment offset -> scan bytes
+        self.size = None             # total scan length, known once the marker packet arrived
+        self.header = None           # (type, width, height, qtables, precision, restart interval)
+        self.first_arrival = now
+
+    def complete(self):
+        if self.size is None or self.header is None:
+            return False
+        expected = 0
+        for offset in sorted(self.fragments):
+            if offset != expected:
+                return False
+            expected += len(self.fragments[offset])
+        return expected == self.size
+
+
+class RtpJpegDepacketizer:
+    """Packet-by-packet RFC 2435 reassembly. feed() returns (jpeg bytes, rtp ts) for each completed frame."""
+
+    def __init__(self):
+        self.stats = {'packets': 0, 'bytes': 0, 'frames': 0, 'lost': 0, 'reordered': 0, 'duplicate': 0,
+                      'incomplete': 0, 'late': 0, 'malformed': 0}
+        self._last_seq = None
+        self._pending = None
+        self._last_done_ts = None
+        self._qtable_cache = {}      # Q 128..254 tables sent once then referenced with length 0
+
+    def _track_seq(self, seq):
+        if self._last_seq is None:
+            self._last_seq = seq
+            return
+        delta = (seq - self._last_seq) & 0xFFFF
+        if delta == 0:
+            self.stats['duplicate'] += 1
+        elif delta < 0x8000:
+            self.stats['lost'] += delta - 1
+            self._last_seq = seq
+        else:
+            # 앞서 빠진 것으로 센 패킷이 늦게 도착
+            self.stats['reordered'] += 1
+            if self.stats['lost'] > 0:
+                self.stats['lost'] -= 1
+
+    def feed(self, packet, now=None):
+        stats = self.stats
+        stats['packets'] += 1
+        stats['bytes'] += len(packet)
+        if len(packet) < _RTP.size + _JPEG_HDR.size:
+            stats['malformed'] += 1
+            return None
+        vpxcc, mpt, seq, rtp_ts, _ = _RTP.unpack_from(packet, 0)
+        if vpxcc >> 6 != 2:
+            stats['malformed'] += 1
+            return None
+        end = len(packet)
+        if vpxcc & 0x20:             # padding
+            end -= packet[-1]
+        pos = _RTP.size + 4 * (vpxcc & 0x0F)
+        if vpxcc & 0x10:             # header extension
+            if pos + 4 > end:
+                stats['malformed'] += 1
+                return None
+            pos += 4 + 4 * struct.unpack_from('!H', packet, pos + 2)[0]
+        if pos + _JPEG_HDR.size > end:
+            stats['malformed'] += 1
+            return None
+        self._track_seq(seq)
+
+        if self._last_done_ts is not None and ((rtp_ts - self._last_done_ts) & 0xFFFFFFFF) >= 0x80000000 or rtp_ts == self._last_done_ts:
+            stats['late'] += 1       # 이미 완성했거나 지나간 프레임의 조각
+            return None
+        pending = self._pending
+        if pending is None or pending.rtp_ts != rtp_ts:
+            if pending is not None:
+                if ((rtp_ts - pending.rtp_ts) & 0xFFFFFFFF) >= 0x80000000:
+                    stats['late'] += 1   # 이미 지나간 프레임의 조각
+                    return None
+                stats['incomplete'] += 1
+            pending = self._pending = _PendingFrame(rtp_ts, now)
+
+        type_offset, jpeg_type, q, width8, height8 = _JPEG_HDR.unpack_from(packet, pos)
+        offset = type_offset & 0xFFFFFF
+        pos += _JPEG_HDR.size
+        restart_interval = 0
+        if 64 <= jpeg_type < 128:
+            if pos + _RESTART_HDR.size > end:
+                stats['malformed'] += 1
+                return None
+            restart_interval = _RESTART_HDR.unpack_from(packet, pos)[0]
+            pos += _RESTART_HDR.size
+        if offset == 0:
+            if q >= 128:
+                if pos + _QTABLE_HDR.size > end:
+                    stats['malformed'] += 1
+                    return None
+                _, precision, length = _QTABLE_HDR.unpack_from(packet, pos)
+                pos += _QTABLE_HDR.size
+                if length:
+                    qtables = bytes(packet[pos:pos + length])
+                    pos += length
+                    if q < 255:
+                        self._qtable_cache[q] = (qtables, precision)
+                else:
+                    qtables, precision = self._qtable_cache.get(q, (None, 0))
+                if not qtables:
+                    stats['malformed'] += 1
+                    return None
+            else:
+                qtables, precision = default_qtables(q), 0
+            pending.header = (jpeg_type, width8 * 8, height8 * 8, qtables, precision, restart_interval)
+        pending.fragments[offset] = bytes(packet[pos:end])
+        if mpt & 0x80:               # marker: last fragment of the frame
+            pending.size = offset + (end - pos)
+        if not pending.complete():
+            return None
+
+        jpeg_type, width, height, qtables, precision, restart_interval = pending.header
+        scan = b''.join(pending.fragments[k] for k in sorted(pending.fragments))
+        parts = [build_jpeg_headers(jpeg_type, width, height, qtables, precision, restart_interval), scan]
+        if not scan.endswith(b'\xff\xd9'):
+            parts.append(b'\xff\xd9')
+        self._pending = None
+        self._last_done_ts = rtp_ts
+        stats['frames'] += 1
+        return b''.join(parts), rtp_ts
+
+
+_receivers_lock = threading.Lock()
+_receivers = {}
+
+
+class RtpJpegReceiver:
+    """UDP socket + depacketizer on a daemon thread; keeps only the newest complete JPEG."""
+
+    def __init__(self, port, host='0.0.0.0', on_frame=None, rcvbuf=4 * 1048576):
+        self.port = int(port)
+        self.host = host
+        self.on_frame = on_frame     # (jpeg bytes, wall ts) on the receiver thread
+        self.rcvbuf = rcvbuf
+        self.depacketizer = RtpJpegDepacketizer()
+        self._cond = threading.Condition()
+        self._latest = (0, 0.0, None)
+        self.latest_rtp_ts = None    # RTP timestamp of the newest frame (90 kHz sender clock)
+        self._stop = threading.Event()
+        self._thread = None
+        self._sock = None
+
+    def start(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+        except OSError:
+            pass
+        sock.bind((self.host, self.port))
+        sock.settimeout(0.2)
+        self._sock = sock
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f'rtp-jpeg:{self.port}', daemon=True)
+        self._thread.start()
+        with _receivers_lock:
+            _receivers[self.port] = self
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        with _receivers_lock:
+            if _receivers.get(self.port) is self:
+                del _receivers[self.port]
+
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        sock = self._sock
+        feed = self.depacketizer.feed
+        while not self._stop.is_set():
+            try:
+                packet = sock.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            now = time.time()
+            done = feed(packet, now)
+            if done is None:
+                continue
+            jpeg, self.latest_rtp_ts = done
+            with self._cond:
+                self._latest = (self._latest[0] + 1, now, jpeg)
+                self._cond.notify_all()
+            if self.on_frame is not None:
+                try:
+                    self.on_frame(jpeg, now)
+                except Exception:
+                    pass
+
+    def latest(self):
+        """(frame count, wall-clock arrival ts, JPEG bytes); count 0 / None before the first frame."""
+        with self._cond:
+            return self._latest
+
+    def wait_frame(self, after_seq, timeout):
+        """Block until a frame newer than after_seq arrives (or timeout); returns latest()."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._latest[0] > after_seq, timeout)
+            return self._latest
+
+    def snapshot(self):
+        return dict(self.depacketizer.stats, port=self.port, latest=self._latest[0])
+
+
+def snapshot():
+    with _receivers_lock:
+        receivers = list(_receivers.values())
+    return {rx.port: rx.snapshot() for rx in receivers}
+
+
+# ---- test sender ----
+def parse_jpeg(data):
+    """Split a baseline YCbCr JPEG into what RFC 2435 carries:
+    (type, width, height, qtables, precision, restart interval, scan bytes)."""
+    qtables = {}
+    pos = 2
+    width = height = None
+    jpeg_type = None
+    restart_interval = 0
+    n = len(data)
+    while pos + 4 <= n:
+        if data[pos] != 0xFF:
+            raise ValueError(f'bad marker at {pos}')
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        length = struct.unpack_from('!H', data, pos + 2)[0]
+        body = data[pos + 4:pos + 2 + length]
+        if marker == 0xDB:
+            i = 0
+            while i < len(body):
+                pq, tq = body[i] >> 4, body[i] & 0x0F
+                size = 128 if pq else 64
+                qtables[tq] = (pq, bytes(body[i + 1:i + 1 + size]))
+                i += 1 + size
+        elif marker == 0xC0:
+            height, width = struct.unpack_from('!HH', body, 1)
+            if body[5] != 3:
+                raise ValueError('RFC 2435 needs 3-component YCbCr')
+            sampling = body[7]
+            if sampling == 0x21:
+                jpeg_type = 0
+            elif sampling == 0x22:
+                jpeg_type = 1
+            else:
+                raise ValueError(f'unsupported luma sampling {sampling:#x}')
+        elif marker in (0xC1, 0xC2, 0xC3):
+            raise ValueError('only baseline JPEG can be sent as RTP/JPEG')
+        elif marker == 0xDD:
+            restart_interval = struct.unpack_from('!H', body, 0)[0]
+        elif marker == 0xDA:
+            scan = data[pos + 2 + length:]
+            if scan.endswith(b'\xff\xd9'):
+                scan = scan[:-2]
+            if jpeg_type is None or not qtables:
+                raise ValueError('missing SOF0/DQT before SOS')
+            ids = sorted(qtables)[:2]
+            precision = sum(1 << i for i, tq in enumerate(ids) if qtables[tq][0])
+            tables = b''.join(qtables[tq][1] for tq in ids)
+            return jpeg_type, width, height, tables, precision, restart_interval, bytes(scan)
+        pos += 2 + length
+    raise ValueError('no SOS marker')
+
+
+def packetize_jpeg(data, seq, rtp_ts, ssrc, max_payload=DEFAULT_MTU_PAYLOAD):
+    """RTP/JPEG packets for one JPEG (Q=255, tables in-band). Returns (packets, next seq)."""
+    jpeg_type, width, height, qtables, precision, restart_interval, scan = parse_jpeg(data)
+    if width > 2040 or height > 2040 or width % 8 or height % 8:
+        raise ValueError(f'{width}x{height}: RFC 2435 needs multiples of 8 up to 2040')
+    extra = b''
+    if restart_interval:
+        jpeg_type += 64
+        extra = _RESTART_HDR.pack(restart_interval, 0xFFFF)   # F=L=1, count 0x3FFF: whole frame
+    packets = []
+    offset = 0
+    while offset < len(scan) or not packets:
+        head = _JPEG_HDR.pack(offset, jpeg_type, 255, width // 8, height // 8) + extra
+        if offset == 0:
+            head += _QTABLE_HDR.pack(0, precision, len(qtables)) + qtables
+        chunk = scan[offset:offset + max(1, max_payload - len(head))]
+        offset += len(chunk)
+        marker = 0x80 if offset >= len(scan) else 0
+        packets.append(_RTP.pack(0x80, marker | RTP_PAYLOAD_JPEG, seq & 0xFFFF, rtp_ts & 0xFFFFFFFF, ssrc) + head + chunk)
+        seq += 1
+    return packets, seq
+
+
+def _test_pattern_jpegs(width, height, count=30):
+    import cv2
+    import numpy as np
+    base = np.zeros((height, width, 3), np.uint8)
+    base[:, :, 0] = np.linspace(0, 255, width, dtype=np.uint8)[None, :]
+    frames = []
+    for i in range(count):
+        image = base.copy()
+        x = (i * width // count)
+        image[:, x:x + 16] = 255
+        ok, buf = cv2.imencode('.jpg', image)
+        if ok:
+            frames.append(buf.tobytes())
+    return frames
+
+
+def run_sender(host, port, jpegs, fps=30.0, seconds=0.0, frames=0, max_payload=DEFAULT_MTU_PAYLOAD, start_at=None):
+    """Replay JPEGs as RTP/JPEG at `fps` (0 = as fast as possible). Returns (frames, packets, bytes) sent."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    ssrc = int.from_bytes(os.urandom(4), 'big')
+    packetized = []
+    seq = 0
+    for data in jpegs:
+        packets, _ = packetize_jpeg(data, 0, 0, ssrc, max_payload)
+        packetized.append(packets)
+    period = 1.0 / fps if fps > 0 else 0.0
+    start = time.time() if start_at is None else start_at
+    if start_at is not None:
+        time.sleep(max(0.0, start_at - time.time()))
+    t_end = start + seconds if seconds > 0 else None
+    sent_frames = sent_packets = sent_bytes = 0
+    try:
+        while (t_end is None or time.time() < t_end) and (frames <= 0 or sent_frames < frames):
+            rtp_ts = (sent_frames * RTP_CLOCK_HZ // int(fps)) if fps > 0 else sent_frames * 3000
+            for packet in packetized[sent_frames % len(packetized)]:
+                # 미리 나눈 패킷에 seq/ts만 다시 씀
+                out = bytearray(packet)
+                struct.pack_into('!HI', out, 2, seq & 0xFFFF, rtp_ts & 0xFFFFFFFF)
+                sock.sendto(out, (host, port))
+                seq += 1
+                sent_packets += 1
+                sent_bytes += len(out)
+            sent_frames += 1
+            if period:
+                time.sleep(max(0.0, start + sent_frames * period - time.time()))
+    finally:
+        sock.close()
+    return sent_frames, sent_packets, sent_bytes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RTP/JPEG (RFC 2435) test sender / receiver")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('send', help='replay JPEG files (or a test pattern) as RTP/JPEG')
+    p.add_argument('files', nargs='*', help='JPEG files or a folder (default: test pattern)')
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=9400)
+    p.add_argument('--fps', type=float, default=30.0, help='0 = as fast as possible')
+    p.add_argument('--seconds', type=float, default=0.0)
+    p.add_argument('--frames', type=int, default=0)
+    p.add_argument('--size', default='640x480', help='test pattern size')
+    p.add_argument('--mtu', type=int, default=DEFAULT_MTU_PAYLOAD)
+    p = sub.add_parser('recv', help='receive and print counters, optionally into a frame ring')
+    p.add_argument('--port', type=int, default=9400)
+    p.add_argument('--ring', default='', help='core.frame_bus ring key to write frames into')
+    p.add_argument('--interval', type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'send':
+        paths = []
+        for item in args.files:
+            paths.extend(sorted(glob.glob(os.path.join(item, '*.jpg'))) if os.path.isdir(item) else [item])
+        if paths:
+            jpegs = []
+            for path in paths:
+                with open(path, 'rb') as f:
+                    jpegs.append(f.read())
+        else:
+            width, height = (int(v) for v in args.size.lower().split('x'))
+            jpegs = _test_pattern_jpegs(width, height)
+        t0 = time.time()
+        sent_frames, sent_packets, sent_bytes = run_sender(args.host, args.port, jpegs, args.fps, args.seconds,
+                                                           args.frames, args.mtu)
+        elapsed = max(1e-6, time.time() - t0)
+        print(f"[rtp_jpeg] sent {sent_frames} frames / {sent_packets} packets, "
+              f"{sent_frames / elapsed:.1f} fps, {sent_bytes * 8 / elapsed / 1e6:.1f} Mbit/s")
+        return 0
+
+    on_frame = None
+    if args.ring:
+        from core import frame_bus
+        ring = frame_bus.open_writer(args.ring)
+        on_frame = ring.write_jpeg
+    receiver = RtpJpegReceiver(args.port, on_frame=on_frame).start()
+    print(f"[rtp_jpeg] listening on :{args.port}" + (f" -> ring {args.ring}" if args.ring else ''), flush=True)
+    try:
+        while True:
+            time.sleep(args.interval)
+            print(receiver.snapshot(), flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        receiver.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
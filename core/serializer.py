@@ -1,7 +1,10 @@
 import os
 import json
-import dearpygui.dearpygui as dpg
-from core.engine import SAVE_DIR, write_log, node_registry, link_registry
+try:
+    import dearpygui.dearpygui as dpg
+except ImportError:
+    dpg = None  # 헤드리스 실행(--headless)에서는 DPG 없이 load_graph_headless()만 사용
+from core.engine import SAVE_DIR, PortType, write_log, node_registry, link_registry, add_link, clear_links, clear_nodes, unregister_node, generate_uuid
 from core.factory import NodeFactory
 
 
@@ -112,6 +115,95 @@ def save_graph(filename):
     except Exception as e: 
         write_log(f"Save Err: {e}")
 
+def _resolve_save_path(filename):
+    if not isinstance(filename, str) or not filename.strip():
+        return None
+    filename = filename.strip()
+    if not filename.endswith(".json"):
+        filename += ".json"
+    if os.path.exists(filename):
+        return filename
+    return os.path.join(SAVE_DIR, filename)
+
+
+def _headless_flow_in(node, slot):
+    """Flow input the UI renderer would have created ("Flow In", LOGIC_LOOP "Loop Back"): one port per saved index."""
+    ports = node.__dict__.setdefault('_headless_flow_ins', {})
+    port = ports.get(slot)
+    if port is None:
+        port = ports[slot] = generate_uuid()
+        node.inputs[port] = PortType.FLOW
+    return port
+
+def load_graph_headless(filename):
+    """Rebuild node_registry/link_registry from a saved graph without DearPyGui.
+
+    Node positions are ignored; settings and links are restored the same way as load_graph().
+    Accepts either a file name inside SAVE_DIR or a direct path. Returns True on success.
+    """
+    filepath = _resolve_save_path(filename)
+    if not filepath or not os.path.exists(filepath):
+        write_log(f"Load Err: file not found. ({filename})")
+        return False
+
+    try:
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+    except Exception as e:
+        write_log(f"Load Err: {e}")
+        return False
+
+    clear_links()
+    clear_nodes()
+
+    id_map = {}
+    for n_data in data.get("nodes", []):
+        if not isinstance(n_data, dict):
+            continue
+        node_type = n_data.get("type")
+        old_id = n_data.get("id")
+        if not node_type or old_id is None:
+            continue
+        settings = n_data.get("settings", {})
+        if node_type == "MT4_DRIVER" and any(k in settings for k in ["vx", "vy", "vyaw", "body_height"]):
+            node_type = "GO1_DRIVER"
+        node = NodeFactory.create_node(node_type)
+        if not node:
+            write_log(f"Load Warn: skipping unknown node type. ({node_type})")
+            continue
+        try:
+            node.load_settings(settings)
+        except Exception as node_err:
+            write_log(f"Load Warn: failed to restore settings (type={node_type}, id={old_id}) - {node_err}")
+        id_map[str(old_id)] = node.node_id
+
+    # 포트는 모두 먼저 해석한다: 헤드리스 Flow 포트를 만들면 그 뒤 링크의 인덱스 해석이 달라지므로
+    resolved = []
+    for l_data in data.get("links", []):
+        if not isinstance(l_data, dict):
+            continue
+        src_key = str(l_data.get("src_node"))
+        dst_key = str(l_data.get("dst_node"))
+        if src_key not in id_map or dst_key not in id_map:
+            continue
+        src_node = node_registry[id_map[src_key]]
+        dst_node = node_registry[id_map[dst_key]]
+        src_attr = _resolve_port_with_fallback(src_node, "output", saved_name=l_data.get("src_name"),
+                                               saved_idx=l_data.get("src_idx"), saved_attr=l_data.get("src_attr"))
+        dst_attr = _resolve_port_with_fallback(dst_node, "input", saved_name=l_data.get("dst_name"),
+                                               saved_idx=l_data.get("dst_idx"), saved_attr=l_data.get("dst_attr"))
+        resolved.append((src_key, dst_key, src_node, dst_node, src_attr, dst_attr, l_data.get("dst_idx")))
+
+    for src_key, dst_key, src_node, dst_node, src_attr, dst_attr, dst_idx in resolved:
+        if dst_attr is None and src_attr and src_node.outputs.get(src_attr) == PortType.FLOW:
+            # "Flow In"/"Loop Back" 포트는 UI 렌더러가 만들기 때문에 헤드리스 노드에는 없음 → 저장된 인덱스별로 생성해 연결
+            dst_attr = _headless_flow_in(dst_node, dst_idx)
+        if src_attr and dst_attr:
+            add_link(generate_uuid(), src_attr, dst_attr, id_map[src_key], id_map[dst_key])
+
+    write_log(f"Loaded (headless): {os.path.basename(filepath)} - {len(node_registry)} nodes, {len(link_registry)} links")
+    return True
+
 def load_graph(filename):
     from ui.dpg_manager import clear_editor, NodeUIRenderer, set_item_pos_safe, add_dpg_link
 
@@ -172,11 +264,11 @@ def load_graph(filename):
             except Exception as node_err:
                 # 개별 노드 복원 실패가 전체 로드를 중단하지 않도록 격리한다.
                 try:
-                    if dpg.does_item_exist(node.node_id):
+                    if dpg is not None and dpg.does_item_exist(node.node_id):
                         dpg.delete_item(node.node_id)
                 except Exception:
                     pass
-                node_registry.pop(node.node_id, None)
+                unregister_node(node.node_id)
                 write_log(f"Load Warn: failed to restore node (type={node_type}, id={old_id}) - {node_err}")
                 
         for l_data in data.get("links", []):
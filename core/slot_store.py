@@ -0,0 +1,274 @@
+"""Fixed-slot JPEG file ring on disk (tmpfs): one writer, any number of readers.
+
+For setups that hand camera frames over as files (frame_bus disabled, external
+tools reading the folder) instead of a file per frame that someone later has to
+glob, sort and delete. A store is a folder with
+
+    slot_0000.jpg .. slot_{N-1}.jpg : JPEG bytes of frame n live in slot n % N
+    latest.idx                      : magic, version, slots, slot, seq, ts, nbytes, seq
+
+The writer keeps every slot file and latest.idx open and overwrites them in place
+(pwrite + ftruncate): publishing frame n rewrites its slot file and only then
+rewrites the fixed-size latest.idx, so latest.idx only ever names a slot whose
+write has finished. No file is created, renamed or deleted per frame and no
+cleanup is needed; the files only come back when the folder itself was reset.
+
+Because slots are rewritten in place, readers go through latest.idx: read
+`nbytes` from the named slot, then re-read latest.idx. The data is whole as long
+as the writer has not started the same slot again, i.e. the newest seq is still
+below seq + N - 1 (read() checks this and otherwise reports a torn read).
+latest.idx carries seq twice, so a reader that catches it mid-rewrite sees a
+mismatch and treats it as "no new frame".
+
+Writers: `python -m core.slot_store gst` (Go1 RTP/JPEG receiver when the
+frame ring is off) and VIS_SAVE's rolling Max Frames window.
+"""
+import argparse
+import os
+import signal
+import struct
+import sys
+import threading
+import time
+
+from core.engine_config import SLOT_STORE_CONFIG
+
+INDEX_NAME = 'latest.idx'
+
+_MAGIC = b'PGSS'
+_VERSION = 2
+_INDEX = struct.Struct('<4sIIIQdQQ')   # magic, version, slots, slot, seq, ts, nbytes, seq (중간 갱신 감지)
+
+# latest.idx check period for readers outside the engine tick (uploaders)
+POLL_SEC = float(SLOT_STORE_CONFIG.get('poll_sec', 0.005))
+
+
+def slot_name(slot):
+    return f'slot_{slot:04d}.jpg'
+
+
+def index_path(folder):
+    return os.path.join(folder, INDEX_NAME)
+
+
+def is_store(folder):
+    return os.path.isfile(index_path(folder))
+
+
+def read_index(folder):
+    """(slots, slot, seq, ts, nbytes) from latest.idx, None if there is no (valid) index."""
+    try:
+        with open(index_path(folder), 'rb') as f:
+            raw = f.read(_INDEX.size)
+    except OSError:
+        return None
+    if len(raw) != _INDEX.size:
+        return None
+    magic, version, slots, slot, seq, ts, nbytes, seq_check = _INDEX.unpack(raw)
+    if magic != _MAGIC or version != _VERSION or seq != seq_check:
+        return None
+    return slots, slot, seq, ts, nbytes
+
+
+class SlotStore:
+    def __init__(self, folder, slots=None, writer=False):
+        self.folder = folder
+        self.writer = writer
+        self.slots = max(2, int(slots or SLOT_STORE_CONFIG.get('slots', 8)))
+        self.seq = 0
+        self.stats = {'written': 0, 'read': 0, 'missing': 0, 'torn': 0}
+        self._fds = []          # writer: slot file fds (slot 순서)
+        self._index_fd = None
+        if writer:
+            self._open_writer()
+
+    # ---- writer ----
+    def _open_writer(self):
+        self.close()
+        os.makedirs(self.folder, exist_ok=True)
+        index = read_index(self.folder)
+        if index is not None:
+            # 이전 실행의 seq를 이어감 (읽는 쪽의 마지막 seq가 되돌아가지 않도록)
+            old_slots, self.seq = index[0], index[2]
+            for slot in range(self.slots, old_slots):
+                try:
+                    os.remove(os.path.join(self.folder, slot_name(slot)))
+                except OSError:
+                    pass
+        # 슬롯 파일과 latest.idx를 한 번만 만들어 열어 두고 이후에는 제자리에 덮어씀
+        self._fds = [os.open(os.path.join(self.folder, slot_name(slot)), os.O_RDWR | os.O_CREAT, 0o644)
+                     for slot in range(self.slots)]
+        self._index_fd = os.open(index_path(self.folder), os.O_RDWR | os.O_CREAT, 0o644)
+
+    def close(self):
+        for fd in self._fds + ([self._index_fd] if self._index_fd is not None else []):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds, self._index_fd = [], None
+
+    def publish(self, data, ts=None):
+        """Overwrite the next slot with JPEG `data`, then point latest.idx at it. Returns its seq."""
+        data = memoryview(data).cast('B')   # bytes 또는 cv2.imencode 결과 (N, 1) 배열
+        if os.fstat(self._index_fd).st_nlink == 0:
+            self._open_writer()   # 폴더가 초기화됨(파일 삭제): 파일을 다시 만듦
+        seq = self.seq + 1
+        slot = seq % self.slots
+        ts = time.time() if ts is None else float(ts)
+        fd = self._fds[slot]
+        os.pwrite(fd, data, 0)
+        os.ftruncate(fd, len(data))   # 이전 프레임이 더 컸으면 꼬리를 잘라 일반 JPEG 파일로 유지
+        # 슬롯 쓰기가 끝난 뒤에만 latest.idx를 갱신 (고정 크기라 제자리 덮어쓰기)
+        os.pwrite(self._index_fd, _INDEX.pack(_MAGIC, _VERSION, self.slots, slot, seq, ts, len(data), seq), 0)
+        self.seq = seq
+        self.stats['written'] += 1
+        return seq
+
+    # ---- reader ----
+    def latest_seq(self):
+        index = read_index(self.folder)
+        return index[2] if index is not None else 0
+
+    def read(self, last_seq=None):
+        """(seq, ts, path, JPEG bytes) of the newest complete frame; None if the store is empty/gone
+        or the newest seq is still `last_seq` (then only latest.idx is read)."""
+        index = read_index(self.folder)
+        if index is None or index[2] <= 0 or index[2] == last_seq:
+            return None
+        slots, slot, seq, ts, nbytes = index
+        path = os.path.join(self.folder, slot_name(slot))
+        try:
+            with open(path, 'rb') as f:
+                data = f.read(nbytes)
+        except OSError:
+            self.stats['missing'] += 1   # 폴더가 초기화된 경우 등
+            return None
+        # 읽는 동안 writer가 링을 한 바퀴 돌아 같은 슬롯을 다시 쓰기 시작했으면 버림
+        after = read_index(self.folder)
+        if len(data) != nbytes or after is None or after[2] >= seq + slots - 1:
+            self.stats['torn'] += 1
+            return None
+        self.stats['read'] += 1
+        return seq, ts, path, data
+
+    def snapshot(self):
+        index = read_index(self.folder)
+        return dict(self.stats, folder=self.folder, slots=index[0] if index else self.slots,
+                    latest=index[2] if index else 0)
+
+
+# ---- in-process store registry ----
+_lock = threading.Lock()
+_writers = {}
+_readers = {}
+
+
+def enabled():
+    return bool(SLOT_STORE_CONFIG.get('enabled', True))
+
+
+def open_writer(folder, slots=None):
+    """Store this process publishes into (created on first use, re-created when `slots` changes)."""
+    key = os.path.abspath(folder)
+    with _lock:
+        store = _writers.get(key)
+        if store is None or (slots is not None and store.slots != max(2, int(slots))):
+            if store is not None:
+                store.close()
+            store = _writers[key] = SlotStore(folder, slots, writer=True)
+        return store
+
+
+def open_reader(folder):
+    """Store in `folder`, None while nobody has published into it (or after the folder was reset)."""
+    key = os.path.abspath(folder)
+    with _lock:
+        store = _writers.get(key)
+        if store is not None:
+            return store
+        if not is_store(folder):
+            _readers.pop(key, None)
+            return None
+        return _readers.setdefault(key, SlotStore(folder))
+
+
+def snapshot():
+    with _lock:
+        stores = list(_writers.items()) + list(_readers.items())
+    return {key: store.snapshot() for key, store in stores}
+
+
+# ---- writers (helper processes) ----
+def run_gst_writer(folder, port, slots=None, caps=None):
+    """Go1 receiver: RTP/JPEG on `port` -> depayloaded JPEGs -> slot files in `folder`. Blocks until gst exits."""
+    from core.frame_bus import iter_gst_jpegs
+    store = open_writer(folder, slots)
+    print(f"[slot_store] gst RTP/JPEG :{port} -> {folder} ({store.slots} slots)", flush=True)
+    for jpeg, ts in iter_gst_jpegs(port, caps):
+        store.publish(jpeg, ts)
+    return 0
+
+
+def run_synthetic_writer(folder, fps=30.0, width=640, height=480, slots=None, seconds=0.0):
+    """Test pattern producer (no robot needed): a moving bar, JPEG-encoded."""
+    import cv2
+    import numpy as np
+    store = open_writer(folder, slots)
+    period = 1.0 / max(1.0, float(fps))
+    image = np.zeros((height, width, 3), np.uint8)
+    print(f"[slot_store] synthetic {width}x{height} @ {fps:.0f} fps -> {folder} ({store.slots} slots)", flush=True)
+    t_end = time.monotonic() + seconds if seconds > 0 else None
+    next_t = time.monotonic()
+    i = 0
+    try:
+        while t_end is None or time.monotonic() < t_end:
+            image[:] = 0
+            x = (i * 8) % width
+            image[:, x:x + 16] = 255
+            ok, buf = cv2.imencode('.jpg', image)
+            if ok:
+                store.publish(buf)
+            i += 1
+            next_t += period
+            time.sleep(max(0.0, next_t - time.monotonic()))
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="fixed-slot JPEG file ring writers / inspector")
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('gst', help='Go1 RTP/JPEG receiver -> slot files')
+    p.add_argument('--dir', required=True)
+    p.add_argument('--port', type=int, required=True)
+    p.add_argument('--slots', type=int, default=None)
+    p = sub.add_parser('synthetic', help='test pattern -> slot files')
+    p.add_argument('--dir', required=True)
+    p.add_argument('--fps', type=float, default=30.0)
+    p.add_argument('--size', default='640x480')
+    p.add_argument('--slots', type=int, default=None)
+    p.add_argument('--seconds', type=float, default=0.0)
+    p = sub.add_parser('info', help='print a store index')
+    p.add_argument('--dir', required=True)
+    args = parser.parse_args(argv)
+    # pkill/terminate() from the camera worker: unwind through the gst generator's finally
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    if args.cmd == 'gst':
+        return run_gst_writer(args.dir, args.port, args.slots)
+    if args.cmd == 'synthetic':
+        width, height = (int(v) for v in args.size.lower().split('x'))
+        run_synthetic_writer(args.dir, args.fps, width, height, args.slots, args.seconds)
+        return 0
+    index = read_index(args.dir)
+    if index is None:
+        print(f"{index_path(args.dir)}: not found")
+        return 1
+    slots, slot, seq, ts, nbytes = index
+    print({'slots': slots, 'slot': slot, 'seq': seq, 'nbytes': nbytes}, f"latest age {time.time() - ts:.3f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import heapq
+import threading
+import time
+
+
+class TimerService:
+    """Deadlines for interval-gated nodes (BaseNode.TIMER_GATED).
+
+    A gated node arms its next deadline from execute() (BaseNode.schedule_after()).
+    While the deadline is in the future the engine skips the node's per-tick run
+    instead of calling execute() just to compare time.monotonic() with a stamp.
+    A node with no armed deadline runs every tick as before, so a node that does
+    not re-arm never goes dead. post_wake() (I/O finished, socket readable) makes
+    an armed node due immediately; a wake that lands while the node is running
+    (before it re-arms) makes its next deadline immediate.
+
+    One deadline per node; a min-heap with lazy deletion keeps next_deadline() and
+    upcoming() cheap (entries whose deadline changed are dropped when popped).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._deadlines = {}   # node_id -> (deadline, label)
+        self._heap = []        # (deadline, node_id)
+        self._woken = set()    # woken while not armed (e.g. I/O finished inside execute())
+        self.generation = None
+        self.stats = {'armed': 0, 'fired': 0, 'skipped': 0, 'expired_by_wake': 0}
+
+    def schedule_at(self, node_id, deadline, label=''):
+        with self._lock:
+            if node_id in self._woken:
+                # execute() 도중 들어온 웨이크가 이 마감보다 먼저: 다음 틱에 바로 실행
+                self._woken.discard(node_id)
+                deadline = 0.0
+            self._deadlines[node_id] = (deadline, label)
+            heapq.heappush(self._heap, (deadline, node_id))
+            self.stats['armed'] += 1
+            if len(self._heap) > 4 * len(self._deadlines) + 64:
+                # 고정 주기 러너는 next_deadline()을 부르지 않으므로 지난 항목을 여기서 정리
+                self._heap = [(d, nid) for nid, (d, _) in self._deadlines.items()]
+                heapq.heapify(self._heap)
+
+    def schedule(self, node_id, delay_sec, label=''):
+        self.schedule_at(node_id, time.monotonic() + max(0.0, float(delay_sec)), label)
+
+    def cancel(self, node_id):
+        with self._lock:
+            self._deadlines.pop(node_id, None)
+
+    def expire(self, node_id):
+        """Make an armed node due now (wake source fired before its deadline)."""
+        with self._lock:
+            entry = self._deadlines.get(node_id)
+            if entry is None:
+                self._woken.add(node_id)
+                return
+            self._deadlines[node_id] = (0.0, entry[1])
+            heapq.heappush(self._heap, (0.0, node_id))
+            self.stats['expired_by_wake'] += 1
+
+    def due(self, node_id, now=None):
+        """True if the node should run this tick; a due deadline is consumed."""
+        entry = self._deadlines.get(node_id)
+        if entry is None:
+            self._woken.discard(node_id)
+            return True
+        if now is None:
+            now = time.monotonic()
+        if entry[0] > now:
+            with self._lock:   # 워커 풀/그룹 러너 스레드에서도 호출됨
+                self.stats['skipped'] += 1
+            return False
+        with self._lock:
+            if self._deadlines.get(node_id) is entry:
+                del self._deadlines[node_id]
+            self._woken.discard(node_id)
+            self.stats['fired'] += 1
+        return True
+
+    def _prune(self):
+        heap = self._heap
+        while heap:
+            deadline, node_id = heap[0]
+            entry = self._deadlines.get(node_id)
+            if entry is not None and entry[0] == deadline:
+                return
+            heapq.heappop(heap)
+
+    def next_deadline(self):
+        with self._lock:
+            self._prune()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now=None):
+        """Armed node_ids whose deadline has passed; their deadlines are consumed
+        (the event-driven runner wakes them, and unarmed nodes run when reached)."""
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            due = {nid for nid, (deadline, _) in self._deadlines.items() if deadline <= now}
+            for nid in due:
+                del self._deadlines[nid]
+            self.stats['fired'] += len(due)
+        return due
+
+    def upcoming(self, limit=8):
+        """[(node_id, label, due_in_sec)] soonest first, for the Performance tab."""
+        now = time.monotonic()
+        with self._lock:
+            items = heapq.nsmallest(limit, ((d, nid, label) for nid, (d, label) in self._deadlines.items()))
+        return [(nid, label, max(0.0, d - now)) for d, nid, label in items]
+
+    def reset(self, generation=None):
+        with self._lock:
+            self._deadlines.clear()
+            self._heap.clear()
+            self._woken.clear()
+            self.generation = generation
+
+    def forget(self, keep_ids):
+        with self._lock:
+            for nid in [nid for nid in self._deadlines if nid not in keep_ids]:
+                del self._deadlines[nid]
+            self._woken &= set(keep_ids)
+
+    def snapshot(self):
+        with self._lock:
+            armed = len(self._deadlines)
+        return dict(self.stats, pending=armed)
+
+
+engine_timers = TimerService()
@@ -0,0 +1,165 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.engine_config import WATCHDOG_CONFIG, RUNNER_CONFIG
+from core.profiler import node_profiler
+
+
+class TickWatchdog:
+    """Per-node time slice enforcement for the engine tick.
+
+    observe() is fed the execute() duration of every demotable node. A node that
+    exceeds its slice repeatedly (strikes, decaying by one on each in-budget run) is
+    demoted: the engine stops calling it inline and kick()s it onto a background
+    worker instead, one run in flight at a time. Because execute() writes
+    output_data itself, downstream nodes simply read the latest published result.
+    A demoted node is promoted back after `promote_after` consecutive in-budget
+    background runs.
+    """
+    def __init__(self, config=None, log_fn=None):
+        cfg = dict(config or {})
+        self.enabled = bool(cfg.get('enabled', True))
+        tick_ms = 1000.0 / max(1.0, float(RUNNER_CONFIG.get('tick_rate_hz', 50.0)))
+        self.slice_sec = float(cfg.get('node_slice_ms', tick_ms * 0.5)) / 1000.0
+        self.strike_limit = max(1, int(cfg.get('strikes_to_demote', 5)))
+        self.promote_after = max(1, int(cfg.get('promote_after', 50)))
+        self.log_interval_sec = float(cfg.get('log_interval_sec', 5.0))
+        self.bg_workers = max(1, int(cfg.get('background_workers', 2)))
+        self.log_fn = log_fn or print
+        # 백그라운드 실행 결과 훅 (engine이 node_quarantine.report/success로 설정)
+        self.on_error = None
+        self.on_success = None
+        # graph_lock 없이 실행되므로 실행 직전 노드가 아직 그래프에 있는지 확인 (engine이 설정)
+        self.is_live = None
+
+        self._lock = threading.Lock()
+        self._strikes = {}
+        self._demoted = {}       # node_id -> {'future', 'good_runs', 'runs', 'last_ms', 'label'}
+        self._overrun_log = {}   # node_id -> [last_log_time, suppressed_count]
+        self._pool = None
+        self.generation = None
+        self.stats = {'overruns': 0, 'demotions': 0, 'promotions': 0, 'bg_runs': 0, 'bg_busy_skips': 0}
+
+    # ---- inline path (engine thread) ----
+    def is_demoted(self, node_id):
+        return node_id in self._demoted
+
+    def observe(self, node, dt):
+        if dt <= self.slice_sec:
+            strikes = self._strikes.get(node.node_id)
+            if strikes:
+                self._strikes[node.node_id] = strikes - 1
+            return
+        with self._lock:   # observe()는 워커 풀의 컴포넌트 스레드에서도 호출됨
+            self.stats['overruns'] += 1
+        strikes = self._strikes.get(node.node_id, 0) + 1
+        self._strikes[node.node_id] = strikes
+        self._log_overrun(node, dt)
+        if strikes >= self.strike_limit:
+            self._demote(node, dt)
+
+    def _log_overrun(self, node, dt):
+        now = time.monotonic()
+        entry = self._overrun_log.get(node.node_id)
+        if entry is None:
+            entry = self._overrun_log[node.node_id] = [0.0, 0]
+        if now - entry[0] < self.log_interval_sec:
+            entry[1] += 1
+            return
+        suppressed = entry[1]
+        entry[0], entry[1] = now, 0
+        extra = f" (+{suppressed} more since last report)" if suppressed else ""
+        self.log_fn(f"[Watchdog] {node.label} ({node.type_str}) {dt * 1000.0:.1f} ms > slice {self.slice_sec * 1000.0:.1f} ms{extra}")
+
+    def _demote(self, node, dt):
+        with self._lock:
+            if node.node_id in self._demoted:
+                return
+            self._demoted[node.node_id] = {'future': None, 'good_runs': 0, 'runs': 0, 'last_ms': dt * 1000.0, 'label': node.label}
+            self.stats['demotions'] += 1
+        self._strikes.pop(node.node_id, None)
+        self.log_fn(f"[Watchdog] {node.label} ({node.type_str}) moved to background execution "
+                    f"({self.strike_limit} overruns, last {dt * 1000.0:.1f} ms)")
+
+    def kick(self, node):
+        """Start one background execute() for a demoted node unless one is still running."""
+        entry = self._demoted.get(node.node_id)
+        if entry is None:
+            return
+        fut = entry['future']
+        if fut is not None and not fut.done():
+            with self._lock:
+                self.stats['bg_busy_skips'] += 1
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.bg_workers, thread_name_prefix="engine-bg")
+        entry['future'] = self._pool.submit(self._run_background, node, entry)
+
+    # ---- background path ----
+    def _run_background(self, node, entry):
+        if self.is_live is not None and not self.is_live(node):
+            # 대기 중 GUI에서 삭제/교체된 노드: 실행하지 않고 강등 기록만 정리
+            with self._lock:
+                if self._demoted.get(node.node_id) is entry:
+                    del self._demoted[node.node_id]
+            return
+        t0 = time.perf_counter()
+        try:
+            node.execute()
+        except Exception as e:
+            if self.on_error is not None:
+                self.on_error(node, e)
+            else:
+                print(f"[{node.label}] Error: {e}")
+        else:
+            if self.on_success is not None:
+                self.on_success(node)
+        dt = time.perf_counter() - t0
+        if node_profiler.enabled:
+            node_profiler.record(node, dt)
+        with self._lock:
+            self.stats['bg_runs'] += 1
+        entry['runs'] += 1
+        entry['last_ms'] = dt * 1000.0
+        if dt <= self.slice_sec:
+            entry['good_runs'] += 1
+            if entry['good_runs'] >= self.promote_after:
+                with self._lock:
+                    self._demoted.pop(node.node_id, None)
+                    self.stats['promotions'] += 1
+                self.log_fn(f"[Watchdog] {node.label} ({node.type_str}) back to inline execution "
+                            f"({self.promote_after} runs within {self.slice_sec * 1000.0:.1f} ms)")
+        else:
+            entry['good_runs'] = 0
+
+    # ---- housekeeping ----
+    def reset(self, generation=None):
+        with self._lock:
+            self._demoted.clear()
+        self._strikes.clear()
+        self._overrun_log.clear()
+        self.generation = generation
+
+    def forget(self, live_node_ids):
+        """Drop bookkeeping for nodes that no longer exist."""
+        with self._lock:
+            for nid in [nid for nid in self._demoted if nid not in live_node_ids]:
+                del self._demoted[nid]
+        for d in (self._strikes, self._overrun_log):
+            for nid in [nid for nid in d if nid not in live_node_ids]:
+                del d[nid]
+
+    def snapshot(self):
+        with self._lock:
+            demoted = [{'node_id': nid, 'label': e['label'], 'runs': e['runs'], 'last_ms': round(e['last_ms'], 2)}
+                       for nid, e in self._demoted.items()]
+        return {'slice_ms': round(self.slice_sec * 1000.0, 2), 'demoted': demoted, **self.stats}
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+tick_watchdog = TickWatchdog(WATCHDOG_CONFIG)
@@ -1,6 +1,8 @@
 import sys
 import os
 import glob
+import time
+import argparse
 
 # Append current dir to sys path for submodules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -12,7 +14,7 @@ from nodes.robots.mt4 import init_mt4_serial, auto_reconnect_mt4_thread, mt4_bac
 # Use the worker-based approach (core.ep_manager) to spawn separate processes
 # that load the SDK safely.
 import core.ep_manager as ep_manager
-from ui.dpg_manager import start_gui
+# ui.dpg_manager (DearPyGui) is imported lazily so that --headless runs without a display.
 
 def select_go1_module():
     """Scan and let user select go1 module variant"""
@@ -57,7 +59,50 @@ def select_go1_module():
         print("Invalid input")
         return False
 
+def run_headless(graph_file, rate_hz=None):
+    """Run a saved graph on the engine thread without DearPyGui. Ctrl+C to stop."""
+    import core.engine as engine_module
+    from core.engine_config import RUNNER_CONFIG
+    from core.engine_runner import start_engine_runner, stop_engine_runner
+    from core.async_io import cancel_all_io
+    from core.serializer import load_graph_headless
+
+    if not load_graph_headless(graph_file):
+        print(engine_module.system_log_buffer[-1] if engine_module.system_log_buffer else "Load failed")
+        return 1
+
+    plan = engine_module.compile_plan()
+    if not plan.ok:
+        print(f"[Compile] {len(plan.errors)} error(s), not starting")
+        return 1
+
+    with engine_module.graph_lock:
+        engine_module.is_running = True
+        engine_module.run_generation += 1
+    runner = start_engine_runner(rate_hz)
+
+    log_interval = float(RUNNER_CONFIG.get('stats_log_interval_sec', 10.0))
+    try:
+        while True:
+            time.sleep(log_interval)
+            print(f"[Engine] {runner.snapshot()}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        with engine_module.graph_lock:
+            engine_module.is_running = False
+        cancel_all_io()
+        stop_engine_runner()
+        print(f"[Engine] stopped: {runner.snapshot()}")
+    return 0
+
 def main():
+    parser = argparse.ArgumentParser(description="PyGui Visual Scripting")
+    parser.add_argument('--headless', action='store_true', help="run a saved graph without the GUI")
+    parser.add_argument('--graph', type=str, default=None, help="graph file (name in Node_Files/ or a path) for --headless")
+    parser.add_argument('--rate', type=float, default=None, help="engine tick rate in Hz (default: engine_config.yaml)")
+    args = parser.parse_args()
+
     # Select go1 module variant
     if not select_go1_module():
         print("Continuing without go1 module...")
@@ -72,7 +117,13 @@ def main():
     # controls to start worker processes which will perform SDK initialization.
     # Example: ep_manager.start_workers(configs)
     
+    if args.headless:
+        if not args.graph:
+            parser.error("--headless requires --graph FILE")
+        sys.exit(run_headless(args.graph, args.rate))
+
     # Start DPG main UI
+    from ui.dpg_manager import start_gui
     start_gui()
 
 if __name__ == "__main__":
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
-from core.engine import link_registry, node_registry
+from core.engine import node_registry, get_link_source, ExecRole, FlowVisit, Priority
+from core.async_io import submit_io, engine_io
+from core.timers import engine_timers
+from core.frames import frame_seq
 
 class BaseRobotDriver(ABC):
+    # UniversalRobotNode takes this as its COMPONENT_GROUP (see BaseNode)
+    COMPONENT_GROUP = None
     @abstractmethod
     def get_ui_schema(self): pass
     @abstractmethod
@@ -10,6 +15,31 @@ class BaseRobotDriver(ABC):
     def execute_command(self, inputs, settings): pass
 
 class BaseNode(ABC):
+    # How the engine schedules this node each tick (see core.engine.ExecRole).
+    # FLOW nodes run only when a flow signal reaches them.
+    EXEC_ROLE = ExecRole.FLOW
+    # True for nodes that must keep the tick cadence (robot drivers); never demoted by the watchdog.
+    SAFETY_CRITICAL = False
+    # How repeated activations within one tick are handled (see core.engine.FlowVisit).
+    # MERGE nodes get self.flow_triggers = number of flow pulses that reached them this tick.
+    FLOW_VISIT = FlowVisit.PER_TRIGGER
+    # SAFETY nodes (stop decisions, keyboards, drivers) run ahead of everything else in a tick.
+    PRIORITY = Priority.NORMAL
+    # Rate group for SOURCE/DATA nodes (engine_config.yaml rate_groups); None = default (control).
+    RATE_GROUP = None
+    # Nodes that write the same module globals (a robot's intent/target dicts) share a name here;
+    # the engine keeps them in one component so the worker pool never runs them at the same time.
+    # None = components follow links only.
+    COMPONENT_GROUP = None
+    # True for SOURCE/POLL nodes that only have work at known times: while the deadline
+    # armed with schedule_after() is in the future, the engine skips their per-tick run.
+    TIMER_GATED = False
+
+    # Memoization contract: a PURE node's output_data depends only on its DATA inputs
+    # and self.state. The engine skips execute() and keeps the previous output_data while
+    # the upstream output versions and the settings hash are unchanged and memo_ready() is True.
+    PURE = False
+
     def __init__(self, node_id, label, type_str):
         self.node_id = node_id
         self.label = label
@@ -18,17 +48,97 @@ class BaseNode(ABC):
         self.outputs = {}
         self.output_data = {} 
         self.state = {} 
+        self.output_version = 0   # engine.node_output_version()이 출력 값 변경 시 증가
+        self._out_sig = None
+        self._memo_key = None
+        self._io_requests = {}
+        self.flow_triggers = 0
+        self._frame_seen = {}     # input port -> last Frame.seq seen by fetch_frame()
+        self.demanded_outputs = None  # 링크된 출력 포트 (엔진이 실행 계획 컴파일 시 설정, None = 미컴파일)
     
     @abstractmethod
     def execute(self): 
         return None 
     
     def fetch_input_data(self, input_attr_id):
-        target_link = next((l for l in link_registry.values() if l['target'] == input_attr_id), None)
-        if not target_link: return None 
-        source_node = node_registry.get(target_link['src_node_id'])
-        return source_node.output_data.get(target_link['source']) if source_node else None
-        
+        link_src = get_link_source(input_attr_id)
+        if not link_src: return None 
+        src_node_id, src_port = link_src
+        source_node = node_registry.get(src_node_id)
+        return source_node.output_data.get(src_port) if source_node else None
+
+    def output_demanded(self, output_attr_id):
+        """False if no link reads this output port, so the node may skip computing it
+        (overlays, colormaps, JSON text). Side effects (file/UDP) must not depend on it."""
+        demanded = self.demanded_outputs
+        return demanded is None or output_attr_id in demanded
+
+    def fetch_frame(self, input_attr_id):
+        """(value, is_new) for a frame input (core.frames.Frame or raw image).
+
+        is_new is False when the same Frame (same seq) was already fetched from this
+        port, so vision nodes can keep their previous outputs instead of reprocessing.
+        Raw images carry no seq and are always new; None is never new.
+        """
+        value = self.fetch_input_data(input_attr_id)
+        if value is None:
+            self._frame_seen.pop(input_attr_id, None)
+            return None, False
+        seq = frame_seq(value)
+        if seq is not None and self._frame_seen.get(input_attr_id) == seq:
+            return value, False
+        self._frame_seen[input_attr_id] = seq
+        return value, True
+
+    # ---- Async I/O protocol ----
+    # execute()는 블로킹 I/O를 직접 하지 않고 엔진 I/O 루프에 제출한 뒤 즉시 반환한다.
+    # 결과는 이후 틱에서 take_io()로 가져오거나, on_done 콜백이 틱 시작 시 엔진 스레드에서 호출된다.
+    def submit_io(self, key, fn, *args, timeout=None, on_done=None):
+        # 응답이 도착하면 이 노드를 깨움(이벤트 구동 러너에서 다음 heartbeat까지 기다리지 않음)
+        req = submit_io(fn, *args, timeout=timeout, on_done=on_done, label=f"{self.type_str}:{key}", wake=self.node_id)
+        self._io_requests[key] = req
+        return req
+
+    def io_busy(self, key):
+        req = self._io_requests.get(key)
+        return req is not None and not req.done()
+
+    def take_io(self, key):
+        """(True, value) / (False, exception) once the request finished, else None."""
+        req = self._io_requests.get(key)
+        if req is None or not req.done():
+            return None
+        del self._io_requests[key]
+        return req.take()
+
+    # ---- Wake sources (event-driven runner) ----
+    def wake_on_readable(self, fileobj):
+        """Wake this node once fileobj (a non-blocking socket) has data; call again after draining."""
+        engine_io.watch_readable(fileobj, self.node_id)
+
+    def wake_on_change(self, probe_fn):
+        """Wake this node whenever probe_fn() returns True (checked on the I/O loop)."""
+        engine_io.add_probe(self.node_id, probe_fn)
+
+    def clear_wake_probe(self):
+        engine_io.remove_probe(self.node_id)
+
+    # ---- Timers (TIMER_GATED nodes) ----
+    def schedule_after(self, delay_sec):
+        """Skip this node's tick runs until delay_sec from now (or until it is woken)."""
+        engine_timers.schedule(self.node_id, delay_sec, self.type_str)
+
+    def cancel_timer(self):
+        engine_timers.cancel(self.node_id)
+
+    def should_poll(self):
+        """POLL 노드가 이번 틱에 실행될지 여부 (예: LOGIC_LOOP는 활성 상태일 때만)."""
+        return True
+
+    def memo_ready(self):
+        """PURE 노드 중 내부 상태가 있는 경우, 같은 입력에서 출력이 더 이상 변하지 않을 때만 True."""
+        return True
+
     def get_settings(self): 
         return self.state
         
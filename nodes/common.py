@@ -1,5 +1,5 @@
 from nodes.base import BaseNode
-from core.engine import generate_uuid, PortType, write_log
+from core.engine import generate_uuid, PortType, write_log, ExecRole
 import time
 
 class StartNode(BaseNode):
@@ -11,6 +11,7 @@ class StartNode(BaseNode):
         return self.out 
 
 class ConditionKeyNode(BaseNode):
+    EXEC_ROLE = ExecRole.SOURCE
     def __init__(self, node_id): 
         super().__init__(node_id, "Check: Key", "COND_KEY")
         self.out_res = generate_uuid()
@@ -39,6 +40,8 @@ class LogicIfNode(BaseNode):
         return self.out_true if cond_val else self.out_false
 
 class LogicLoopNode(BaseNode):
+    EXEC_ROLE = ExecRole.POLL
+    TIMER_GATED = True  # 다음 반복 시각까지는 폴링하지 않음
     def __init__(self, node_id): 
         super().__init__(node_id, "Logic: LOOP", "LOGIC_LOOP")
         self.out_loop = generate_uuid()
@@ -51,6 +54,9 @@ class LogicLoopNode(BaseNode):
         self.next_emit_time = None
         # default interval (seconds) between iterations when tick-driven
         self.state.setdefault("interval", 0.1)
+    def should_poll(self):
+        # 엔진이 자동 시작하지 않도록, Flow로 활성화된 루프만 매 틱 폴링한다.
+        return self.is_active
     def execute(self):
         now = time.monotonic()
         target = self.state.get("count", 3)
@@ -69,6 +75,7 @@ class LogicLoopNode(BaseNode):
         if self.last_emitted:
             self.next_emit_time = now + interval
             self.last_emitted = False
+            self.schedule_after(interval)
             return None
 
         # If active and it's time to emit the next iteration (called from pre-exec)
@@ -83,12 +90,17 @@ class LogicLoopNode(BaseNode):
                 self.is_active = False
                 self.next_emit_time = None
                 self.last_emitted = False
+                self.cancel_timer()
                 return self.out_finish
 
         # Otherwise, do nothing this tick
+        if self.next_emit_time is not None:
+            self.schedule_after(self.next_emit_time - now)
         return None
 
 class ConstantNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    PURE = True
     def __init__(self, node_id): 
         super().__init__(node_id, "Constant", "CONSTANT")
         self.out_val = generate_uuid()
@@ -111,6 +123,7 @@ class PrintNode(BaseNode):
         return self.out_flow
 
 class LoggerNode(BaseNode):
+    EXEC_ROLE = ExecRole.SOURCE
     def __init__(self, node_id):
         super().__init__(node_id, "System Log", "LOGGER")
         self.llen = 0
@@ -12,7 +12,9 @@ from unittest.mock import MagicMock
 import urllib.request
 import urllib.error
 from nodes.base import BaseNode, BaseRobotDriver
-from core.engine import generate_uuid, PortType, write_log, HwStatus
+from core.engine import generate_uuid, PortType, write_log, HwStatus, ExecRole, Priority
+from core.frames import Frame, frame_jpeg
+from core import frame_bus
 import core.engine as engine_module
 from core.ep01_config import EP01_NETWORK_CONFIG, EP01_HARDWARE_CONFIG, EP01_CAMERA_CONFIG, EP01_MISSION_CONFIG
 
@@ -66,6 +68,7 @@ ep_cmd_sock = None
 ep_robot_inst = None
 ep_drive_wheels_sender = None
 ep_command_sender = None
+ep_camera_ring_starter = None   # GUI: EP 워커 프로세스에 카메라 링 캡처 시작 요청 (워커 모드에서만 설정)
 EP_IP = EP01_NETWORK_CONFIG['ep_ip']
 EP_PORT = EP01_NETWORK_CONFIG['ep_port']
 
@@ -145,6 +148,9 @@ _ep_cam_lock = threading.Lock()
 _ep_cam_cap = None
 _ep_cam_sdk_started = False
 _ep_cam_last_frame = None
+EP_FRAME_RING = 'ep_front'      # core.frame_bus 링 키 (EP 워커 캡처 스레드가 쓰고 EP_CAM_SRC가 읽음)
+_ep_ring_thread = None
+_ep_ring_stop = threading.Event()
 _ep_flask_app = Flask(__name__) if HAS_FLASK else None
 _ep_flask_latest_jpg = None
 _ep_flask_lock = threading.Lock()
@@ -253,6 +259,11 @@ def set_ep_command_sender(sender):
     ep_command_sender = sender
 
 
+def set_ep_camera_ring_starter(starter):
+    global ep_camera_ring_starter
+    ep_camera_ring_starter = starter
+
+
 def _normalize_ep_conn_type(conn_mode):
     conn_mode = str(conn_mode or '').strip().lower()
     if rm_conn is None:
@@ -456,9 +467,106 @@ def send_ep_command(cmd_str):
             pass
     return False
 
+def _ep_start_sdk_camera():
+    global _ep_cam_sdk_started
+    if ep_robot_inst is None:
+        return False
+    try:
+        if not _ep_cam_sdk_started:
+            ep_robot_inst.camera.start_video_stream(display=False)
+            _ep_cam_sdk_started = True
+        ep_camera_state['status'] = 'Running'
+        ep_camera_state['source'] = 'sdk'
+        return True
+    except Exception as e:
+        write_log(f"EP Camera SDK start failed: {e}")
+        return False
+
+
+def _ep_start_cv_camera(url):
+    global _ep_cam_cap
+    if not HAS_CV2:
+        return False
+    url = str(url or ep_camera_state.get('url', 'rtsp://192.168.42.2/live')).strip()
+    if not url:
+        return False
+    ep_camera_state['url'] = url
+    try:
+        cap = cv2.VideoCapture(url)
+        if cap.isOpened():
+            _ep_cam_cap = cap
+            ep_camera_state['status'] = 'Running'
+            ep_camera_state['source'] = 'cv'
+            return True
+        cap.release()
+    except Exception as e:
+        write_log(f"EP Camera CV open failed: {e}")
+    return False
+
+
+def _ep_grab_camera_frame(prefer_sdk, url):
+    """Newest camera image (SDK first, RTSP fallback) or None. Caller holds _ep_cam_lock."""
+    frame = None
+    if prefer_sdk and ep_robot_inst is not None:
+        if _ep_start_sdk_camera():
+            try:
+                frame = ep_robot_inst.camera.read_cv2_image(strategy='newest', timeout=0.2)
+            except Exception:
+                frame = None
+
+    if frame is None:
+        if _ep_cam_cap is None:
+            _ep_start_cv_camera(url)
+        if _ep_cam_cap is not None:
+            try:
+                ok, raw = _ep_cam_cap.read()
+                if ok:
+                    frame = raw
+                    ep_camera_state['status'] = 'Running'
+                    ep_camera_state['source'] = 'cv'
+            except Exception:
+                frame = None
+    return frame
+
+
+def _ep_camera_ring_loop(ring_key, url, prefer_sdk):
+    # EP 워커 프로세스: 캡처한 BGR 프레임을 공유 메모리 링에 씀 (GUI 틱은 카메라 읽기로 막히지 않음)
+    ring = frame_bus.open_writer(ring_key, raw=True)
+    write_log(f"[EP Camera] capturing into frame ring {ring.name}")
+    while not _ep_ring_stop.is_set():
+        with _ep_cam_lock:
+            frame = _ep_grab_camera_frame(prefer_sdk, url)
+        if frame is None:
+            _ep_ring_stop.wait(0.05)
+            continue
+        ring.write_image(frame)
+
+
+def start_ep_camera_ring(ring_key=EP_FRAME_RING, url=None, prefer_sdk=True):
+    """Start the capture thread that feeds the EP frame ring (idempotent)."""
+    global _ep_ring_thread
+    if not frame_bus.enabled():
+        return False
+    if _ep_ring_thread is not None and _ep_ring_thread.is_alive():
+        return True
+    _ep_ring_stop.clear()
+    _ep_ring_thread = threading.Thread(target=_ep_camera_ring_loop, args=(ring_key, url, bool(prefer_sdk)), daemon=True)
+    _ep_ring_thread.start()
+    return True
+
+
+def stop_ep_camera_ring():
+    global _ep_ring_thread
+    _ep_ring_stop.set()
+    if _ep_ring_thread is not None:
+        _ep_ring_thread.join(timeout=1.0)
+    _ep_ring_thread = None
+
+
 def stop_ep_camera_pipeline():
     global _ep_cam_cap, _ep_cam_sdk_started, _ep_cam_last_frame
 
+    stop_ep_camera_ring()
     with _ep_cam_lock:
         if _ep_cam_cap is not None:
             try:
@@ -554,6 +662,14 @@ def _ep_is_file_stable(path, wait_sec=0.02):
         return False
 
 
+def _ep_downscale_level(state):
+    # 스트림/저장용 피라미드 단계 (0 = 원본, 1 = 1/2, 2 = 1/4, 최대 3)
+    try:
+        return min(3, max(0, int(float(state.get('downscale', 0)))))
+    except Exception:
+        return 0
+
+
 def _ensure_ep_sender_manager_started():
     """EP sender manager를 단 한 번만 시작"""
     global _ep_sender_manager_started
@@ -914,6 +1030,7 @@ def ep_comm_thread():
 # ================= [EP Hardware Nodes] =================
 
 class EPRobotDriver(BaseRobotDriver):
+    COMPONENT_GROUP = 'ep01_control'
     def get_ui_schema(self):
         return [
             ('vx', "Vx(m/s)", 0.0),
@@ -976,6 +1093,10 @@ class EPRobotDriver(BaseRobotDriver):
         }
 
 class EPKeyboardNode(BaseNode):
+    COMPONENT_GROUP = 'ep01_control'
+    EXEC_ROLE = ExecRole.SOURCE
+    SAFETY_CRITICAL = True
+    PRIORITY = Priority.SAFETY
     def __init__(self, node_id):
         super().__init__(node_id, "Keyboard (EP)", "EP_KEYBOARD")
         self.in_flow = generate_uuid()
@@ -1099,6 +1220,8 @@ class EPKeyboardNode(BaseNode):
         return self.out_flow
 
 class EPCameraSourceNode(BaseNode):
+    EXEC_ROLE = ExecRole.SOURCE
+    RATE_GROUP = 'vision'
     def __init__(self, node_id):
         super().__init__(node_id, "EP Camera Source", "EP_CAM_SRC")
         self.in_flow = generate_uuid()
@@ -1109,71 +1232,62 @@ class EPCameraSourceNode(BaseNode):
         self.outputs[self.out_flow] = PortType.FLOW
         self.state['url'] = ep_camera_state.get('url', 'rtsp://192.168.42.2/live')
         self.state['prefer_sdk'] = True
+        self._ring_request_at = 0.0
+        self._ring_active = False
+        self._ring_seq = 0
+        self._ring_min_ts = 0.0
 
-    def _start_sdk_camera(self):
-        global _ep_cam_sdk_started
-        if ep_robot_inst is None:
-            return False
-        try:
-            if not _ep_cam_sdk_started:
-                ep_robot_inst.camera.start_video_stream(display=False)
-                _ep_cam_sdk_started = True
-            ep_camera_state['status'] = 'Running'
-            ep_camera_state['source'] = 'sdk'
-            return True
-        except Exception as e:
-            write_log(f"EP Camera SDK start failed: {e}")
-            return False
-
-    def _start_cv_camera(self):
-        global _ep_cam_cap
-        if not HAS_CV2:
+    def _ring_mode(self):
+        if ep_camera_ring_starter is None or not frame_bus.enabled():
             return False
-        url = str(self.state.get('url', ep_camera_state.get('url', 'rtsp://192.168.42.2/live'))).strip()
-        if not url:
-            return False
-        ep_camera_state['url'] = url
-        try:
-            cap = cv2.VideoCapture(url)
-            if cap.isOpened():
-                _ep_cam_cap = cap
-                ep_camera_state['status'] = 'Running'
-                ep_camera_state['source'] = 'cv'
-                return True
-            cap.release()
-        except Exception as e:
-            write_log(f"EP Camera CV open failed: {e}")
-        return False
+        now = time.monotonic()
+        if now >= self._ring_request_at:
+            # 시작 요청은 멱등: 프레임이 2초간 없으면 다시 요청 (워커 재시작 등). 워커가 없으면 직접 캡처
+            self._ring_active = bool(ep_camera_ring_starter(
+                EP_FRAME_RING, self.state.get('url'), bool(self.state.get('prefer_sdk', True))))
+            self._ring_request_at = now + 2.0
+            if self._ring_active:
+                if self._ring_min_ts <= 0.0:
+                    self._ring_min_ts = time.time() - 1.0
+                frame_bus.reopen_reader(EP_FRAME_RING)
+        return self._ring_active
+
+    def _read_ring(self):
+        # 워커 모드: EP 워커의 캡처 스레드가 채우는 링에서 최신 프레임만 가져옴 (블로킹 없음)
+        ring = frame_bus.open_reader(EP_FRAME_RING)
+        if ring is None:
+            return None
+        seq = ring.latest_seq()
+        if seq == self._ring_seq:
+            return None
+        self._ring_request_at = time.monotonic() + 2.0
+        rs = ring.read(seq)
+        if rs is None or rs.ts < self._ring_min_ts:  # 이전 실행의 링에 남은 프레임은 무시
+            return None
+        frame = ring.to_frame(rs, source='ring')
+        if frame is not None:
+            self._ring_seq = seq
+        return frame
 
     def execute(self):
         global _ep_cam_last_frame
 
-        frame = None
-        prefer_sdk = bool(self.state.get('prefer_sdk', True))
+        if self._ring_mode():
+            frame = self._read_ring()
+            if frame is not None:
+                _ep_cam_last_frame = frame
+                ep_camera_state['status'] = 'Running'
+                ep_camera_state['source'] = 'ring'
+            self.output_data[self.out_frame] = _ep_cam_last_frame
+            return self.out_flow
 
+        prefer_sdk = bool(self.state.get('prefer_sdk', True))
         with _ep_cam_lock:
-            if prefer_sdk and ep_robot_inst is not None:
-                if self._start_sdk_camera():
-                    try:
-                        frame = ep_robot_inst.camera.read_cv2_image(strategy='newest', timeout=0.2)
-                    except Exception:
-                        frame = None
-
-            if frame is None:
-                if _ep_cam_cap is None:
-                    self._start_cv_camera()
-                if _ep_cam_cap is not None:
-                    try:
-                        ok, raw = _ep_cam_cap.read()
-                        if ok:
-                            frame = raw
-                            ep_camera_state['status'] = 'Running'
-                            ep_camera_state['source'] = 'cv'
-                    except Exception:
-                        frame = None
+            frame = _ep_grab_camera_frame(prefer_sdk, self.state.get('url', ep_camera_state.get('url', 'rtsp://192.168.42.2/live')))
 
             if frame is not None:
-                _ep_cam_last_frame = frame
+                # 새로 읽은 프레임만 새 seq (읽기 실패 시 같은 Frame을 다시 내보냄)
+                _ep_cam_last_frame = Frame(frame, source=ep_camera_state.get('source', ''))
             self.output_data[self.out_frame] = _ep_cam_last_frame
 
             if _ep_cam_last_frame is None:
@@ -1182,6 +1296,8 @@ class EPCameraSourceNode(BaseNode):
         return self.out_flow
 
 class EPCameraStreamNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    RATE_GROUP = 'vision'
     def __init__(self, node_id):
         super().__init__(node_id, "EP Camera Stream", "EP_CAM_STREAM")
         self.in_flow = generate_uuid()
@@ -1192,6 +1308,7 @@ class EPCameraStreamNode(BaseNode):
         self.outputs[self.out_flow] = PortType.FLOW
         self.state['port'] = 5050
         self.state['is_running'] = False
+        self.state['downscale'] = 0
         self._started_local = False
 
     def _start_server_once(self):
@@ -1219,13 +1336,13 @@ class EPCameraStreamNode(BaseNode):
                 self._start_server_once()
                 self._started_local = True
 
-            frame = self.fetch_input_data(self.in_frame)
-            if frame is not None:
-                ok, buf = cv2.imencode('.jpg', frame)
-                if ok:
-                    with _ep_flask_lock:
-                        global _ep_flask_latest_jpg
-                        _ep_flask_latest_jpg = buf.tobytes()
+            frame, is_new = self.fetch_frame(self.in_frame)
+            if is_new:
+                # 같은 프레임의 JPEG는 EP_VIS_SAVE와 한 번만 인코딩해 공유
+                data = frame_jpeg(frame, _ep_downscale_level(self.state))
+                with _ep_flask_lock:
+                    global _ep_flask_latest_jpg
+                    _ep_flask_latest_jpg = data
 
         return self.out_flow
 
@@ -1245,6 +1362,7 @@ class EPVideoFrameSaveNode(BaseNode):
         self.state['duration'] = 10.0
         self.state['use_timer'] = False
         self.state['max_frames'] = 100
+        self.state['downscale'] = 0
 
         self._save_start_time = None
         self._frame_count = 0
@@ -1333,15 +1451,16 @@ class EPVideoFrameSaveNode(BaseNode):
                 ep_camera_save_state['frame_count'] = 0
                 return self.out_flow
 
-        frame = self.fetch_input_data(self.in_frame)
-        if frame is not None and HAS_CV2 and self._save_start_time is not None:
+        frame, is_new = self.fetch_frame(self.in_frame)
+        if is_new and HAS_CV2 and self._save_start_time is not None:
             try:
                 self._frame_index += 1
                 filename = os.path.join(folder, f"front_{self._frame_index:06d}.jpg")
-                success = cv2.imwrite(filename, frame)
-                if success:
-                    self._frame_count += 1
-                    ep_camera_save_state['frame_count'] = self._frame_count
+                data = frame_jpeg(frame, _ep_downscale_level(self.state))
+                with open(filename, 'wb') as f:
+                    f.write(data)
+                self._frame_count += 1
+                ep_camera_save_state['frame_count'] = self._frame_count
             except Exception as e:
                 write_log(f"[EP_VIS_SAVE] frame save failed: {e}")
 
@@ -1398,6 +1517,8 @@ class EPServerSenderNode(BaseNode):
 
 class EPServerJsonRecvNode(BaseNode):
     """EP01 JSON 파일 수신 노드 (Go1 JSON Receiver의 파일 수신 로직 기반)."""
+    EXEC_ROLE = ExecRole.SOURCE
+    TIMER_GATED = True  # 폴링 주기 사이에는 실행하지 않음
     def __init__(self, node_id):
         super().__init__(node_id, "EP JSON Receiver", "EP_SERVER_JSON_RECV")
         self.in_flow = generate_uuid()
@@ -1515,9 +1636,16 @@ class EPServerJsonRecvNode(BaseNode):
                 status = 'STALE'
             self._publish_state(self._last_raw_json, self._last_payload, bool(self._last_raw_json), fresh, status, source)
 
+        if self._last_raw_json:
+            delay = self._last_poll_mono + poll_interval_sec - now_mono
+            if self._last_ok_mono and now_mono < self._last_ok_mono + fresh_timeout_sec:
+                delay = min(delay, self._last_ok_mono + fresh_timeout_sec - now_mono)
+            if delay > 0.0:
+                self.schedule_after(delay)
         return self.out_flow
 
 class EPActionNode(BaseNode):
+    COMPONENT_GROUP = 'ep01_control'
     def __init__(self, node_id):
         super().__init__(node_id, "EP Action", "EP_ACTION")
         self.in_flow = generate_uuid(); self.inputs[self.in_flow] = PortType.FLOW
@@ -1636,6 +1764,9 @@ def _build_ep01_post_action_json(payload):
 
 
 class EP01MissionReceiverNode(BaseNode):
+    COMPONENT_GROUP = 'ep01_mission'
+    EXEC_ROLE = ExecRole.POLL
+    TIMER_GATED = True  # 다음 폴링 시각 또는 요청 완료(I/O 웨이크) 때만 실행
     def __init__(self, node_id):
         super().__init__(node_id, "Mission Receiver (EP01)", "EP01_MISSION_RECV")
         self.in_flow = generate_uuid()
@@ -1679,6 +1810,12 @@ class EP01MissionReceiverNode(BaseNode):
             charset = resp.headers.get_content_charset() or 'utf-8'
             return resp.read().decode(charset, errors='replace')
 
+    def _arm_next_poll(self, now_mono, poll_sec, timeout_sec):
+        if self.io_busy('mission'):
+            self.schedule_after(timeout_sec + 0.5)
+        elif self._last_raw_json:
+            self.schedule_after(self._last_poll_mono + poll_sec - now_mono)
+
     def execute(self):
         cur_gen = engine_module.run_generation
         if cur_gen != self._last_run_generation:
@@ -1695,15 +1832,24 @@ class EP01MissionReceiverNode(BaseNode):
         timeout_sec = max(0.2, _coerce_float(self.state.get('request_timeout_sec', EP01_MISSION_TIMEOUT_SEC), EP01_MISSION_TIMEOUT_SEC))
         now_mono = time.monotonic()
 
-        if (now_mono - self._last_poll_mono) < poll_sec and self._last_raw_json:
+        io_result = self.take_io('mission')  # 새 요청이 완료된 응답을 덮어쓰지 않도록 먼저 꺼냄
+        if not self.io_busy('mission') and ((now_mono - self._last_poll_mono) >= poll_sec or not self._last_raw_json):
+            self._last_poll_mono = now_mono
+            self.submit_io('mission', self._read_source_text, mode, source, timeout_sec, timeout=timeout_sec + 0.5)
+
+        if io_result is None:
+            # 요청 대기 중이거나 폴링 주기 전: 마지막 값을 유지
             self.output_data[self.out_raw_json] = self._last_raw_json
             self.output_data[self.out_mission_id] = self._last_mission_id
             self.output_data[self.out_has_mission] = bool(self._last_has_mission)
-            return self.out_flow if self._new_mission_pulse else None
+            self._arm_next_poll(now_mono, poll_sec, timeout_sec)
+            return None
 
-        self._last_poll_mono = now_mono
         try:
-            raw_json = self._read_source_text(mode, source, timeout_sec)
+            ok, value = io_result
+            if not ok:
+                raise value
+            raw_json = value
             payload, signature = _normalize_mission_container(raw_json)
             mission_id = _extract_mission_id(payload)
             has_mission = bool(mission_id or payload)
@@ -1743,6 +1889,7 @@ class EP01MissionReceiverNode(BaseNode):
             self.output_data[self.out_mission_id] = self._last_mission_id
             self.output_data[self.out_has_mission] = bool(self._last_has_mission)
 
+        self._arm_next_poll(now_mono, poll_sec, timeout_sec)
         if self._new_mission_pulse:
             self._new_mission_pulse = False
             return self.out_flow
@@ -1750,6 +1897,7 @@ class EP01MissionReceiverNode(BaseNode):
 
 
 class EP01MissionDecisionNode(BaseNode):
+    COMPONENT_GROUP = 'ep01_mission'
     def __init__(self, node_id):
         super().__init__(node_id, "Mission Decision (EP01)", "EP01_MISSION_DECIDE")
         self.in_flow = generate_uuid()
@@ -1820,25 +1968,31 @@ class EP01MissionDecisionNode(BaseNode):
         if mission_id and signature and signature != self._last_post_signature:
             self._last_post_signature = signature
             write_log(f"[EP01 MISSION DECIDE] mission={mission_id} type={mission_type} -> {decision} ({reason})")
-            try:
-                status_code, body = _post_json_payload(decision_url, {'mission_id': mission_id, 'decision': decision}, timeout_sec)
-                write_log(f"[EP01 MISSION DECIDE] POST {decision_url} -> rc={status_code}")
-                if body:
-                    write_log(f"[EP01 MISSION DECIDE] response: {body[:200]}")
-                ep01_mission_state.update({
-                    'status': 'Accepted' if accepted else 'Rejected',
-                    'mission_id': mission_id, 'mission_type': mission_type,
-                    'decision': decision, 'decision_reason': reason,
-                    'source': decision_url, 'last_error': '', 'updated_ts': time.time(),
-                })
-            except Exception as e:
-                ep01_mission_state.update({
-                    'status': 'DecisionError',
-                    'mission_id': mission_id, 'mission_type': mission_type,
-                    'decision': decision, 'decision_reason': reason,
-                    'source': decision_url, 'last_error': str(e), 'updated_ts': time.time(),
-                })
-                write_log(f"[EP01 MISSION DECIDE] POST failed: {e} -> continuing with decision={decision}")
+            ep01_mission_state.update({
+                'status': 'Accepted' if accepted else 'Rejected',
+                'mission_id': mission_id, 'mission_type': mission_type,
+                'decision': decision, 'decision_reason': reason,
+                'source': decision_url, 'last_error': '', 'updated_ts': time.time(),
+            })
+
+            # 결정 통보 POST는 비동기로 보내고, 결과는 이후 틱에서 로그/상태에 반영
+            def _on_post_done(ok, value, mission_id=mission_id):
+                if ok:
+                    status_code, body = value
+                    write_log(f"[EP01 MISSION DECIDE] POST {decision_url} -> rc={status_code}")
+                    if body:
+                        write_log(f"[EP01 MISSION DECIDE] response: {body[:200]}")
+                    return
+                if ep01_mission_state.get('mission_id') == mission_id and ep01_mission_state.get('status') in ('Accepted', 'Rejected'):
+                    ep01_mission_state.update({
+                        'status': 'DecisionError',
+                        'last_error': str(value) or value.__class__.__name__,
+                        'updated_ts': time.time(),
+                    })
+                write_log(f"[EP01 MISSION DECIDE] POST failed: {value.__class__.__name__}: {value} -> continuing with decision={decision}")
+
+            self.submit_io('decision_post', _post_json_payload, decision_url, {'mission_id': mission_id, 'decision': decision}, timeout_sec,
+                           timeout=timeout_sec + 0.5, on_done=_on_post_done)
         elif mission_id and signature == self._last_post_signature:
             write_log(f"[EP01 MISSION DECIDE] duplicate mission skipped: {mission_id}")
         elif not mission_id:
@@ -1857,6 +2011,7 @@ class EP01MissionDecisionNode(BaseNode):
 
 
 class EP01MissionDispatchNode(BaseNode):
+    COMPONENT_GROUP = 'ep01_mission'
     def __init__(self, node_id):
         super().__init__(node_id, "Mission Dispatch (EP01)", "EP01_MISSION_DISPATCH")
         self.in_flow = generate_uuid()
@@ -1927,6 +2082,7 @@ class EP01MissionDispatchNode(BaseNode):
 
 
 class EP01MissionActionNode(BaseNode):
+    COMPONENT_GROUP = 'ep01_control'
     def __init__(self, node_id):
         super().__init__(node_id, "Mission Action (EP01)", "EP01_MISSION_ACTION")
         self.in_flow = generate_uuid()
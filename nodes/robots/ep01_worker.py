@@ -146,6 +146,23 @@ class WorkerServer(threading.Thread):
                         return {'type': 'resp', 'req_id': req_id, 'ok': True, 'result': {}}
                     except Exception as e:
                         return {'type': 'resp', 'req_id': req_id, 'ok': False, 'result': {'error': str(e)}}
+                elif cmd == 'camera_start':
+                    # 카메라 프레임을 공유 메모리 링으로 (core.frame_bus): GUI 프로세스의 EP_CAM_SRC가 읽음
+                    try:
+                        ok = ep01_mod.start_ep_camera_ring(
+                            args.get('ring') or ep01_mod.EP_FRAME_RING,
+                            args.get('url'),
+                            bool(args.get('prefer_sdk', True)),
+                        )
+                        return {'type': 'resp', 'req_id': req_id, 'ok': ok, 'result': {}}
+                    except Exception as e:
+                        return {'type': 'resp', 'req_id': req_id, 'ok': False, 'result': {'error': str(e)}}
+                elif cmd == 'camera_stop':
+                    try:
+                        ep01_mod.stop_ep_camera_ring()
+                        return {'type': 'resp', 'req_id': req_id, 'ok': True, 'result': {}}
+                    except Exception as e:
+                        return {'type': 'resp', 'req_id': req_id, 'ok': False, 'result': {'error': str(e)}}
                 elif cmd == 'get_state':
                     try:
                         state = {
@@ -13,7 +13,7 @@ import asyncio
 import re
 import urllib.request
 from datetime import datetime
-from collections import deque
+from collections import deque, OrderedDict
 
 try:
     from asyncinotify import Inotify, Mask
@@ -22,7 +22,10 @@ except ImportError:
     _HAS_INOTIFY = False
 
 from nodes.base import BaseNode, BaseRobotDriver
-from core.engine import generate_uuid, PortType, write_log, node_registry, state_change_log_buffer
+from core.engine import generate_uuid, PortType, write_log, node_registry, state_change_log_buffer, ExecRole, Priority
+from core.frames import Frame, frame_image, frame_seq, derive_frame, frame_pool, frame_gray, frame_rgb, frame_jpeg, is_complete_jpeg, decode_pool
+from core import frame_bus, slot_store
+from core.rtp_jpeg import RtpJpegReceiver
 from core.go1_config import (
     NETWORK_CONFIG,
     ROBOT_CONTROL_CONFIG,
@@ -189,6 +192,12 @@ JSON_CMD_URL_DEFAULT = str(NETWORK_CONFIG.get('json_cmd_url', 'http://127.0.0.1:
 _GST_CONFIG = dict(GO1_CAMERA_CONFIG.get('gstreamer', {}))
 GST_UDP_PORT = int(_GST_CONFIG.get('udp_port', 9400))
 SSH_KEY_PATH = str(_GST_CONFIG.get('ssh_key_path', '~/.ssh/id_rsa'))
+GO1_CAMERA_RECEIVER = str(_GST_CONFIG.get('receiver', 'native')).strip().lower()
+# core.frame_bus 링 키: 수신 헬퍼 프로세스 -> VIDEO_SRC, VIS_SAVE -> 서버 송신기
+GO1_FRAME_RING = 'go1_front'
+GO1_SAVED_RING = 'go1_saved'
+GO1_DECODE_KEY = 'go1_front'   # core.frames.decode_pool 최신 프레임 슬롯 (수신 스레드가 도착 즉시 제출)
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 _CAM_TIMING_CONFIG = dict(GO1_CAMERA_CONFIG.get('timing', {}))
 CAM_FIRST_FRAME_WAIT_SEC = float(_CAM_TIMING_CONFIG.get('first_frame_wait_sec', 5.0))
@@ -222,6 +231,8 @@ go1_node_intent = {
     'send_aruco': False,
     'trigger_time': time.monotonic(),
 }
+# go1_control 컴포넌트 밖(비전 워커 스레드의 DA2 정지 신호)에서 쓰는 키와 제어 루프의 stop 확인/해제를 묶는 락
+go1_intent_lock = threading.Lock()
 
 go1_state = {
     'world_x': 0.0,
@@ -607,6 +618,7 @@ CAMERA_CONFIG = [dict(item) for item in GO1_CAMERA_CONFIG.get('camera_config', [
 ])]
 _CAMERA_WORKER_STARTED = False
 _CAMERA_RECEIVER_PROC = None
+go1_rtp_receiver = None   # core.rtp_jpeg.RtpJpegReceiver (receiver = native일 때 VIDEO_SRC가 직접 읽음)
 
 camera_save_state = dict(GO1_CAMERA_CONFIG.get('camera_save_state_defaults', {
     'status': 'Stopped',
@@ -748,15 +760,122 @@ def _load_da2_hf_pipeline(model_id, prefer_cuda=True):
             return None, str(e)
 
 
-def _is_file_stable(path, wait_sec=0.02):
-    """Check whether a file write has settled before upload."""
-    try:
-        size1 = os.path.getsize(path)
-        time.sleep(wait_sec)
-        size2 = os.path.getsize(path)
-        return size1 > 0 and size1 == size2
-    except OSError:
-        return False
+class _FrameFolderIndex:
+    """수신 폴더에서 쓰기가 끝난 프레임 파일의 도착 순서 목록.
+
+    백그라운드 스레드가 inotify(IN_CLOSE_WRITE/IN_MOVED_TO)로 목록을 갱신하고 max_frames를 넘는
+    오래된 파일을 지운다. inotify가 없으면 20 ms 간격으로 폴더를 훑어, 다음 파일이 생긴 파일을
+    완성된 것으로 본다 (multifilesink는 순서대로 씀). 노드는 latest()만 호출함: glob/정렬/sleep 없음.
+    """
+    POLL_SEC = 0.02
+
+    def __init__(self, folder, max_frames, prefix='front_', suffix='.jpg', on_frame=None):
+        self.folder = folder
+        self.max_frames = max_frames
+        self.on_frame = on_frame     # (JPEG 바이트, mtime): 완성된 파일을 이 스레드에서 읽어 넘김 (디코드 풀)
+        self.prefix = prefix
+        self.suffix = suffix
+        self._files = deque()
+        self._latest = (0, None)     # (완성 파일 수, 최신 경로): 튜플 교체라 잠금 없이 읽음
+        self._stop = threading.Event()
+        self._loop = None
+        self._task = None
+        self._thread = threading.Thread(target=self._run, name=f'frame-index:{folder}', daemon=True)
+        self._thread.start()
+
+    def latest(self):
+        return self._latest
+
+    def stop(self):
+        self._stop.set()
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass
+        self._thread.join(timeout=1.0)
+
+    def _matches(self, name):
+        return name.startswith(self.prefix) and name.endswith(self.suffix)
+
+    def _scan(self):
+        entries = []
+        try:
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    if self._matches(entry.name):
+                        try:
+                            entries.append((entry.stat().st_mtime_ns, entry.name, entry.path))
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+        entries.sort()
+        return [path for _, _, path in entries]
+
+    def _add(self, path):
+        if self._files and self._files[-1] == path:
+            return
+        self._files.append(path)
+        self._latest = (self._latest[0] + 1, path)
+        while len(self._files) > self.max_frames:
+            try:
+                os.remove(self._files.popleft())
+            except OSError:
+                pass
+        if self.on_frame is not None:
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                mtime = os.path.getmtime(path)
+            except OSError:
+                return
+            if is_complete_jpeg(data):
+                self.on_frame(data, mtime)
+
+    def _run(self):
+        os.makedirs(self.folder, exist_ok=True)
+        if _HAS_INOTIFY:
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            self._task = loop.create_task(self._watch())
+            try:
+                loop.run_until_complete(self._task)
+            except BaseException:
+                pass
+            finally:
+                loop.close()
+        else:
+            self._poll()
+
+    async def _watch(self):
+        with Inotify() as inotify:
+            inotify.add_watch(self.folder, Mask.CLOSE_WRITE | Mask.MOVED_TO)
+            # 감시 시작 전에 있던 파일 (마지막 파일은 쓰는 중일 수 있어 CLOSE_WRITE를 기다림)
+            for path in self._scan()[:-1]:
+                self._add(path)
+            async for event in inotify:
+                if self._stop.is_set():
+                    break
+                if event.path is not None and self._matches(event.path.name):
+                    self._add(str(event.path))
+
+    def _poll(self):
+        known = set()
+        pending = None
+        while not self._stop.is_set():
+            paths = self._scan()
+            current = set(paths)
+            fresh = [path for path in paths if path not in known]
+            known = current
+            if fresh:
+                if pending is not None and pending in current:
+                    fresh.insert(0, pending)
+                for path in fresh[:-1]:
+                    self._add(path)
+                pending = fresh[-1]
+            self._stop.wait(self.POLL_SEC)
 
 
 def _is_under_dev_shm(path):
@@ -1027,6 +1146,33 @@ def stop_go1_connection():
 
 
 
+def _submit_go1_jpeg(jpeg, ts):
+    # 수신 스레드에서 호출: 엔진 틱을 기다리지 않고 바로 디코드 풀에 제출
+    decode_pool.submit(GO1_DECODE_KEY, jpeg, ts)
+
+
+def _start_native_receiver():
+    """RTP/JPEG를 프로세스 안에서 바로 조립 (gst-launch/디스크 없음). 포트를 못 열면 None."""
+    global go1_rtp_receiver
+    _stop_native_receiver()
+    decode_pool.clear(GO1_DECODE_KEY)
+    on_frame = _submit_go1_jpeg if decode_pool.enabled else None
+    try:
+        go1_rtp_receiver = RtpJpegReceiver(GST_UDP_PORT, on_frame=on_frame).start()
+    except OSError as e:
+        write_log(f"[Cam START ERROR] native RTP receiver on port {GST_UDP_PORT} failed: {e}")
+        go1_rtp_receiver = None
+    return go1_rtp_receiver
+
+
+def _stop_native_receiver():
+    global go1_rtp_receiver
+    if go1_rtp_receiver is not None:
+        write_log(f"[Cam] RTP receiver stats: {go1_rtp_receiver.snapshot()}")
+        go1_rtp_receiver.stop()
+        go1_rtp_receiver = None
+
+
 def camera_worker_thread():
     global camera_state, CAMERA_CONFIG, _CAMERA_RECEIVER_PROC
     nanos = GO1_CAMERA_NANOS
@@ -1111,19 +1257,41 @@ def camera_worker_thread():
                 try:
                     subprocess.call("pkill -f 'gst-launch-1.0.*multifilesink'", shell=True)
                     subprocess.call(f"pkill -f 'gst-launch-1.0.*port={GST_UDP_PORT}'", shell=True)
+                    subprocess.call(f"pkill -f 'core.frame_bus gst .*--port {GST_UDP_PORT}'", shell=True)
+                    subprocess.call(f"pkill -f 'core.slot_store gst .*--port {GST_UDP_PORT}'", shell=True)
                 except Exception:
                     pass
                 time.sleep(0.5)
 
+                native_rx = _start_native_receiver() if GO1_CAMERA_RECEIVER == 'native' else None
+                use_ring = native_rx is None and frame_bus.enabled()
+                use_slots = native_rx is None and not use_ring and slot_store.enabled()
                 try:
-                    os.makedirs(target_folder, exist_ok=True)
-                    gst_cmd = (
-                        f"gst-launch-1.0 -q udpsrc port={GST_UDP_PORT} "
-                        f"caps=\"application/x-rtp,media=video,encoding-name=JPEG,payload=26\" "
-                        f"! rtpjpegdepay ! multifilesink location=\"{target_folder}/front_%06d.jpg\" sync=false"
-                    )
-                    _CAMERA_RECEIVER_PROC = subprocess.Popen(gst_cmd, shell=True)
-                    write_log(f"[Cam START] Receiver listening on port {GST_UDP_PORT} -> {target_folder}")
+                    if native_rx is not None:
+                        write_log(f"[Cam START] Receiver listening on port {GST_UDP_PORT} -> in-process RTP/JPEG")
+                    elif use_ring:
+                        # 공유 메모리 링으로 수신: 프레임마다 파일 생성/glob/삭제 없음
+                        _CAMERA_RECEIVER_PROC = subprocess.Popen(
+                            [sys.executable, '-m', 'core.frame_bus', 'gst', '--ring', GO1_FRAME_RING, '--port', str(GST_UDP_PORT)],
+                            cwd=_REPO_ROOT,
+                        )
+                        write_log(f"[Cam START] Receiver listening on port {GST_UDP_PORT} -> frame ring {frame_bus.ring_name(GO1_FRAME_RING)}")
+                    elif use_slots:
+                        # 파일 핸드오프 유지: 프레임마다 새 파일 대신 고정 슬롯 파일 + latest.idx
+                        _CAMERA_RECEIVER_PROC = subprocess.Popen(
+                            [sys.executable, '-m', 'core.slot_store', 'gst', '--dir', target_folder, '--port', str(GST_UDP_PORT)],
+                            cwd=_REPO_ROOT,
+                        )
+                        write_log(f"[Cam START] Receiver listening on port {GST_UDP_PORT} -> slot files {target_folder}")
+                    else:
+                        os.makedirs(target_folder, exist_ok=True)
+                        gst_cmd = (
+                            f"gst-launch-1.0 -q udpsrc port={GST_UDP_PORT} "
+                            f"caps=\"application/x-rtp,media=video,encoding-name=JPEG,payload=26\" "
+                            f"! rtpjpegdepay ! multifilesink location=\"{target_folder}/front_%06d.jpg\" sync=false"
+                        )
+                        _CAMERA_RECEIVER_PROC = subprocess.Popen(gst_cmd, shell=True)
+                        write_log(f"[Cam START] Receiver listening on port {GST_UDP_PORT} -> {target_folder}")
                 except Exception as e:
                     write_log(f"[Cam START ERROR] Failed to start receiver: {e}")
 
@@ -1141,8 +1309,19 @@ def camera_worker_thread():
                 monitor_start = time.time()
                 while time.time() - monitor_start < CAM_FIRST_FRAME_WAIT_SEC:
                     try:
-                        files = glob.glob(os.path.join(target_folder, "*.jpg"))
-                        if files:
+                        if native_rx is not None:
+                            arrived = native_rx.latest()[0] > 0
+                        elif use_ring:
+                            frame_bus.reopen_reader(GO1_FRAME_RING)
+                            ring = frame_bus.open_reader(GO1_FRAME_RING)
+                            latest = ring.read() if ring is not None else None
+                            arrived = latest is not None and latest.ts >= monitor_start
+                        elif use_slots:
+                            index = slot_store.read_index(target_folder)
+                            arrived = index is not None and index[3] >= monitor_start
+                        else:
+                            arrived = bool(glob.glob(os.path.join(target_folder, "*.jpg")))
+                        if arrived:
                             write_log("[Cam START] First frame detected, ready for server sender")
                             camera_state['first_frame_ready'] = True
                             break
@@ -1159,6 +1338,7 @@ def camera_worker_thread():
                 camera_state['status'] = 'Stopping...'
                 camera_state['duration'] = 0.0
                 camera_state['first_frame_ready'] = False
+                _stop_native_receiver()
                 try:
                     if _CAMERA_RECEIVER_PROC is not None and _CAMERA_RECEIVER_PROC.poll() is None:
                         _CAMERA_RECEIVER_PROC.terminate()
@@ -1174,6 +1354,8 @@ def camera_worker_thread():
                 try:
                     subprocess.call("pkill -f 'gst-launch-1.0.*multifilesink'", shell=True)
                     subprocess.call(f"pkill -f 'gst-launch-1.0.*port={GST_UDP_PORT}'", shell=True)
+                    subprocess.call(f"pkill -f 'core.frame_bus gst .*--port {GST_UDP_PORT}'", shell=True)
+                    subprocess.call(f"pkill -f 'core.slot_store gst .*--port {GST_UDP_PORT}'", shell=True)
                 except Exception:
                     pass
                 time.sleep(0.5)
@@ -1223,14 +1405,46 @@ def camera_worker_thread():
 
 
 # ================= [Server Sender Functions] =================
-async def send_image_async(session, filepath, camera_id, server_url):
-    """HTTP multipart/form-data로 이미지 비동기 업로드"""
+# VIS_SAVE가 방금 저장한 JPEG 바이트 (절대 경로 -> bytes, 최근 몇 개만): 송신기가 같은 파일을 다시 읽지 않도록
+_saved_jpeg_cache = OrderedDict()
+_saved_jpeg_lock = threading.Lock()
+_SAVED_JPEG_CACHE_MAX = 8
+
+
+def _saved_handoff(state):
+    """VIS_SAVE -> 송신기 전달 경로: 'slots' | 'ring' | 'files' (실행당 하나만 씀)"""
+    use_timer = _coerce_bool(state.get('use_timer', False), False)
+    if slot_store.enabled() and not use_timer and _coerce_bool(state.get('slot_files', False), False):
+        return 'slots'  # 슬롯 파일은 노드에서 명시적으로 켠 경우에만 (타이머 저장은 기록용이므로 제외)
+    if frame_bus.enabled():
+        return 'ring'
+    return 'files'
+
+
+def _remember_saved_jpeg(path, data):
+    with _saved_jpeg_lock:
+        _saved_jpeg_cache[os.path.abspath(path)] = data
+        while len(_saved_jpeg_cache) > _SAVED_JPEG_CACHE_MAX:
+            _saved_jpeg_cache.popitem(last=False)
+
+
+def _take_saved_jpeg(path):
+    with _saved_jpeg_lock:
+        return _saved_jpeg_cache.pop(os.path.abspath(path), None)
+
+
+async def send_image_async(session, filepath, camera_id, server_url, file_data=None, ref_ts=None):
+    """HTTP multipart/form-data로 이미지 비동기 업로드 (file_data가 주어지면 파일을 읽지 않음)"""
     try:
-        if not os.path.exists(filepath):
-            return
-        t_file_mtime = os.path.getmtime(filepath)
-        with open(filepath, 'rb') as f:
-            file_data = f.read()
+        if file_data is None:
+            if not os.path.exists(filepath):
+                return
+            ref_ts = os.path.getmtime(filepath)
+            file_data = _take_saved_jpeg(filepath)
+            if file_data is None:
+                with open(filepath, 'rb') as f:
+                    file_data = f.read()
+        t_file_mtime = ref_ts if ref_ts is not None else time.time()
         source_name = os.path.basename(filepath)
         upload_name = f"{camera_id}_{int(time.time() * 1000)}_{source_name}"
 
@@ -1287,6 +1501,56 @@ async def _upload_loop(session, camera_id, server_url, latest_ref, new_file_even
             await send_image_async(session, filepath, camera_id, server_url)
 
 
+async def _ring_upload_loop(session, camera_id, server_url, start_after_epoch):
+    """VIS_SAVE가 GO1_SAVED_RING에 올린 최신 JPEG 업로드 (파일 감시/재읽기 없음)"""
+    last_seq = 0
+    while multi_sender_active:
+        ring = frame_bus.open_reader(GO1_SAVED_RING)
+        seq = ring.latest_seq() if ring is not None else 0
+        if seq == last_seq:
+            await asyncio.sleep(frame_bus.POLL_SEC)
+            continue
+        last_seq = seq
+        rs = ring.read(seq)
+        if rs is None or rs.ts < start_after_epoch:
+            continue
+        # 업로드 중 슬롯이 덮어써질 수 있으므로 한 번 복사
+        data = bytes(rs.data)
+        if not ring.still_valid(rs):
+            continue
+        await send_image_async(session, f"{ring.name}_{seq:06d}.jpg", camera_id, server_url,
+                               file_data=data, ref_ts=rs.ts)
+
+
+async def _slot_upload_loop(session, camera_id, server_url, folder, start_after_epoch):
+    """VIS_SAVE가 슬롯 저장소(folder/latest.idx)에 게시한 최신 JPEG 업로드 (glob/파일 감시 없음)"""
+    last_seq = None
+    min_ts = max(start_after_epoch, time.time())   # 이전 세션이 남긴 슬롯은 올리지 않음
+    while multi_sender_active:
+        store = slot_store.open_reader(folder)
+        item = store.read(last_seq) if store is not None else None
+        if item is None:
+            await asyncio.sleep(slot_store.POLL_SEC)
+            continue
+        seq, ts, path, data = item
+        last_seq = seq
+        if ts < min_ts:
+            continue
+        await send_image_async(session, path, camera_id, server_url, file_data=data, ref_ts=ts)
+
+
+async def _wait_for_slot_store(folder, timeout):
+    """VIS_SAVE가 아직 첫 프레임을 게시하지 않았을 수 있으므로 latest.idx가 생길 때까지 잠시 대기"""
+    deadline = time.time() + timeout
+    while multi_sender_active:
+        if slot_store.is_store(folder):
+            return True
+        if time.time() >= deadline:
+            return False
+        await asyncio.sleep(0.1)
+    return False
+
+
 async def camera_async_worker(config, server_url):
     """카메라 폴더 모니터링 및 이미지 송신"""
     global multi_sender_active
@@ -1297,7 +1561,30 @@ async def camera_async_worker(config, server_url):
 
     os.makedirs(folder, exist_ok=True)
 
-    if _HAS_INOTIFY:
+    handoff = config.get('handoff') or ('ring' if frame_bus.enabled() else 'files')
+
+    # latest.idx가 없는 폴더(다른 프로그램이 파일로 저장)는 슬롯 저장소가 아니므로 파일 감시로 진행
+    use_slots = False
+    if handoff == 'slots':
+        use_slots = await _wait_for_slot_store(folder, CAM_FIRST_FRAME_WAIT_SEC)
+        if not use_slots:
+            write_log(f"[Server Sender] {folder} has no {slot_store.INDEX_NAME}, watching files instead ({camera_id})")
+
+    if handoff == 'ring':
+        # 공유 메모리 링: VIS_SAVE가 저장과 동시에 GO1_SAVED_RING에 게시
+        try:
+            async with aiohttp.ClientSession() as session:
+                await _ring_upload_loop(session, camera_id, server_url, start_after_epoch)
+        except Exception as e:
+            write_log(f"[Server Sender] ring worker error ({camera_id}): {e}")
+    elif use_slots:
+        # 고정 슬롯 파일: VIS_SAVE가 게시할 때마다 latest.idx가 최신 슬롯을 가리킴
+        try:
+            async with aiohttp.ClientSession() as session:
+                await _slot_upload_loop(session, camera_id, server_url, folder, start_after_epoch)
+        except Exception as e:
+            write_log(f"[Server Sender] slot worker error ({camera_id}): {e}")
+    elif _HAS_INOTIFY:
         # inotify 기반: 파일 저장 즉시 감지 → 폴링 대기 없음
         latest_ref = {'path': None}
         new_file_event = asyncio.Event()
@@ -1377,10 +1664,12 @@ def sender_manager_thread():
             if cmd == 'START' and not multi_sender_active:
                 # 송신 원본 폴더는 VIS_SAVE 설정을 우선 사용 (보정/오버레이 결과 업로드)
                 upload_folder = None
+                handoff = 'ring' if frame_bus.enabled() else 'files'
                 try:
                     for node in node_registry.values():
                         if getattr(node, 'type_str', '') == 'VIS_SAVE':
                             upload_folder = str(node.state.get('folder', '')).strip()
+                            handoff = _saved_handoff(node.state)
                             if upload_folder:
                                 break
                 except Exception:
@@ -1394,6 +1683,7 @@ def sender_manager_thread():
                     CAMERA_CONFIG.append({
                         "folder": upload_folder,
                         "id": "go1_front",
+                        "handoff": handoff,   # VIS_SAVE가 실제로 쓰는 경로 하나만 읽음
                         "start_after_epoch": time.time() + (CAM_UPLOAD_WARMUP_SEC if _is_under_dev_shm(upload_folder) else 0.0),
                     })
                 except Exception:
@@ -1639,14 +1929,17 @@ def go1_keepalive_thread():
             write_log("[YAW_ALIGN] start")
             write_log("Go1: Processing yaw align (R) - starting alignment")
 
-        if go1_node_intent['stop']:
+        with go1_intent_lock:
+            stop_requested = go1_node_intent['stop']
+            if stop_requested:
+                go1_node_intent['stop'] = False   # 확인과 해제 사이에 들어온 정지 요청을 잃지 않도록
+        if stop_requested:
             yaw_align_active = False
             stand_only = True
             last_key_time = tnow
             last_move_cmd_time = tnow
             grace_deadline = tnow
             use_grace = True
-            go1_node_intent['stop'] = False
         elif is_node_active and not yaw_align_active:
             # Only override yaw_align if it's not currently active
             stand_only = False
@@ -1983,6 +2276,7 @@ def go1_keepalive_thread():
 
 # ================= [Go1 Driver/Control Nodes] =================
 class Go1RobotDriver(BaseRobotDriver):
+    COMPONENT_GROUP = 'go1_control'
     def get_ui_schema(self):
         return [
             ('vx', "Vx In", 0.0),
@@ -2016,6 +2310,7 @@ class Go1RobotDriver(BaseRobotDriver):
 
 
 class Go1ActionNode(BaseNode):
+    COMPONENT_GROUP = 'go1_control'
     def __init__(self, node_id):
         super().__init__(node_id, "Go1 Action", "GO1_ACTION")
         self.in_flow = generate_uuid()
@@ -2209,6 +2504,9 @@ def _apply_go1_keyboard_intent(state):
 
 
 class Go1KeyboardNode(BaseNode):
+    EXEC_ROLE = ExecRole.SOURCE
+    SAFETY_CRITICAL = True
+    PRIORITY = Priority.SAFETY
     def __init__(self, node_id):
         super().__init__(node_id, "Keyboard (Go1)", "GO1_KEYBOARD")
         self.in_flow = generate_uuid()
@@ -2235,6 +2533,9 @@ class Go1KeyboardNode(BaseNode):
 
 
 class Go1UnityKeyboardNode(BaseNode):
+    EXEC_ROLE = ExecRole.SOURCE
+    SAFETY_CRITICAL = True
+    PRIORITY = Priority.SAFETY
     def __init__(self, node_id):
         super().__init__(node_id, "Unity Keyboard (Go1)", "GO1_UNITY_KEYBOARD")
         self.in_flow = generate_uuid()
@@ -2261,6 +2562,8 @@ class Go1UnityKeyboardNode(BaseNode):
 
 
 class Go1UnityNode(BaseNode):
+    COMPONENT_GROUP = 'go1_control'
+    EXEC_ROLE = ExecRole.SOURCE
     def __init__(self, node_id):
         super().__init__(node_id, "Unity Connection (Go1)", "GO1_UNITY")
         self.in_flow = generate_uuid()
@@ -2358,6 +2661,8 @@ class Go1UnityNode(BaseNode):
 
 
 class Go1UnityAutonomyNode(BaseNode):
+    COMPONENT_GROUP = 'go1_control'
+    EXEC_ROLE = ExecRole.DATA
     def __init__(self, node_id):
         super().__init__(node_id, "Unity Autonomy (Go1)", "GO1_UNITY_AUTO")
         self.in_flow = generate_uuid()
@@ -2862,6 +3167,12 @@ class Go1UnityAutonomyNode(BaseNode):
 
 
 class Go1ServerJsonRecvNode(BaseNode):
+    COMPONENT_GROUP = 'go1_control'
+    EXEC_ROLE = ExecRole.SOURCE
+    # 'stop' 명령을 go1_node_intent에 쓰는 입력원이므로 우선 레인에서 실행
+    PRIORITY = Priority.SAFETY
+    # Between polls (and with no timed motion to refresh) there is nothing to do per tick.
+    TIMER_GATED = True
     def __init__(self, node_id):
         super().__init__(node_id, "Server JSON Receiver", "GO1_SERVER_JSON_RECV")
         self.in_flow = generate_uuid()
@@ -3246,6 +3557,20 @@ class Go1ServerJsonRecvNode(BaseNode):
 
         self.output_data[self.out_raw_json] = raw_json
 
+    def _arm_next_run(self, now_mono, poll_interval_sec, fresh_timeout_sec):
+        if self._motion_active or not self._last_raw_json:
+            return  # 시간 지정 이동 중에는 매 틱 go1_node_intent를 갱신해야 함
+        if self.io_busy('json'):
+            delay = poll_interval_sec  # 응답 도착 웨이크가 더 먼저 깨움
+        else:
+            delay = self._last_poll_mono + poll_interval_sec - now_mono
+        if self._last_ok_mono and now_mono < self._last_ok_mono + fresh_timeout_sec:
+            delay = min(delay, self._last_ok_mono + fresh_timeout_sec - now_mono)
+        if self._deferred_back_until > 0.0:
+            delay = min(delay, self._deferred_back_until - now_mono)
+        if delay > 0.0:
+            self.schedule_after(delay)
+
     def execute(self):
         mode = str(self.state.get('mode', 'HTTP')).strip().upper()
         source = str(self.state.get('source', '')).strip()
@@ -3325,10 +3650,21 @@ class Go1ServerJsonRecvNode(BaseNode):
 
         should_poll = (now_mono - self._last_poll_mono) >= poll_interval_sec or not self._last_raw_json
 
-        if should_poll:
+        # HTTP/FILE 읽기는 엔진 I/O 루프에서 수행하고, 완료된 응답은 이후 틱에서 처리한다.
+        # (느린 서버가 틱 전체와 GUI를 멈추지 않도록 execute()에서는 블로킹하지 않음)
+        # 완료된 응답을 먼저 꺼내야 새 요청이 그 응답을 덮어쓰지 않음
+        io_result = self.take_io('json')
+        if should_poll and not self.io_busy('json'):
             self._last_poll_mono = now_mono
+            self.submit_io('json', self._read_source_text, mode, source, request_timeout_sec,
+                           timeout=request_timeout_sec + 0.5)
+
+        if io_result is not None:
             try:
-                raw_json = self._read_source_text(mode, source, request_timeout_sec)
+                ok, value = io_result
+                if not ok:
+                    raise value
+                raw_json = value
                 parsed = json.loads(raw_json)
                 direction = self._extract_direction_text(parsed)
                 payload = self._pick_payload(parsed)
@@ -3341,6 +3677,7 @@ class Go1ServerJsonRecvNode(BaseNode):
                 if incoming_ts is not None and str(incoming_ts) == str(self._last_json_timestamp):
                     self._publish_state(raw_json, payload, True, True, 'OK', source)
                     self.output_data[self.out_raw_json] = None  # Unity relay 차단
+                    self._arm_next_run(now_mono, poll_interval_sec, fresh_timeout_sec)
                     return self.out_flow
                 if incoming_ts is not None:
                     self._last_json_timestamp = incoming_ts
@@ -3430,10 +3767,14 @@ class Go1ServerJsonRecvNode(BaseNode):
                 status = 'STALE'
             self._publish_state(self._last_raw_json, self._last_payload, bool(self._last_raw_json), fresh, status, source)
 
+        self._arm_next_run(now_mono, poll_interval_sec, fresh_timeout_sec)
         return self.out_flow
 
 
 class Go1AutoAvoidanceNode(BaseNode):
+    COMPONENT_GROUP = 'go1_control'
+    # 정지/회피 판단: Flow 큐에서 일반 노드보다 먼저 실행
+    PRIORITY = Priority.SAFETY
     def __init__(self, node_id):
         super().__init__(node_id, "Auto Avoidance", "GO1_AUTO_AVOIDANCE")
         self.in_flow = generate_uuid()
@@ -3832,6 +4173,12 @@ class Go1AutoAvoidanceNode(BaseNode):
 
 
 class Go1MissionReceiverNode(BaseNode):
+    COMPONENT_GROUP = 'go1_mission'
+    # Polled every tick; the flow pulse returned on a new mission is propagated by the
+    # engine, so it must not also run as a plain data node (that would consume the pulse).
+    EXEC_ROLE = ExecRole.POLL
+    # Only runs when the next poll is due or the pending request finished (I/O wake).
+    TIMER_GATED = True
     def __init__(self, node_id):
         super().__init__(node_id, "Mission Receiver (Go1)", "GO1_MISSION_RECV")
         self.in_flow = generate_uuid()
@@ -3883,6 +4230,13 @@ class Go1MissionReceiverNode(BaseNode):
             charset = resp.headers.get_content_charset() or 'utf-8'
             return resp.read().decode(charset, errors='replace')
 
+    def _arm_next_poll(self, now_mono, poll_interval_sec, request_timeout_sec):
+        if self.io_busy('mission'):
+            # 응답이 오면 submit_io의 웨이크가 타이머를 앞당김; 이 시각은 타임아웃 대비용
+            self.schedule_after(request_timeout_sec + 0.5)
+        elif self._last_raw_json:
+            self.schedule_after(self._last_poll_mono + poll_interval_sec - now_mono)
+
     def execute(self):
         cur_gen = engine_module.run_generation
         if cur_gen != self._last_run_generation:
@@ -3905,15 +4259,25 @@ class Go1MissionReceiverNode(BaseNode):
         request_timeout_sec = max(0.2, _coerce_float(self.state.get('request_timeout_sec', GO1_MISSION_TIMEOUT_SEC), GO1_MISSION_TIMEOUT_SEC))
         now_mono = time.monotonic()
 
-        if (now_mono - self._last_poll_mono) < poll_interval_sec and self._last_raw_json:
+        io_result = self.take_io('mission')  # 새 요청이 완료된 응답을 덮어쓰지 않도록 먼저 꺼냄
+        if not self.io_busy('mission') and ((now_mono - self._last_poll_mono) >= poll_interval_sec or not self._last_raw_json):
+            self._last_poll_mono = now_mono
+            self.submit_io('mission', self._read_source_text, mode, source, request_timeout_sec,
+                           timeout=request_timeout_sec + 0.5)
+
+        if io_result is None:
+            # 요청 대기 중이거나 폴링 주기 전: 마지막 값을 유지
             self.output_data[self.out_raw_json] = self._last_raw_json
             self.output_data[self.out_mission_id] = self._last_mission_id
             self.output_data[self.out_has_mission] = bool(self._last_has_mission)
-            return self.out_flow if self._new_mission_pulse else None
+            self._arm_next_poll(now_mono, poll_interval_sec, request_timeout_sec)
+            return None
 
-        self._last_poll_mono = now_mono
         try:
-            raw_json = self._read_source_text(mode, source, request_timeout_sec)
+            ok, value = io_result
+            if not ok:
+                raise value
+            raw_json = value
             payload, signature = _normalize_mission_container(raw_json)
             mission_id = _extract_mission_id(payload)
             has_mission = bool(mission_id or payload)
@@ -3954,6 +4318,7 @@ class Go1MissionReceiverNode(BaseNode):
             self.output_data[self.out_mission_id] = self._last_mission_id
             self.output_data[self.out_has_mission] = bool(self._last_has_mission)
 
+        self._arm_next_poll(now_mono, poll_interval_sec, request_timeout_sec)
         if self._new_mission_pulse:
             self._new_mission_pulse = False
             return self.out_flow
@@ -4034,6 +4399,7 @@ def _evaluate_mission_conditions(conditions):
 
 
 class Go1MissionDecisionNode(BaseNode):
+    COMPONENT_GROUP = 'go1_mission'
     def __init__(self, node_id):
         super().__init__(node_id, "Mission Decision (Go1)", "GO1_MISSION_DECIDE")
         self.in_flow = generate_uuid()
@@ -4106,33 +4472,35 @@ class Go1MissionDecisionNode(BaseNode):
         if mission_id and signature and signature != self._last_post_signature:
             self._last_post_signature = signature
             write_log(f"[GO1 MISSION DECIDE] mission={mission_id} type={mission_type} mode={mode} -> {decision} (reason: {reason})")
-            try:
-                status_code, body = _post_json_payload(decision_url, post_payload, timeout_sec)
-                write_log(f"[GO1 MISSION DECIDE] POST {decision_url} -> rc={status_code}")
-                if body:
-                    write_log(f"[GO1 MISSION DECIDE] response: {body[:200]}")
-                go1_mission_state.update({
-                    'status': 'Accepted' if accepted else 'Rejected',
-                    'mission_id': mission_id,
-                    'mission_type': mission_type,
-                    'decision': decision,
-                    'decision_reason': reason,
-                    'source': decision_url,
-                    'last_error': '',
-                    'updated_ts': time.time(),
-                })
-            except Exception as e:
-                go1_mission_state.update({
-                    'status': 'DecisionError',
-                    'mission_id': mission_id,
-                    'mission_type': mission_type,
-                    'decision': decision,
-                    'decision_reason': reason,
-                    'source': decision_url,
-                    'last_error': str(e),
-                    'updated_ts': time.time(),
-                })
-                write_log(f"[GO1 MISSION DECIDE] POST failed (server unavailable etc.): {e} -> continuing with decision={decision}")
+            go1_mission_state.update({
+                'status': 'Accepted' if accepted else 'Rejected',
+                'mission_id': mission_id,
+                'mission_type': mission_type,
+                'decision': decision,
+                'decision_reason': reason,
+                'source': decision_url,
+                'last_error': '',
+                'updated_ts': time.time(),
+            })
+
+            # 결정 통보 POST는 흐름을 막지 않도록 비동기로 보내고, 결과는 이후 틱에서 로그/상태에 반영
+            def _on_post_done(ok, value, mission_id=mission_id):
+                if ok:
+                    status_code, body = value
+                    write_log(f"[GO1 MISSION DECIDE] POST {decision_url} -> rc={status_code}")
+                    if body:
+                        write_log(f"[GO1 MISSION DECIDE] response: {body[:200]}")
+                    return
+                if go1_mission_state.get('mission_id') == mission_id and go1_mission_state.get('status') in ('Accepted', 'Rejected'):
+                    go1_mission_state.update({
+                        'status': 'DecisionError',
+                        'last_error': str(value) or value.__class__.__name__,
+                        'updated_ts': time.time(),
+                    })
+                write_log(f"[GO1 MISSION DECIDE] POST failed (server unavailable etc.): {value.__class__.__name__}: {value} -> continuing with decision={decision}")
+
+            self.submit_io('decision_post', _post_json_payload, decision_url, post_payload, timeout_sec,
+                           timeout=timeout_sec + 0.5, on_done=_on_post_done)
         elif mission_id and signature and signature == self._last_post_signature:
             write_log(f"[GO1 MISSION DECIDE] duplicate mission skipped: {mission_id}")
         elif not mission_id:
@@ -4156,6 +4524,7 @@ class Go1MissionDecisionNode(BaseNode):
 
 
 class Go1MissionDispatchNode(BaseNode):
+    COMPONENT_GROUP = 'go1_mission'
     def __init__(self, node_id):
         super().__init__(node_id, "Mission Dispatch (Go1)", "GO1_MISSION_DISPATCH")
         self.in_flow = generate_uuid()
@@ -4272,6 +4641,9 @@ class VideoSourceNode(BaseNode):
     - 라즈베리파이로 START/STOP 명령 전송
     - 이미지 저장은 VideoSaveNode에서 담당
     """
+    EXEC_ROLE = ExecRole.SOURCE
+    RATE_GROUP = 'vision'
+    RING_KEY = GO1_FRAME_RING   # core.frame_bus 링 (수신 헬퍼 프로세스가 씀)
     def __init__(self, node_id):
         super().__init__(node_id, "Video Source", "VIDEO_SRC")
         self.out_frame = generate_uuid()
@@ -4280,9 +4652,138 @@ class VideoSourceNode(BaseNode):
         self.state['receiver_folder'] = 'Captured_Images/go1_front'
         self.state['max_frames'] = 300
         self._started = False
-        self._last_frame = None
-        self._last_perf_file = None
+        self._last_frame = None      # core.frames.Frame (새 파일을 읽었을 때만 새 seq)
+        self._last_frame_file = None
         self._auto_stopped_by_timer = False
+        self._ring_seq = 0           # frame_bus 링에서 마지막으로 읽은 seq
+        self._ring_min_ts = 0.0      # START 이전(이전 세션)의 링 프레임은 무시
+        self._ring_idle_since = None
+        self._rx = None              # 마지막으로 읽은 프로세스 내 RTP 수신기와 그 프레임 번호
+        self._rx_seq = 0
+        self._folder_index = None    # _FrameFolderIndex (파일 핸드오프일 때만)
+        self._folder_seq = 0
+        self._store = None           # core.slot_store 슬롯 파일 저장소 (수신 폴더에 latest.idx가 있을 때)
+        self._store_seq = 0
+        self._pool_seq = 0           # decode_pool 최신 프레임 슬롯에서 마지막으로 읽은 번호
+
+    def _frame_probe(self):
+        # 엔진 I/O 루프에서 호출: RTP 수신기/링/폴더 인덱스의 최신 프레임 번호가 바뀌면 True
+        rx = go1_rtp_receiver
+        index = self._folder_index
+        if (rx is not None and rx.on_frame is not None) or (index is not None and index.on_frame is not None):
+            return decode_pool.latest(GO1_DECODE_KEY)[0] != self._pool_seq
+        if rx is not None:
+            return rx is not self._rx or rx.latest()[0] != self._rx_seq
+        if frame_bus.enabled():
+            ring = frame_bus.open_reader(self.RING_KEY)
+            if ring is not None:
+                return ring.latest_seq() != self._ring_seq
+        if self._store is not None:
+            return self._store.latest_seq() != self._store_seq
+        return index is not None and index.latest()[0] != self._folder_seq
+
+    def _read_pool(self):
+        """수신 스레드가 decode_pool에 제출한 최신 프레임 (대개 이미 디코딩됨). 새 프레임이 없으면 None."""
+        count, frame = decode_pool.latest(GO1_DECODE_KEY)
+        if count == self._pool_seq:
+            return None
+        self._pool_seq = count
+        return frame
+
+    def _read_receiver(self, rx):
+        """프로세스 내 RTP 수신기의 최신 완성 프레임 (JPEG 바이트 그대로). 새 프레임이 없으면 None."""
+        seq, ts, data = rx.latest()
+        if rx is self._rx and seq == self._rx_seq:
+            return None
+        self._rx = rx
+        self._rx_seq = seq
+        if data is None:
+            return None
+        return Frame.from_jpeg(data, ts, source='rtp')
+
+    def _read_ring(self, ring):
+        """링의 최신 프레임을 Frame으로 복사 (glob/정렬/stat/삭제 없음). 새 프레임이 없으면 None."""
+        seq = ring.latest_seq()
+        now = time.time()
+        if seq == self._ring_seq:
+            # 1초 넘게 새 프레임이 없으면 수신 프로세스가 재시작됐는지(새 세그먼트) 확인
+            if self._ring_idle_since is None:
+                self._ring_idle_since = now
+            elif now - self._ring_idle_since > 1.0:
+                self._ring_idle_since = now
+                if frame_bus.reopen_reader(self.RING_KEY):
+                    self._ring_seq = 0
+            return None
+        self._ring_seq = seq
+        self._ring_idle_since = None
+        rs = ring.read(seq)
+        if rs is None or rs.ts < self._ring_min_ts:
+            return None
+        return ring.to_frame(rs, source=ring.name)
+
+    def _read_store(self, store):
+        """슬롯 파일 저장소의 최신 프레임 (latest.idx + 슬롯 파일 하나, glob/정리 없음). 새 프레임이 없으면 None."""
+        item = store.read(self._store_seq)
+        if item is None:
+            return None
+        seq, ts, path, data = item
+        self._store_seq = seq
+        if ts < self._ring_min_ts or not is_complete_jpeg(data):
+            return None   # START 이전(이전 세션)에 남은 프레임
+        self._last_frame_file = path
+        return Frame.from_jpeg(data, ts, source=GO1_DECODE_KEY)
+
+    def _folder_index_for(self, folder, max_frames):
+        index = self._folder_index
+        if index is None or index.folder != folder or index.max_frames != max_frames:
+            if index is not None:
+                index.stop()
+            on_frame = _submit_go1_jpeg if decode_pool.enabled else None
+            decode_pool.clear(GO1_DECODE_KEY)
+            index = self._folder_index = _FrameFolderIndex(folder, max_frames, on_frame=on_frame)
+            self._folder_seq = 0
+            self._pool_seq = 0
+        return index
+
+    def _release_folder_index(self):
+        if self._folder_index is not None:
+            self._folder_index.stop()
+            self._folder_index = None
+
+    def _read_folder(self):
+        """수신 폴더에서 쓰기가 끝난 최신 JPEG 파일을 Frame으로 (링/수신기가 없을 때의 파일 경로). 새 파일이 없으면 None.
+
+        core.slot_store 수신기가 쓰는 폴더면 latest.idx로 바로 찾음. 그 밖의 폴더(multifilesink 등)는
+        목록/정리를 _FrameFolderIndex 스레드가 맡으므로 여기서는 최신 경로 하나만 읽음.
+        """
+        source_folder = str(self.state.get('receiver_folder', 'Captured_Images/go1_front')).strip() or 'Captured_Images/go1_front'
+        store = self._store = slot_store.open_reader(source_folder) if slot_store.enabled() else None
+        if store is not None:
+            self._release_folder_index()
+            return self._read_store(store)
+        try:
+            max_frames = max(10, int(float(self.state.get('max_frames', 300))))
+        except Exception:
+            max_frames = 300
+        index = self._folder_index_for(source_folder, max_frames)
+        if index.on_frame is not None:
+            return self._read_pool()   # 인덱스 스레드가 파일을 읽어 디코드 풀에 제출함
+        seq, target_file = index.latest()
+        if seq == self._folder_seq or target_file is None:
+            # 이미 읽은 최신 파일: 다시 읽지 않고 같은 Frame(같은 seq)을 내보냄
+            return None
+        self._folder_seq = seq
+        # 디코딩하지 않고 JPEG 바이트 그대로 전달: 픽셀이 필요한 노드가 처음 읽을 때 디코딩됨
+        try:
+            with open(target_file, 'rb') as f:
+                data = f.read()
+            capture_ts = os.path.getmtime(target_file)
+        except OSError:
+            return None   # 그 사이 정리된 파일
+        if not is_complete_jpeg(data):
+            return None
+        self._last_frame_file = target_file
+        return Frame.from_jpeg(data, capture_ts, source=GO1_DECODE_KEY)
 
     def execute(self):
         if not HAS_CV2:
@@ -4293,7 +4794,9 @@ class VideoSourceNode(BaseNode):
             self._auto_stopped_by_timer = False
 
         run_flag = bool(engine_module.is_running and not self._auto_stopped_by_timer)
-        target_ip = str(self.state.get('target_ip', get_local_ip())).strip() or get_local_ip()
+        target_ip = str(self.state.get('target_ip') or '').strip()
+        if not target_ip:
+            target_ip = self.state['target_ip'] = get_local_ip()
         
         if run_flag:
             if not self._started and camera_state['status'] in ['Stopped', 'Stopping...']:
@@ -4314,51 +4817,39 @@ class VideoSourceNode(BaseNode):
                         break
                 camera_command_queue.append(('START_CMD', target_ip, receiver_folder, start_duration))
                 self._started = True
+                self._ring_min_ts = time.time()
+            self.wake_on_change(self._frame_probe)
         else:
+            self.clear_wake_probe()
             if self._started and camera_state['status'] in ['Running', 'Starting...']:
                 camera_command_queue.append(('STOP', target_ip))
             self._started = False
             self._last_frame = None
+            self._last_frame_file = None
+            self._release_folder_index()
+            self._store = None
             self.output_data[self.out_frame] = None
             return None
 
-        # 수신 전용 폴더에서 최신 안정 프레임 읽기 (VIS_SAVE 출력 폴더와 분리)
         frame = self._last_frame
         got_fresh_frame = False
+        rx = go1_rtp_receiver
+        ring = frame_bus.open_reader(self.RING_KEY) if rx is None and frame_bus.enabled() else None
         try:
-            source_folder = str(self.state.get('receiver_folder', 'Captured_Images/go1_front')).strip() or 'Captured_Images/go1_front'
-            try:
-                max_frames = max(10, int(float(self.state.get('max_frames', 300))))
-            except Exception:
-                max_frames = 300
-
-            files = glob.glob(os.path.join(source_folder, "front_*.jpg"))
-            if len(files) >= 2:
-                files.sort(key=os.path.getctime)
-                if len(files) > max_frames:
-                    for old_file in files[:len(files) - max_frames]:
-                        try:
-                            os.remove(old_file)
-                        except Exception:
-                            pass
-                    files = files[len(files) - max_frames:]
-                # 최신 파일은 쓰기 중일 수 있으므로 직전 파일부터 역순 탐색
-                candidates = files[:-1][-5:]
-                for target_file in reversed(candidates):
-                    if not _is_file_stable(target_file):
-                        continue
-                    loaded = cv2.imread(target_file)
-                    if loaded is not None and len(loaded.shape) >= 2 and loaded.shape[1] > 1:
-                        self._last_frame = loaded
-                        frame = loaded
-                        got_fresh_frame = True
-                        # 같은 파일을 여러 틱에서 반복 소비해도 한 번만 카운트 (실제 신규 프레임 처리율)
-                        if target_file != self._last_perf_file:
-                            self._last_perf_file = target_file
-                            record_perf_event('video_source')
-                        break
+            # 프로세스 내 RTP 수신기 > 공유 메모리 링 > 수신 전용 폴더 (VIS_SAVE 출력 폴더와 분리)
+            if rx is not None:
+                fresh = self._read_pool() if rx.on_frame is not None else self._read_receiver(rx)
+            elif ring is not None:
+                fresh = self._read_ring(ring)
+            else:
+                fresh = self._read_folder()
         except Exception:
-            frame = self._last_frame
+            fresh = None
+        if fresh is not None:
+            frame = fresh
+            self._last_frame = fresh
+            got_fresh_frame = True
+            record_perf_event('video_source')
 
         # Delay camera timer start until the first valid frame is actually available.
         if got_fresh_frame and camera_state.get('status') == 'Running' and float(camera_state.get('start_time', 0.0) or 0.0) <= 0.0:
@@ -4372,6 +4863,8 @@ class VideoSourceNode(BaseNode):
 
 
 class FisheyeUndistortNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    RATE_GROUP = 'vision'
     def __init__(self, node_id):
         super().__init__(node_id, "Fisheye Undistort", "VIS_FISHEYE")
         self.in_frame = generate_uuid()
@@ -4382,19 +4875,33 @@ class FisheyeUndistortNode(BaseNode):
         self.state['crop_enabled'] = True
         self.state['crop_mode'] = 'left_half'
         self.state['crop_ratio'] = 0.5
+        self._done_settings = None
 
     def execute(self):
-        frame = self.fetch_input_data(self.in_frame)
-        if frame is None or not HAS_CV2:
+        if not self.output_demanded(self.out_frame):
+            # 출력을 읽는 링크가 없으면 보정/크롭을 하지 않음 (풀 버퍼도 놓아줌)
+            self._done_settings = None
+            self.output_data[self.out_frame] = None
+            return None
+        src, is_new = self.fetch_frame(self.in_frame)
+        if src is None or not HAS_CV2:
+            return None
+        # 새 프레임이 없고 설정도 그대로면 이전 출력 유지
+        settings = tuple(self.state.items())
+        if not is_new and settings == self._done_settings:
             return None
+        self._done_settings = None
+        frame = frame_image(src)
 
         try:
             use_calib = _coerce_bool(self.state.get('enabled', True), True)
             if use_calib:
+                # 출력 버퍼는 풀에서 (이전 출력 Frame을 아무도 참조하지 않으면 재사용)
                 undistorted = cv2.fisheye.undistortImage(
                     frame,
                     _default_camera_matrix,
                     _default_dist_coeffs,
+                    undistorted=frame_pool.acquire(frame.shape, frame.dtype, self.type_str),
                     Knew=_default_camera_matrix,
                 )
             else:
@@ -4413,13 +4920,16 @@ class FisheyeUndistortNode(BaseNode):
                         crop_w = max(1, w // 2)
                     out_frame = out_frame[:, :crop_w]
 
-            self.output_data[self.out_frame] = out_frame
+            self.output_data[self.out_frame] = derive_frame(src, out_frame)
+            self._done_settings = settings
         except Exception:
-            self.output_data[self.out_frame] = frame
+            self.output_data[self.out_frame] = src
         return None
 
 
 class DepthAnythingV2Node(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    RATE_GROUP = 'vision'
     def __init__(self, node_id):
         super().__init__(node_id, "Depth Anything V2", "VIS_DEPTH_DA2")
         self.in_frame = generate_uuid()
@@ -4456,6 +4966,7 @@ class DepthAnythingV2Node(BaseNode):
         self.state['json_path'] = 'depth_da2_data.json'
 
         self._last_infer_ts = 0.0
+        self._last_infer_seq = None  # 마지막으로 추론한 입력 Frame.seq (같은 프레임은 다시 추론하지 않음)
         self._last_depth = None
         self._last_vis = None
         self._last_json = ""
@@ -4464,7 +4975,8 @@ class DepthAnythingV2Node(BaseNode):
         self._risk_hit_count = 0
         self._last_error = ""
 
-    def _run_inference(self, frame):
+    def _run_inference(self, src):
+        frame = frame_image(src)
         backend = str(self.state.get('backend', 'transformers')).strip().lower()
         prefer_cuda = _coerce_bool(self.state.get('prefer_cuda', True), True)
         input_size = max(64, _coerce_int(self.state.get('input_size', 518), 518))
@@ -4494,7 +5006,7 @@ class DepthAnythingV2Node(BaseNode):
         if not HAS_PIL or Image is None:
             raise RuntimeError('PIL is required for transformers backend')
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb = frame_rgb(src)
         pil_img = Image.fromarray(rgb)
         result = pipe(pil_img)
         raw_depth = result.get('depth') if isinstance(result, dict) else None
@@ -4503,9 +5015,10 @@ class DepthAnythingV2Node(BaseNode):
         return np.asarray(raw_depth, dtype=np.float32)
 
     def execute(self):
-        frame = self.fetch_input_data(self.in_frame)
+        src = self.fetch_input_data(self.in_frame)
+        frame = frame_image(src)
         if frame is None or not HAS_CV2 or np is None:
-            self.output_data[self.out_frame] = frame
+            self.output_data[self.out_frame] = src
             self.output_data[self.out_depth] = None
             self.output_data[self.out_near_score] = 0.0
             self.output_data[self.out_obstacle] = False
@@ -4514,7 +5027,7 @@ class DepthAnythingV2Node(BaseNode):
 
         if not _coerce_bool(self.state.get('enabled', True), True):
             self._risk_hit_count = 0
-            self.output_data[self.out_frame] = frame
+            self.output_data[self.out_frame] = src
             self.output_data[self.out_depth] = None
             self.output_data[self.out_near_score] = 0.0
             self.output_data[self.out_obstacle] = False
@@ -4523,10 +5036,14 @@ class DepthAnythingV2Node(BaseNode):
 
         infer_interval = max(0.02, _coerce_float(self.state.get('inference_interval_sec', 0.2), 0.2))
         now = time.monotonic()
-        should_infer = (self._last_depth is None) or ((now - self._last_infer_ts) >= infer_interval)
+        src_seq = frame_seq(src)
+        new_frame = src_seq is None or src_seq != self._last_infer_seq
+        should_infer = (self._last_depth is None) or (new_frame and (now - self._last_infer_ts) >= infer_interval)
         backend = str(self.state.get('backend', 'transformers')).strip().lower()
 
-        vis_frame = self._last_vis if self._last_vis is not None else frame
+        vis_frame = self._last_vis if self._last_vis is not None else src
+        if not self.output_demanded(self.out_frame):
+            vis_frame = None  # 읽는 링크가 없으면 입력 프레임(풀 버퍼)을 붙잡아 두지 않음
         depth_map = self._last_depth
         near_score = float(self._last_near_score)
         obstacle = bool(self._last_obstacle)
@@ -4535,7 +5052,7 @@ class DepthAnythingV2Node(BaseNode):
         if should_infer:
             start_t = time.perf_counter()
             try:
-                depth_map = self._run_inference(frame)
+                depth_map = self._run_inference(src)
                 norm = _normalize_depth_for_visual(depth_map)
 
                 if norm is None:
@@ -4570,14 +5087,19 @@ class DepthAnythingV2Node(BaseNode):
                 required_hits = max(1, _coerce_int(self.state.get('consecutive_frames_for_stop', 2), 2))
                 stop_recommended = bool(obstacle and self._risk_hit_count >= required_hits)
                 if stop_recommended and _coerce_bool(self.state.get('use_stop_signal', False), False):
-                    go1_node_intent['stop'] = True
-                    go1_node_intent['trigger_time'] = time.monotonic()
-
-                vis_gray = np.clip(norm * 255.0, 0, 255).astype(np.uint8)
-                vis_color = cv2.applyColorMap(vis_gray, cv2.COLORMAP_INFERNO)
-                cv2.rectangle(vis_color, (px0, py0), (px1 - 1, py1 - 1), (255, 255, 255), 2)
-                text = f"NearScore:{near_score:.2f} Thr:{risk_threshold:.2f} {'STOP' if stop_recommended else 'SAFE'}"
-                cv2.putText(vis_color, text, (10, 24), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+                    with go1_intent_lock:   # 비전 컴포넌트는 워커 스레드에서 실행될 수 있음
+                        go1_node_intent['stop'] = True
+                        go1_node_intent['trigger_time'] = time.monotonic()
+
+                # 시각화/JSON 텍스트는 해당 출력을 읽는 링크가 있을 때만 만듦 (near_score/obstacle은 항상)
+                vis_color = None
+                if self.output_demanded(self.out_frame):
+                    vis_gray = np.clip(norm * 255.0, 0, 255).astype(np.uint8)
+                    vis_color = cv2.applyColorMap(vis_gray, cv2.COLORMAP_INFERNO,
+                                                  dst=frame_pool.acquire(vis_gray.shape + (3,), np.uint8, self.type_str))
+                    cv2.rectangle(vis_color, (px0, py0), (px1 - 1, py1 - 1), (255, 255, 255), 2)
+                    text = f"NearScore:{near_score:.2f} Thr:{risk_threshold:.2f} {'STOP' if stop_recommended else 'SAFE'}"
+                    cv2.putText(vis_color, text, (10, 24), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
 
                 infer_latency_ms = (time.perf_counter() - start_t) * 1000.0
                 payload = {
@@ -4592,7 +5114,7 @@ class DepthAnythingV2Node(BaseNode):
                     'roi': {'x0': px0, 'y0': py0, 'x1': px1, 'y1': py1, 'width': w, 'height': h},
                     'infer_latency_ms': round(float(infer_latency_ms), 2),
                 }
-                payload_json = json.dumps(payload)
+                payload_json = json.dumps(payload) if self.output_demanded(self.out_json) else ""
 
                 if _coerce_bool(self.state.get('save_json', False), False):
                     json_path = str(self.state.get('json_path', 'depth_da2_data.json')).strip() or 'depth_da2_data.json'
@@ -4600,13 +5122,14 @@ class DepthAnythingV2Node(BaseNode):
                         write_log(f"[VIS_DEPTH_DA2] JSON save failed: path={json_path}")
 
                 self._last_depth = depth_map
-                self._last_vis = vis_color
+                self._last_vis = derive_frame(src, vis_color) if vis_color is not None else None
+                self._last_infer_seq = src_seq
                 self._last_json = payload_json
                 self._last_near_score = near_score
                 self._last_obstacle = obstacle
                 self._last_infer_ts = now
                 self._last_error = ""
-                vis_frame = vis_color
+                vis_frame = self._last_vis
             except Exception as e:
                 self._last_error = str(e)
                 write_log(f"[VIS_DEPTH_DA2] {self._last_error}")
@@ -4619,7 +5142,7 @@ class DepthAnythingV2Node(BaseNode):
                 self._last_json = payload_json
                 self._risk_hit_count = 0
                 depth_map = self._last_depth
-                vis_frame = frame
+                vis_frame = src
                 near_score = 0.0
                 obstacle = False
 
@@ -4632,6 +5155,8 @@ class DepthAnythingV2Node(BaseNode):
 
 
 class ArUcoDetectNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    RATE_GROUP = 'vision'
     def __init__(self, node_id):
         super().__init__(node_id, "ArUco Detect", "VIS_ARUCO")
         self.in_frame = generate_uuid()
@@ -4649,20 +5174,30 @@ class ArUcoDetectNode(BaseNode):
         self.state['json_path'] = 'aruco_data.json'
         self.state['draw_axes'] = True
         self.state['draw_overlay_text'] = True
+        self._done_settings = None
 
     def execute(self):
-        frame = self.fetch_input_data(self.in_frame)
-        if frame is None or not HAS_CV2 or _aruco_detector is None:
-            self.output_data[self.out_frame] = frame
+        src, is_new = self.fetch_frame(self.in_frame)
+        if src is None or not HAS_CV2 or _aruco_detector is None:
+            self._done_settings = None
+            self.output_data[self.out_frame] = src
             self.output_data[self.out_data] = []
             self.output_data[self.out_json] = ""
             return None
+        # 이미 처리한 프레임이면 검출/JSON 저장/UDP 전송을 반복하지 않고 이전 출력 유지
+        settings = (tuple(self.state.items()), self.demanded_outputs)
+        if not is_new and settings == self._done_settings:
+            return None
+        self._done_settings = None
+        frame = frame_image(src)
 
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        gray = frame_gray(src)  # 같은 프레임의 gray는 다른 노드와 공유 (core.frames.derived_cache)
         corners, ids, _ = _aruco_detector.detectMarkers(gray)
 
         detected = []
-        draw = frame.copy()
+        # 입력 Frame은 읽기 전용: 오버레이는 풀에서 받은 복사본에 그림 (copy-on-write).
+        # 오버레이 프레임 출력을 읽는 링크가 없으면 복사/그리기 생략 (마커 데이터/JSON은 그대로)
+        draw = frame_pool.copy(frame, self.type_str) if self.output_demanded(self.out_frame) else None
         marker_size_m = max(0.0, _coerce_float(self.state.get('marker_size_m', 0.03), 0.03))
         if marker_size_m <= 0.0:
             marker_size_m = 0.03
@@ -4693,16 +5228,17 @@ class ArUcoDetectNode(BaseNode):
                 if not ret or rvec is None or tvec is None:
                     continue
 
-                if _coerce_bool(self.state.get('draw_axes', True), True):
+                if draw is not None and _coerce_bool(self.state.get('draw_axes', True), True):
                     try:
                         cv2.drawFrameAxes(draw, camera_matrix, dist_coeffs, rvec, tvec, 0.03)
                     except Exception:
                         pass
 
-                try:
-                    cv2.aruco.drawDetectedMarkers(draw, corners)
-                except Exception:
-                    pass
+                if draw is not None:
+                    try:
+                        cv2.aruco.drawDetectedMarkers(draw, corners)
+                    except Exception:
+                        pass
 
                 tx = float(tvec[0][0])
                 ty = float(tvec[1][0])
@@ -4716,7 +5252,7 @@ class ArUcoDetectNode(BaseNode):
                 }
                 detected.append(marker_data)
 
-                if _coerce_bool(self.state.get('draw_overlay_text', True), True):
+                if draw is not None and _coerce_bool(self.state.get('draw_overlay_text', True), True):
                     try:
                         text = f"[{camera_id}] ID:{int(marker_id)} X:{tx:.2f} Y:{ty:.2f} Z:{tz:.2f}"
                         cx = int(corners[i][0][0][0])
@@ -4749,9 +5285,10 @@ class ArUcoDetectNode(BaseNode):
             except Exception as e:
                 write_log(f"[VIS_ARUCO] JSON save failed: {e} | path={json_path}")
 
-        self.output_data[self.out_frame] = draw
+        self.output_data[self.out_frame] = derive_frame(src, draw) if draw is not None else None
         self.output_data[self.out_data] = detected
         self.output_data[self.out_json] = payload_json
+        self._done_settings = settings
         return None
 
 
@@ -4775,12 +5312,15 @@ if HAS_FLASK:
 
 
 class FlaskStreamNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    RATE_GROUP = 'vision'
     def __init__(self, node_id):
         super().__init__(node_id, "Flask Stream", "VIS_FLASK")
         self.in_frame = generate_uuid()
         self.inputs[self.in_frame] = PortType.DATA
         self.state['port'] = 5000
         self.state['is_running'] = False
+        self.state['downscale'] = 0   # 피라미드 단계: 0 = 원본, 1 = 1/2, 2 = 1/4 (축소본은 프레임별로 공유)
         self._started_local = False
 
     def _start_server_once(self):
@@ -4808,13 +5348,14 @@ class FlaskStreamNode(BaseNode):
                 self._start_server_once()
                 self._started_local = True
 
-            frame = self.fetch_input_data(self.in_frame)
-            if frame is not None:
-                ok, buf = cv2.imencode('.jpg', frame)
-                if ok:
-                    with _flask_lock:
-                        global _flask_latest_jpg
-                        _flask_latest_jpg = buf.tobytes()
+            frame, is_new = self.fetch_frame(self.in_frame)
+            if is_new:  # 같은 프레임은 다시 인코딩하지 않음
+                # 원본 JPEG를 가진 프레임은 그대로 전달 (디코딩/재인코딩 없음)
+                level = _clamp(_coerce_int(self.state.get('downscale', 0), 0), 0, 3)
+                data = frame_jpeg(frame, level)
+                with _flask_lock:
+                    global _flask_latest_jpg
+                    _flask_latest_jpg = data
 
         return None
 
@@ -4826,6 +5367,9 @@ class VideoFrameSaveNode(BaseNode):
     - 이미지를 JPEG 파일로 저장
     - 타이머 설정 가능 (타이머 종료 후 저장 중단)
     - 타이머 미설정 시 Max Frames 초과 파일 자동 삭제
+    - Slot Files(slot_files) 설정 시(타이머 OFF): front_*.jpg 대신 Max Frames개 고정 슬롯 파일
+      + latest.idx를 돌려 씀 (core/slot_store.py, 삭제/glob 없음). 폴더를 front_*.jpg로 읽는
+      다른 프로그램이 있으면 끈 채로 둠 (기본값 OFF)
     """
     def __init__(self, node_id):
         super().__init__(node_id, "Video Save", "VIS_SAVE")
@@ -4840,6 +5384,8 @@ class VideoFrameSaveNode(BaseNode):
         self.state['duration'] = 10.0
         self.state['use_timer'] = False
         self.state['max_frames'] = 100
+        self.state['downscale'] = 0   # 0 = 원본 해상도로 저장, 1 = 1/2, 2 = 1/4
+        self.state['slot_files'] = False   # True: 프레임 파일 대신 고정 슬롯 파일 + latest.idx (타이머 OFF일 때)
         
         self._save_start_time = None
         self._frame_count = 0
@@ -4896,6 +5442,9 @@ class VideoFrameSaveNode(BaseNode):
             max_frames = max(1, int(float(raw_max_frames)))
         except Exception:
             max_frames = 100
+        # 송신기와 같은 규칙으로 전달 경로 하나만 사용 (슬롯 파일 / 링 / 파일 캐시)
+        handoff = _saved_handoff(self.state)
+        use_slots = handoff == 'slots'
 
         if not is_saving:
             self._timer_completed_this_run = False
@@ -4946,9 +5495,9 @@ class VideoFrameSaveNode(BaseNode):
                 camera_command_queue.append(('STOP', ''))
                 return self.out_flow
 
-        # 프레임 저장
-        frame = self.fetch_input_data(self.in_frame)
-        if frame is not None and HAS_CV2 and (self._save_start_time is not None or self._save_armed):
+        # 프레임 저장 (이미 저장한 프레임은 건너뜀)
+        frame, is_new = self.fetch_frame(self.in_frame)
+        if is_new and HAS_CV2 and (self._save_start_time is not None or self._save_armed):
             try:
                 if self._save_start_time is None:
                     self._save_start_time = time.time()
@@ -4956,18 +5505,28 @@ class VideoFrameSaveNode(BaseNode):
                     camera_save_state['start_time'] = self._save_start_time
                     write_log("[VIS_SAVE] first frame received - timer started")
 
-                self._frame_index += 1
-                filename = os.path.join(folder, f"front_{self._frame_index:06d}.jpg")
-                success = cv2.imwrite(filename, frame)
-                if success:
-                    self._save_armed = False
-                    self._frame_count += 1
-                    camera_save_state['frame_count'] = self._frame_count
+                level = _clamp(_coerce_int(self.state.get('downscale', 0), 0), 0, 3)
+                data = frame_jpeg(frame, level)
+                if use_slots:
+                    # Max Frames 창을 고정 슬롯에 게시, 송신기는 latest.idx로 찾음
+                    slot_store.open_writer(folder, max_frames).publish(data)
+                else:
+                    self._frame_index += 1
+                    filename = os.path.join(folder, f"front_{self._frame_index:06d}.jpg")
+                    with open(filename, 'wb') as f:
+                        f.write(data)
+                if handoff == 'ring':
+                    frame_bus.open_writer(GO1_SAVED_RING).write_jpeg(data)  # 송신기는 링에서 바로 업로드
+                elif handoff == 'files':
+                    _remember_saved_jpeg(filename, data)  # 송신기는 디스크에서 다시 읽지 않음
+                self._save_armed = False
+                self._frame_count += 1
+                camera_save_state['frame_count'] = self._frame_count
             except Exception as e:
                 write_log(f"[VIS_SAVE] frame save failed: {e}")
 
-        # Max Frames 정리 (타이머 OFF 상태에서만)
-        if self._save_start_time is not None and not use_timer:
+        # Max Frames 정리 (타이머 OFF 상태에서만, 슬롯 저장소는 정리할 파일이 없음)
+        if self._save_start_time is not None and not use_timer and not use_slots:
             self._prune_saved_frames(folder, max_frames)
         
         return self.out_flow
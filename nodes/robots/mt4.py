@@ -9,7 +9,8 @@ import serial
 from datetime import datetime
 from collections import deque
 from nodes.base import BaseNode, BaseRobotDriver
-from core.engine import generate_uuid, PortType, write_log, HwStatus, node_registry
+from core.engine import generate_uuid, PortType, write_log, HwStatus, node_registry, ExecRole, FlowVisit, Priority
+from core.async_io import engine_io
 from core.mt4_config import MT4_NETWORK_CONFIG, MT4_HARDWARE_CONFIG, MT4_GCODE_CONFIG, MT4_KEYBOARD_CONFIG
 
 # --- MT4 Globals ---
@@ -296,6 +297,7 @@ def play_mt4_path_thread(filepath):
 # --- Nodes Implementation ---
 
 class MT4RobotDriver(BaseRobotDriver):
+    COMPONENT_GROUP = 'mt4_control'
     def __init__(self): 
         self.last_cmd = ""
         self.last_write_time = 0
@@ -368,9 +370,15 @@ class MT4RobotDriver(BaseRobotDriver):
 
 
 class UniversalRobotNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    SAFETY_CRITICAL = True
+    PRIORITY = Priority.SAFETY
+    # 키보드 + 자율 주행 등 여러 Flow가 들어와도 틱당 한 번, 모든 입력이 갱신된 뒤 명령 전송
+    FLOW_VISIT = FlowVisit.MERGE
     def __init__(self, node_id, driver, node_label="MT4 Driver", node_type="MT4_DRIVER"):
         super().__init__(node_id, node_label, node_type)
         self.driver = driver
+        self.COMPONENT_GROUP = driver.COMPONENT_GROUP  # 같은 로봇의 액션/텔레옵 노드와 한 컴포넌트
         self.in_pins = {}; self.setting_pins = {}
 
         for k, lbl, def_v in self.driver.get_ui_schema():
@@ -407,6 +415,7 @@ class UniversalRobotNode(BaseNode):
 
 
 class MT4CommandActionNode(BaseNode):
+    COMPONENT_GROUP = 'mt4_control'
     def __init__(self, node_id): 
         super().__init__(node_id, "MT4 Action", "MT4_ACTION")
         self.in_val1 = generate_uuid(); self.inputs[self.in_val1] = PortType.DATA
@@ -433,6 +442,8 @@ class MT4CommandActionNode(BaseNode):
 
 
 class MT4KeyboardNode(BaseNode):
+    COMPONENT_GROUP = 'mt4_control'
+    EXEC_ROLE = ExecRole.SOURCE
     def __init__(self, node_id):
         super().__init__(node_id, "Keyboard (MT4)", "MT4_KEYBOARD")
         self.out_x = generate_uuid(); self.outputs[self.out_x] = PortType.DATA
@@ -489,6 +500,8 @@ class MT4KeyboardNode(BaseNode):
 
 
 class MT4UnityNode(BaseNode):
+    COMPONENT_GROUP = 'mt4_control'
+    EXEC_ROLE = ExecRole.SOURCE
     def __init__(self, node_id):
         super().__init__(node_id, "Unity Logic (MT4)", "MT4_UNITY")
         self.data_in_id = generate_uuid(); self.inputs[self.data_in_id] = PortType.DATA
@@ -559,6 +572,8 @@ class MT4UnityNode(BaseNode):
 
 
 class UDPReceiverNode(BaseNode):
+    COMPONENT_GROUP = 'mt4_control'
+    EXEC_ROLE = ExecRole.SOURCE
     def __init__(self, node_id):
         super().__init__(node_id, "UDP Receiver", "UDP_RECV")
         self.out_flow = generate_uuid(); self.outputs[self.out_flow] = PortType.FLOW
@@ -575,6 +590,7 @@ class UDPReceiverNode(BaseNode):
         MT4_UNITY_IP = self.state.get("ip", "192.168.50.63")
         if not self.is_bound or self.current_port != port:
             try:
+                engine_io.unwatch(self.sock)
                 self.sock.close()
                 self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM); self.sock.setblocking(False)
                 self.sock.bind(('0.0.0.0', port)); self.is_bound = True; self.current_port = port
@@ -591,10 +607,15 @@ class UDPReceiverNode(BaseNode):
                     write_log(f"Unity Command: {decoded[:60]}...")
                     self.output_data[self.out_json] = decoded; self.last_data_str = decoded
         except: pass
+        # 수신 버퍼를 비운 뒤 다시 감시: 다음 패킷 도착 시 엔진을 바로 깨움
+        self.wake_on_readable(self.sock)
         return self.out_flow
 
 
 class MT4GravitySagNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    PURE = True
+
     def __init__(self, node_id):
         super().__init__(node_id, "Gravity Sag Comp (StR)", "MT4_SAG")
         self.in_x = generate_uuid(); self.inputs[self.in_x] = PortType.DATA
@@ -613,6 +634,9 @@ class MT4GravitySagNode(BaseNode):
         return None
 
 class MT4CalibrationNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    PURE = True
+
     def __init__(self, node_id):
         super().__init__(node_id, "3D Calibration (StR)", "MT4_CALIB")
         self.in_x = generate_uuid(); self.inputs[self.in_x] = PortType.DATA
@@ -635,6 +659,9 @@ class MT4CalibrationNode(BaseNode):
         return None
 
 class MT4TooltipNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    PURE = True
+
     def __init__(self, node_id):
         super().__init__(node_id, "Tool-tip Offset (StR)", "MT4_TOOLTIP")
         self.in_x = generate_uuid(); self.inputs[self.in_x] = PortType.DATA
@@ -657,6 +684,9 @@ class MT4TooltipNode(BaseNode):
         return None
 
 class MT4BacklashNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    PURE = True
+
     def __init__(self, node_id):
         super().__init__(node_id, "Backlash & Inertia (StR)", "MT4_BACKLASH")
         self.in_x = generate_uuid(); self.inputs[self.in_x] = PortType.DATA
@@ -667,7 +697,12 @@ class MT4BacklashNode(BaseNode):
         self.out_z = generate_uuid(); self.outputs[self.out_z] = PortType.DATA
         self.state.update({'decel_dist': 15.0, 'stop_delay': 100.0})
         self.internal_pos = None
-        
+        self._settled = False
+
+    def memo_ready(self):
+        # internal_pos가 목표에 수렴하기 전에는 같은 입력이라도 출력이 계속 변하므로 생략 불가
+        return self._settled
+
     def execute(self):
         tx = self.fetch_input_data(self.in_x)
         ty = self.fetch_input_data(self.in_y)
@@ -683,6 +718,7 @@ class MT4BacklashNode(BaseNode):
         
         speed = 1.0 if dist > decel_dist else max(0.01, (dist / decel_dist) * (50.0 / delay_factor))
         self.internal_pos[0] += dx * speed; self.internal_pos[1] += dy * speed; self.internal_pos[2] += dz * speed
+        self._settled = dist * abs(1.0 - speed) < 1e-6
         
         self.output_data[self.out_x] = self.internal_pos[0]
         self.output_data[self.out_y] = self.internal_pos[1]
@@ -5,7 +5,7 @@ from typing import Optional
 from djitellopy import Tello
 
 from nodes.base import BaseNode, BaseRobotDriver
-from core.engine import generate_uuid, PortType, write_log
+from core.engine import generate_uuid, PortType, write_log, ExecRole, FlowVisit, Priority
 
 TELLO_NETWORK_CONFIG = {
     "rc_interval_sec": 0.05,
@@ -126,6 +126,7 @@ def shutdown_tello():
 
 
 class TelloRobotDriver(BaseRobotDriver):
+    COMPONENT_GROUP = 'tello_control'
     def __init__(self):
         self.last_rc_command = ""
         self.last_rc_time = 0.0
@@ -254,9 +255,14 @@ class TelloRobotDriver(BaseRobotDriver):
 
 
 class UniversalRobotNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    SAFETY_CRITICAL = True
+    PRIORITY = Priority.SAFETY
+    FLOW_VISIT = FlowVisit.MERGE
     def __init__(self, node_id, driver, node_label="Tello Driver", node_type="TELLO_DRIVER"):
         super().__init__(node_id, node_label, node_type)
         self.driver = driver
+        self.COMPONENT_GROUP = driver.COMPONENT_GROUP  # 같은 로봇의 액션/텔레옵 노드와 한 컴포넌트
         self.in_pins = {}
         self.setting_pins = {}
 
@@ -292,6 +298,8 @@ class UniversalRobotNode(BaseNode):
 
 
 class TelloKeyboardNode(BaseNode):
+    COMPONENT_GROUP = 'tello_control'
+    EXEC_ROLE = ExecRole.SOURCE
     def __init__(self, node_id):
         super().__init__(node_id, "Keyboard (Tello)", "TELLO_KEYBOARD")
         self.in_flow = generate_uuid()
@@ -370,6 +378,8 @@ class TelloKeyboardNode(BaseNode):
 
 
 class TelloActionNode(BaseNode):
+    COMPONENT_GROUP = 'tello_control'
+    EXEC_ROLE = ExecRole.DATA
     def __init__(self, node_id):
         super().__init__(node_id, "Tello Action", "TELLO_ACTION")
         self.in_flow = generate_uuid()
@@ -0,0 +1,1429 @@
+"""
+Engine tick benchmark (headless, no DearPyGui required).
+
+Builds synthetic graphs of increasing size and reports the average
+execute_graph_once() time against the number of links.
+
+Run: python scripts/bench_engine.py [--ticks 200] [--pure]
+  --pure : also time a chain of PURE data nodes with memoization on/off
+  --parallel : time N independent branches whose nodes block ~2 ms without the GIL
+               (stand-in for cv2/numpy work), serial vs worker pool
+  --go1parallel : real Go1 graph (fisheye -> ArUco, DA2 with a synthetic model, GO1_DRIVER +
+                  GO1_ACTION): components, tick time and share of ticks in which the two
+                  camera components run at the same time on different threads, serial vs pool
+  --watchdog : 50 Hz runner with a 30 ms CPU-bound vision stand-in next to a
+               SAFETY_CRITICAL driver stand-in; driver call interval with the
+               tick watchdog off vs on
+  --fanin : driver-like DATA node reached by two flow branches (keyboard +
+            avoidance), executes per tick under each FlowVisit policy
+  --events : polling runner (50 Hz) vs event-driven runner (wake + heartbeat):
+             process CPU on an idle graph and UDP-packet-to-driver latency
+  --rategroups : control-loop driver next to a 40 ms vision node (GIL released,
+                 like cv2/onnx); vision run inline in the control tick vs in its
+                 own 15 Hz rate group
+  --timers : graph of 100 idle periodic receivers (0.5 s poll interval, the
+             *_RECV stamp-check pattern); tick time with per-tick polling vs
+             engine timers (TIMER_GATED)
+  --errors : 10 nodes that fail after ~1 ms (e.g. a camera that will not open) for
+             3 s at 50 Hz; log lines, tick time and execute() calls with one log line
+             per error vs rate-limited logging vs quarantine (core/quarantine.py)
+  --frames : 15 fps camera stand-in feeding undistort/ArUco/stream/save stand-ins
+             (CPU cost per processed frame) on a 50 Hz tick for 3 s; process CPU
+             with every tick reprocessing vs skipping already-seen Frame.seq
+  --framepool : real VIS_FISHEYE -> VIS_ARUCO pipeline (needs numpy + cv2) fed a new
+                frame every tick at 640x480 and 1280x720; buffer allocations per
+                tick, traced peak memory and RSS with the frame pool off vs on
+  --demand : fisheye -> ArUco + DA2 (model replaced by a synthetic depth map) with
+             only the numeric outputs (markers, near score, obstacle) wired; per-type
+             p50 execute() time with every output computed vs demand-driven outputs
+  --derived : two VIS_ARUCO, DA2 (synthetic model) and 1/2 + 1/4 JPEG encoders on one
+              frame; gray/RGB/pyramid conversions per frame with the derived cache off vs on
+  --jpeg : JPEG camera source feeding stream + save (+ ArUco); decodes/encodes per frame
+           with a decoding source vs JPEG passthrough with lazy decode
+  --framebus : 30 fps camera writer in another process read by VIDEO_SRC at 100 Hz;
+               capture-to-read latency and reader cost through /dev/shm JPEG files
+               (inotify folder index, or its polling fallback) vs the shared-memory
+               frame ring (core/frame_bus.py) vs fixed slot files (core/slot_store.py)
+  --slotstore : VIS_SAVE Max Frames window writer cost: a file per frame + glob/sort/delete
+                cleanup vs publishing into fixed slot files with latest.idx
+  --rtp : in-process RTP/JPEG receiver (core/rtp_jpeg.py): pixel check of frames rebuilt
+          from shuffled packets, then a local sender process at 30 fps (send-to-frame
+          latency, receiver CPU) and at full speed (frames/s the receiver keeps up with)
+  --decode : 30 fps camera JPEGs read at full size or 1/2 by a 30 Hz graph; tick time with
+             lazy decode in the tick vs decode_pool workers (full, or IMREAD_REDUCED for 1/2)
+Also reports how many ticks a value needs to cross a DATA pipeline whose nodes
+were created downstream-first (worst case for registry-order execution).
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.engine as engine
+from core.engine import generate_uuid, PortType, ExecRole, FlowVisit, add_link, clear_links, clear_nodes, register_node
+from core.frames import Frame, frame_image, derive_frame
+from nodes.base import BaseNode
+
+
+class BenchSourceNode(BaseNode):
+    EXEC_ROLE = ExecRole.SOURCE
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Source", "BENCH_SRC")
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.counter = 0
+
+    def execute(self):
+        self.counter += 1
+        self.output_data[self.out_val] = self.counter
+        return None
+
+
+class BenchFlowNode(BaseNode):
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Flow", "BENCH_FLOW")
+        self.in_flow = generate_uuid()
+        self.inputs[self.in_flow] = PortType.FLOW
+        self.in_val = generate_uuid()
+        self.inputs[self.in_val] = PortType.DATA
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.out_flow = generate_uuid()
+        self.outputs[self.out_flow] = PortType.FLOW
+
+    def execute(self):
+        val = self.fetch_input_data(self.in_val)
+        self.output_data[self.out_val] = (val or 0) + 1
+        return self.out_flow
+
+
+class BenchPureNode(BaseNode):
+    """Pure data node: out = in * gain. Polled every tick like MT4_CALIB/MT4_SAG."""
+    PURE = True
+    EXEC_ROLE = ExecRole.DATA
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Pure", "BENCH_PURE")
+        self.in_val = generate_uuid()
+        self.inputs[self.in_val] = PortType.DATA
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.state['gain'] = 1.001
+
+    def execute(self):
+        val = self.fetch_input_data(self.in_val)
+        acc = float(val or 1.0)
+        for _ in range(50):  # stand-in for a few trig/float ops per node
+            acc = acc * float(self.state.get('gain', 1.0))
+        self.output_data[self.out_val] = acc
+        return None
+
+
+def reset_graph():
+    clear_links()
+    clear_nodes()
+
+
+def build_chain(length):
+    """START -> N flow nodes in series, each reading a data pin from a shared source."""
+    from nodes.common import StartNode
+
+    reset_graph()
+    start = StartNode(generate_uuid())
+    register_node(start)
+    src = BenchSourceNode(generate_uuid())
+    register_node(src)
+
+    prev_node, prev_out = start, start.out
+    for _ in range(length):
+        node = BenchFlowNode(generate_uuid())
+        register_node(node)
+        add_link(generate_uuid(), prev_out, node.in_flow, prev_node.node_id, node.node_id)
+        add_link(generate_uuid(), src.out_val, node.in_val, src.node_id, node.node_id)
+        prev_node, prev_out = node, node.out_flow
+    return len(engine.link_registry)
+
+
+def build_pure_chain(length):
+    """N PURE nodes in series (data links only); the head has no input, so the whole chain is stable."""
+    reset_graph()
+    prev = None
+    for _ in range(length):
+        node = BenchPureNode(generate_uuid())
+        register_node(node)
+        if prev is not None:
+            add_link(generate_uuid(), prev.out_val, node.in_val, prev.node_id, node.node_id)
+        prev = node
+    return len(engine.link_registry)
+
+
+class BenchCounterSource(BaseNode):
+    EXEC_ROLE = ExecRole.SOURCE
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Counter", "BENCH_COUNTER")
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.counter = 0
+
+    def execute(self):
+        self.counter += 1
+        self.output_data[self.out_val] = self.counter
+        return None
+
+
+class BenchPassNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Pass", "BENCH_PASS")
+        self.in_val = generate_uuid()
+        self.inputs[self.in_val] = PortType.DATA
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+
+    def execute(self):
+        self.output_data[self.out_val] = self.fetch_input_data(self.in_val)
+        return None
+
+
+def pipeline_lag(length):
+    """Ticks until the tail of a reversed-creation DATA pipeline sees the source's first value."""
+    reset_graph()
+    stages = [BenchPassNode(generate_uuid()) for _ in range(length)]
+    for node in reversed(stages):
+        register_node(node)
+    src = register_node(BenchCounterSource(generate_uuid()))
+    prev_node, prev_out = src, src.out_val
+    for node in stages:
+        add_link(generate_uuid(), prev_out, node.in_val, prev_node.node_id, node.node_id)
+        prev_node, prev_out = node, node.out_val
+    engine.is_running = True
+    for tick in range(1, length + 2):
+        engine.execute_graph_once()
+        if stages[-1].output_data.get(stages[-1].out_val) is not None:
+            return tick
+    return None
+
+
+class BenchBlockingNode(BaseNode):
+    """DATA node that sleeps like a GIL-releasing OpenCV call."""
+    EXEC_ROLE = ExecRole.DATA
+
+    def __init__(self, node_id, block_sec=0.002):
+        super().__init__(node_id, "Bench Blocking", "BENCH_BLOCK")
+        self.in_val = generate_uuid()
+        self.inputs[self.in_val] = PortType.DATA
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.block_sec = block_sec
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        time.sleep(self.block_sec)
+        self.output_data[self.out_val] = self.fetch_input_data(self.in_val)
+        return None
+
+
+def build_branches(count, depth=2):
+    """count independent SOURCE -> depth x blocking-node branches."""
+    reset_graph()
+    for _ in range(count):
+        src = register_node(BenchCounterSource(generate_uuid()))
+        prev_node, prev_out = src, src.out_val
+        for _ in range(depth):
+            node = register_node(BenchBlockingNode(generate_uuid()))
+            add_link(generate_uuid(), prev_out, node.in_val, prev_node.node_id, node.node_id)
+            prev_node, prev_out = node, node.out_val
+
+
+class BenchSlowVisionNode(BaseNode):
+    """CPU-bound DATA node (holds the GIL), like DA2 inference on CPU."""
+    EXEC_ROLE = ExecRole.DATA
+
+    def __init__(self, node_id, busy_sec=0.03):
+        super().__init__(node_id, "Bench Slow Vision", "BENCH_SLOW")
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.busy_sec = busy_sec
+
+    def execute(self):
+        end = time.perf_counter() + self.busy_sec
+        n = 0
+        while time.perf_counter() < end:
+            n += 1
+        self.output_data[self.out_val] = n
+        return None
+
+
+class BenchDriverNode(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    SAFETY_CRITICAL = True
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Driver", "BENCH_DRIVER")
+        self.calls = []
+
+    def execute(self):
+        self.calls.append(time.perf_counter())
+        return None
+
+
+def driver_cadence(watchdog_on, seconds=2.0):
+    from core.engine_runner import EngineRunner
+    reset_graph()
+    register_node(BenchSlowVisionNode(generate_uuid()))
+    driver = register_node(BenchDriverNode(generate_uuid()))
+    engine.tick_watchdog.enabled = watchdog_on
+    engine.tick_watchdog.reset(engine.run_generation)
+    engine.is_running = True
+    runner = EngineRunner(rate_hz=50.0)
+    runner.start()
+    time.sleep(seconds)
+    runner.stop()
+    gaps = sorted((b - a) * 1000.0 for a, b in zip(driver.calls[1:], driver.calls[2:]))
+    p95 = gaps[int(len(gaps) * 0.95)] if gaps else 0.0
+    return len(driver.calls) / seconds, p95, engine.tick_watchdog.stats['demotions']
+
+
+class BenchFanInDriver(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Fan-in Driver", "BENCH_FANIN")
+        self.in_flow = generate_uuid()
+        self.inputs[self.in_flow] = PortType.FLOW
+        self.out_flow = generate_uuid()
+        self.outputs[self.out_flow] = PortType.FLOW
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        return self.out_flow
+
+
+def fanin_calls(visit, ticks):
+    """START -> branch A, START -> branch B, both -> one DATA-role driver."""
+    from nodes.common import StartNode
+
+    reset_graph()
+    start = register_node(StartNode(generate_uuid()))
+    driver = BenchFanInDriver(generate_uuid())
+    driver.FLOW_VISIT = visit
+    register_node(driver)
+    for _ in range(2):
+        branch = register_node(BenchFlowNode(generate_uuid()))
+        add_link(generate_uuid(), start.out, branch.in_flow, start.node_id, branch.node_id)
+        add_link(generate_uuid(), branch.out_flow, driver.in_flow, branch.node_id, driver.node_id)
+    before = dict(engine.flow_visit_stats)
+    for _ in range(ticks):
+        engine.execute_graph_once()
+    return driver.calls / ticks, (engine.flow_visit_stats['avoided'] - before['avoided']) / ticks
+
+
+class BenchUdpSource(BaseNode):
+    """Same receive pattern as UDP_RECV: drain a non-blocking socket, then re-arm the wake."""
+    EXEC_ROLE = ExecRole.SOURCE
+
+    def __init__(self, node_id):
+        import socket
+        super().__init__(node_id, "Bench UDP", "BENCH_UDP")
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.sock.bind(('127.0.0.1', 0))
+
+    def execute(self):
+        try:
+            while True:
+                data, _ = self.sock.recvfrom(64)
+                self.output_data[self.out_val] = float(data)
+        except OSError:
+            pass
+        self.wake_on_readable(self.sock)
+        return None
+
+
+class BenchLatencyDriver(BaseNode):
+    EXEC_ROLE = ExecRole.DATA
+    FLOW_VISIT = FlowVisit.MERGE
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Latency Driver", "BENCH_LAT")
+        self.in_val = generate_uuid()
+        self.inputs[self.in_val] = PortType.DATA
+        self.last_seen = None
+        self.latencies = []
+
+    def execute(self):
+        sent = self.fetch_input_data(self.in_val)
+        if sent is not None and sent != self.last_seen:
+            self.last_seen = sent
+            self.latencies.append(time.perf_counter() - sent)
+        return None
+
+
+def event_vs_polling(event_driven, idle_sec=3.0, packets=100):
+    import random
+    import socket
+    from core.engine_runner import EngineRunner
+
+    build_chain(30)  # START 체인: 폴링 모드에서는 매 틱 전체가 실행됨
+    udp = register_node(BenchUdpSource(generate_uuid()))
+    driver = register_node(BenchLatencyDriver(generate_uuid()))
+    add_link(generate_uuid(), udp.out_val, driver.in_val, udp.node_id, driver.node_id)
+    engine.is_running = True
+    runner = EngineRunner(rate_hz=50.0, event_driven=event_driven)
+    runner.start()
+
+    time.sleep(0.3)
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    time.sleep(idle_sec)
+    idle_cpu = (time.process_time() - cpu0) / (time.perf_counter() - wall0) * 100.0
+
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    addr = udp.sock.getsockname()
+    for _ in range(packets):
+        time.sleep(random.uniform(0.01, 0.04))
+        tx.sendto(repr(time.perf_counter()).encode(), addr)
+    time.sleep(0.2)
+    runner.stop()
+    engine.is_running = False
+    tx.close()
+    engine.engine_io.unwatch(udp.sock)
+    udp.sock.close()
+
+    lat = sorted(v * 1000.0 for v in driver.latencies)
+    if not lat:
+        return idle_cpu, 0.0, 0.0, 0
+    return idle_cpu, sum(lat) / len(lat), lat[min(len(lat) - 1, int(len(lat) * 0.95))], len(lat)
+
+
+def control_vs_vision(grouped, seconds=2.0):
+    from core.engine_config import RATE_GROUP_CONFIG
+    from core.engine_runner import EngineRunner, start_group_runners, stop_group_runners
+
+    reset_graph()
+    vision = BenchBlockingNode(generate_uuid(), block_sec=0.04)
+    vision.type_str = "BENCH_VISION"
+    RATE_GROUP_CONFIG.setdefault('assign', {})['BENCH_VISION'] = 'vision' if grouped else 'control'
+    register_node(vision)
+    driver = register_node(BenchDriverNode(generate_uuid()))
+    engine.tick_watchdog.enabled = False
+    engine.is_running = True
+    runner = EngineRunner(rate_hz=50.0, event_driven=False)
+    runner.start()
+    if grouped:
+        start_group_runners()
+    time.sleep(seconds)
+    stop_group_runners()
+    runner.stop()
+    engine.is_running = False
+    gaps = sorted((b - a) * 1000.0 for a, b in zip(driver.calls[1:], driver.calls[2:]))
+    p95 = gaps[int(len(gaps) * 0.95)] if gaps else 0.0
+    return len(driver.calls) / seconds, p95, vision.calls / seconds
+
+
+class BenchPeriodicNode(BaseNode):
+    """Receiver-style SOURCE: checks its own poll stamp every tick, works every 0.5 s."""
+    EXEC_ROLE = ExecRole.SOURCE
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Periodic", "BENCH_PERIODIC")
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.state['poll_interval_sec'] = 0.5
+        self.state['fresh_timeout_sec'] = 0.3
+        self._last_poll_mono = 0.0
+        self.polls = 0
+
+    def execute(self):
+        poll_interval_sec = max(0.0, float(self.state.get('poll_interval_sec', 0.5)))
+        fresh_timeout_sec = max(0.05, float(self.state.get('fresh_timeout_sec', 0.3)))
+        now_mono = time.monotonic()
+        if (now_mono - self._last_poll_mono) >= poll_interval_sec:
+            self._last_poll_mono = now_mono
+            self.polls += 1
+        fresh = (now_mono - self._last_poll_mono) <= fresh_timeout_sec
+        self.output_data[self.out_val] = (self.polls, fresh)
+        if self.TIMER_GATED:
+            self.schedule_after(self._last_poll_mono + poll_interval_sec - now_mono)
+        return None
+
+
+def periodic_tick_time(gated, ticks, count=100):
+    reset_graph()
+    BenchPeriodicNode.TIMER_GATED = gated
+    nodes = [register_node(BenchPeriodicNode(generate_uuid())) for _ in range(count)]
+    engine.engine_timers.reset(engine.run_generation)
+    engine.engine_timers.stats.update({'fired': 0, 'skipped': 0})
+    avg = time_ticks(ticks)
+    return avg, sum(n.polls for n in nodes), engine.engine_timers.stats['skipped']
+
+
+class BenchFailingNode(BaseNode):
+    """SOURCE that spends ~1 ms and then raises every run."""
+    EXEC_ROLE = ExecRole.SOURCE
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "Bench Failing", "BENCH_FAILING")
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        end = time.perf_counter() + 0.001
+        while time.perf_counter() < end:
+            pass
+        raise OSError("camera index 0 could not be opened")
+
+
+def failing_nodes(quarantine_on, log_interval_sec, seconds=3.0, count=10, rate_hz=50.0):
+    reset_graph()
+    nodes = [register_node(BenchFailingNode(generate_uuid())) for _ in range(count)]
+    q = engine.node_quarantine
+    lines = []
+    saved = (q.enabled, q.log_interval_sec, q.log_fn)
+    q.enabled, q.log_interval_sec, q.log_fn = quarantine_on, log_interval_sec, lines.append
+    engine.tick_watchdog.enabled = False
+    engine.is_running = True
+    engine.run_generation += 1
+    period = 1.0 / rate_hz
+    ticks = 0
+    busy = 0.0
+    t_end = time.monotonic() + seconds
+    while time.monotonic() < t_end:
+        t0 = time.perf_counter()
+        engine.execute_graph_once()
+        dt = time.perf_counter() - t0
+        busy += dt
+        ticks += 1
+        time.sleep(max(0.0, period - dt))
+    q.enabled, q.log_interval_sec, q.log_fn = saved
+    engine.tick_watchdog.enabled = True
+    return len(lines), busy / max(1, ticks), sum(n.calls for n in nodes), q.stats['errors']
+
+
+class BenchCameraNode(BaseNode):
+    """Publishes a new Frame at `fps`; between frames re-publishes the same Frame."""
+    EXEC_ROLE = ExecRole.SOURCE
+
+    def __init__(self, node_id, fps=15.0):
+        super().__init__(node_id, "Bench Camera", "BENCH_CAMERA")
+        self.out_frame = generate_uuid()
+        self.outputs[self.out_frame] = PortType.DATA
+        self.period = 1.0 / fps
+        self.next_ts = 0.0
+        self.frame = None
+        self.frames = 0
+
+    def execute(self):
+        now = time.monotonic()
+        if now >= self.next_ts:
+            self.next_ts = max(self.next_ts + self.period, now - self.period)
+            self.frame = Frame(bytearray(640 * 480 * 3), source='bench')
+            self.frames += 1
+        self.output_data[self.out_frame] = self.frame
+        return None
+
+
+class BenchVisionNode(BaseNode):
+    """Vision stand-in: `cost_ms` of CPU work per processed frame."""
+    EXEC_ROLE = ExecRole.DATA
+    SKIP_SEEN = True
+
+    def __init__(self, node_id, cost_ms):
+        super().__init__(node_id, "Bench Vision", "BENCH_VISION")
+        self.in_frame = generate_uuid()
+        self.inputs[self.in_frame] = PortType.DATA
+        self.out_frame = generate_uuid()
+        self.outputs[self.out_frame] = PortType.DATA
+        self.cost_sec = cost_ms / 1000.0
+        self.processed = 0
+
+    def execute(self):
+        if self.SKIP_SEEN:
+            src, is_new = self.fetch_frame(self.in_frame)
+        else:
+            src = self.fetch_input_data(self.in_frame)
+            is_new = src is not None
+        if not is_new:
+            return None
+        end = time.perf_counter() + self.cost_sec
+        while time.perf_counter() < end:
+            pass
+        self.processed += 1
+        self.output_data[self.out_frame] = derive_frame(src, frame_image(src))
+        return None
+
+
+def frame_reprocessing(skip_seen, seconds=3.0, rate_hz=50.0):
+    reset_graph()
+    BenchVisionNode.SKIP_SEEN = skip_seen
+    camera = register_node(BenchCameraNode(generate_uuid()))
+    undistort = register_node(BenchVisionNode(generate_uuid(), 2.0))
+    consumers = [register_node(BenchVisionNode(generate_uuid(), cost)) for cost in (3.0, 1.0, 1.0)]  # aruco, stream, save
+    add_link(generate_uuid(), camera.out_frame, undistort.in_frame, camera.node_id, undistort.node_id)
+    for node in consumers:
+        add_link(generate_uuid(), undistort.out_frame, node.in_frame, undistort.node_id, node.node_id)
+    engine.tick_watchdog.enabled = False
+    engine.is_running = True
+    period = 1.0 / rate_hz
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    t_end = time.monotonic() + seconds
+    while time.monotonic() < t_end:
+        t0 = time.perf_counter()
+        engine.execute_graph_once()
+        time.sleep(max(0.0, period - (time.perf_counter() - t0)))
+    cpu = (time.process_time() - cpu0) / (time.perf_counter() - wall0) * 100.0
+    engine.tick_watchdog.enabled = True
+    processed = sum(n.processed for n in [undistort] + consumers)
+    return cpu, camera.frames, processed
+
+
+class BenchImageSourceNode(BaseNode):
+    """New camera-sized Frame every tick (the source allocation a decoder would make)."""
+    EXEC_ROLE = ExecRole.SOURCE
+
+    def __init__(self, node_id, image):
+        super().__init__(node_id, "Bench Image Source", "BENCH_IMAGE")
+        self.out_frame = generate_uuid()
+        self.outputs[self.out_frame] = PortType.DATA
+        self.image = image
+
+    def execute(self):
+        self.output_data[self.out_frame] = Frame(self.image.copy(), source='bench')
+        return None
+
+
+def frame_pool_pipeline(pool_on, width, height, ticks):
+    import tracemalloc
+    import numpy as np
+    import nodes.robots.go1 as go1
+    from core.frames import frame_pool, resident_memory_bytes
+
+    reset_graph()
+    frame_pool.clear()
+    frame_pool.enabled = pool_on
+    frame_pool.stats.update({'allocated': 0, 'reused': 0, 'overflow': 0})
+    rng = np.random.default_rng(0)
+    src = register_node(BenchImageSourceNode(generate_uuid(), rng.integers(0, 255, (height, width, 3), dtype=np.uint8)))
+    fisheye = register_node(go1.FisheyeUndistortNode(generate_uuid()))
+    fisheye.state['crop_enabled'] = False
+    aruco = register_node(go1.ArUcoDetectNode(generate_uuid()))
+    add_link(generate_uuid(), src.out_frame, fisheye.in_frame, src.node_id, fisheye.node_id)
+    add_link(generate_uuid(), fisheye.out_frame, aruco.in_frame, fisheye.node_id, aruco.node_id)
+    engine.tick_watchdog.enabled = False  # 백그라운드로 내리면 틱당 측정이 흐려짐
+    engine.is_running = True
+    for _ in range(5):
+        engine.execute_graph_once()  # warm-up (풀 채우기)
+    frame_pool.stats.update({'allocated': 0, 'reused': 0, 'overflow': 0})
+    rss0 = resident_memory_bytes() or 0
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        engine.execute_graph_once()
+    dt = (time.perf_counter() - t0) / ticks
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss = (resident_memory_bytes() or 0) - rss0
+    allocs = (frame_pool.stats['allocated'] + frame_pool.stats['overflow']) / ticks
+    frame_pool.enabled = True
+    engine.tick_watchdog.enabled = True
+    return allocs, peak, rss, dt, frame_pool.snapshot()['pooled_bytes']
+
+
+class BenchNumericSinkNode(BaseNode):
+    """Reads numeric outputs only (marker list, near score, obstacle flag)."""
+    EXEC_ROLE = ExecRole.DATA
+
+    def __init__(self, node_id, ports=3):
+        super().__init__(node_id, "Bench Numeric Sink", "BENCH_SINK")
+        self.in_ports = [generate_uuid() for _ in range(ports)]
+        for port in self.in_ports:
+            self.inputs[port] = PortType.DATA
+
+    def execute(self):
+        for port in self.in_ports:
+            self.fetch_input_data(port)
+        return None
+
+
+def _marker_scene(width, height):
+    import cv2
+    import numpy as np
+    scene = np.full((height, width, 3), 255, dtype=np.uint8)
+    aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+    size, gap = height // 6, 5
+    cx, cy = width // 2, height // 2
+    # 보정(어안) 후에도 검출되도록 화면 중앙에 모아 배치
+    corners = ((cx - gap - size, cy - gap - size), (cx + gap, cy - gap - size), (cx - gap - size, cy + gap), (cx + gap, cy + gap))
+    for i, (x, y) in enumerate(corners):
+        scene[y:y + size, x:x + size] = cv2.aruco.generateImageMarker(aruco_dict, i, size)[:, :, None]
+    return scene
+
+
+def demand_outputs(demand_on, ticks, width=640, height=480):
+    import cv2
+    import numpy as np
+    import nodes.robots.go1 as go1
+    try:
+        cv2.utils.logging.setLogLevel(cv2.utils.logging.LOG_LEVEL_ERROR)  # drawFrameAxes 경고 생략
+    except AttributeError:
+        pass
+
+    class BenchDepthNode(go1.DepthAnythingV2Node):
+        # 모델 대신 고정 합성 깊이 맵 (측정 대상은 추론 이후의 시각화/JSON 비용)
+        def _run_inference(self, frame):
+            h, w = frame.shape[:2]
+            if getattr(self, '_synthetic', None) is None or self._synthetic.shape != (h, w):
+                yy, xx = np.mgrid[0:h, 0:w]
+                self._synthetic = (yy / h + 0.2 * np.sin(xx / 17.0)).astype(np.float32)
+            return self._synthetic
+
+    reset_graph()
+    engine.node_profiler.reset()
+    src = register_node(BenchImageSourceNode(generate_uuid(), _marker_scene(width, height)))
+    fisheye = register_node(go1.FisheyeUndistortNode(generate_uuid()))
+    fisheye.state['crop_enabled'] = False
+    aruco = register_node(go1.ArUcoDetectNode(generate_uuid()))
+    aruco.state['json_path'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.bench_aruco.json')
+    depth = register_node(BenchDepthNode(generate_uuid()))
+    depth.state['inference_interval_sec'] = 0.0
+    sink = register_node(BenchNumericSinkNode(generate_uuid()))
+    add_link(generate_uuid(), src.out_frame, fisheye.in_frame, src.node_id, fisheye.node_id)
+    add_link(generate_uuid(), fisheye.out_frame, aruco.in_frame, fisheye.node_id, aruco.node_id)
+    add_link(generate_uuid(), fisheye.out_frame, depth.in_frame, fisheye.node_id, depth.node_id)
+    for port, (node, out) in zip(sink.in_ports, ((aruco, aruco.out_data), (depth, depth.out_near_score), (depth, depth.out_obstacle))):
+        add_link(generate_uuid(), out, port, node.node_id, sink.node_id)
+    engine.tick_watchdog.enabled = False
+    engine.is_running = True
+    engine.execute_graph_once()  # compile (demanded_outputs 설정)
+    if not demand_on:
+        for node in (fisheye, aruco, depth):
+            node.demanded_outputs = None  # 모든 출력 계산 (기존 동작)
+    engine.node_profiler.reset()
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        engine.execute_graph_once()
+    tick_ms = (time.perf_counter() - t0) / ticks * 1000.0
+    engine.tick_watchdog.enabled = True
+    try:
+        os.remove(aruco.state['json_path'])
+    except OSError:
+        pass
+    markers = len(aruco.output_data.get(aruco.out_data) or [])
+    return {row['type']: row['p50_ms'] for row in engine.node_profiler.snapshot()['types']}, markers, tick_ms
+
+
+def go1_components(workers, ticks, width=640, height=480):
+    """Real Go1 graph: fisheye -> ArUco and DA2 (synthetic model) on two cameras next to
+    GO1_DRIVER + GO1_ACTION (COMPONENT_GROUP 'go1_control'). The vision types are assigned to
+    the control rate group (rate_groups.assign) so they run as tick components instead of
+    on the 'vision' group thread. Returns (components, tick ms, share of ticks in which the
+    two camera components (source .. last vision node) ran at the same time on different
+    threads). The tick only gets shorter with more than one core for cv2/numpy."""
+    import threading
+    import numpy as np
+    import nodes.robots.go1 as go1
+    from nodes.robots.mt4 import UniversalRobotNode
+    from core.engine_config import PARALLEL_CONFIG, RATE_GROUP_CONFIG
+
+    class BenchDepthNode(go1.DepthAnythingV2Node):
+        # 모델 대신 고정 합성 깊이 맵
+        def _run_inference(self, frame):
+            h, w = frame.shape[:2]
+            if getattr(self, '_synthetic', None) is None or self._synthetic.shape != (h, w):
+                yy, xx = np.mgrid[0:h, 0:w]
+                self._synthetic = (yy / h + 0.2 * np.sin(xx / 17.0)).astype(np.float32)
+            return self._synthetic
+
+    spans = {}
+
+    def traced(node):
+        run = node.execute
+
+        def execute():
+            t0 = time.perf_counter()
+            try:
+                return run()
+            finally:
+                spans.setdefault(node.node_id, []).append((t0, time.perf_counter(), threading.get_ident()))
+        node.execute = execute
+        return node
+
+    reset_graph()
+    scene = _marker_scene(width, height)
+    cam_a = traced(register_node(BenchImageSourceNode(generate_uuid(), scene)))
+    fisheye = register_node(go1.FisheyeUndistortNode(generate_uuid()))
+    fisheye.state['crop_enabled'] = False
+    aruco = traced(register_node(go1.ArUcoDetectNode(generate_uuid())))
+    aruco.state['json_path'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.bench_aruco.json')
+    cam_b = traced(register_node(BenchImageSourceNode(generate_uuid(), scene)))
+    depth = traced(register_node(BenchDepthNode(generate_uuid())))
+    depth.state['inference_interval_sec'] = 0.0
+    register_node(UniversalRobotNode(generate_uuid(), go1.Go1RobotDriver(), "Go1 Driver", "GO1_DRIVER"))
+    register_node(go1.Go1ActionNode(generate_uuid()))
+    add_link(generate_uuid(), cam_a.out_frame, fisheye.in_frame, cam_a.node_id, fisheye.node_id)
+    add_link(generate_uuid(), fisheye.out_frame, aruco.in_frame, fisheye.node_id, aruco.node_id)
+    add_link(generate_uuid(), cam_b.out_frame, depth.in_frame, cam_b.node_id, depth.node_id)
+
+    saved = PARALLEL_CONFIG.get('workers', 0), RATE_GROUP_CONFIG.get('assign', {})
+    PARALLEL_CONFIG['workers'] = workers
+    RATE_GROUP_CONFIG['assign'] = dict(saved[1], VIS_FISHEYE='control', VIS_ARUCO='control', VIS_DEPTH_DA2='control')
+    engine.tick_watchdog.enabled = False
+    engine.is_running = True
+    engine.execute_graph_once()  # warm-up + compile
+    components = len(engine.get_tick_plan().components)
+    spans.clear()
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        engine.execute_graph_once()
+    tick_ms = (time.perf_counter() - t0) / ticks * 1000.0
+    # 컴포넌트 구간 = 카메라 소스 시작 ~ 마지막 비전 노드 끝 (같은 틱끼리 비교)
+    comp_a = [(s0[0], s1[1], s1[2]) for s0, s1 in zip(spans[cam_a.node_id], spans[aruco.node_id])]
+    comp_b = [(s0[0], s1[1], s1[2]) for s0, s1 in zip(spans[cam_b.node_id], spans[depth.node_id])]
+    overlapped = sum(1 for (a0, a1, ta), (b0, b1, tb) in zip(comp_a, comp_b) if ta != tb and a0 < b1 and b0 < a1)
+    PARALLEL_CONFIG['workers'], RATE_GROUP_CONFIG['assign'] = saved
+    engine.shutdown_worker_pool()
+    engine.tick_watchdog.enabled = True
+    try:
+        os.remove(aruco.state['json_path'])
+    except OSError:
+        pass
+    return components, tick_ms, overlapped / max(1, ticks)
+
+
+class BenchEncodeNode(BaseNode):
+    """Stream/save stand-in: JPEG-encodes each new frame at a pyramid level."""
+    EXEC_ROLE = ExecRole.DATA
+
+    def __init__(self, node_id, level):
+        super().__init__(node_id, "Bench Encode", "BENCH_ENCODE")
+        self.in_frame = generate_uuid()
+        self.inputs[self.in_frame] = PortType.DATA
+        self.level = level
+
+    def execute(self):
+        from core.frames import frame_jpeg
+        frame, is_new = self.fetch_frame(self.in_frame)
+        if is_new:
+            self.output_data['jpeg'] = frame_jpeg(frame, self.level)
+        return None
+
+
+def derived_images(cache_on, ticks, width=640, height=480):
+    import numpy as np
+    import core.frames as frames
+    import nodes.robots.go1 as go1
+    from core.frames import derived_cache, frame_rgb
+
+    class BenchDepthNode(go1.DepthAnythingV2Node):
+        # transformers 경로와 같은 RGB 변환 후 고정 합성 깊이 맵 (모델 비용 제외)
+        def _run_inference(self, src):
+            rgb = frame_rgb(src)
+            h, w = rgb.shape[:2]
+            if getattr(self, '_synthetic', None) is None or self._synthetic.shape != (h, w):
+                self._synthetic = np.tile(np.linspace(0.0, 1.0, h, dtype=np.float32)[:, None], (1, w))
+            return self._synthetic
+
+    reset_graph()
+    derived_cache.clear()
+    derived_cache.enabled = cache_on
+    derived_cache.stats.update({'hits': 0, 'misses': 0, 'evictions': 0, 'uncached': 0})
+    src = register_node(BenchImageSourceNode(generate_uuid(), _marker_scene(width, height)))
+    consumers = [register_node(go1.ArUcoDetectNode(generate_uuid())) for _ in range(2)]
+    depth = register_node(BenchDepthNode(generate_uuid()))
+    depth.state['inference_interval_sec'] = 0.0
+    consumers.append(depth)
+    consumers += [register_node(BenchEncodeNode(generate_uuid(), level)) for level in (1, 2)]
+    for node in consumers:
+        add_link(generate_uuid(), src.out_frame, node.in_frame, src.node_id, node.node_id)
+    json_dir = os.path.dirname(os.path.abspath(__file__))
+    for i, node in enumerate(consumers[:2]):
+        node.state['json_path'] = os.path.join(json_dir, f'.bench_aruco_{i}.json')
+    engine.tick_watchdog.enabled = False
+    engine.is_running = True
+    engine.execute_graph_once()
+    derived_cache.stats.update({'hits': 0, 'misses': 0, 'evictions': 0, 'uncached': 0})
+    # 변환 함수만 감싸서 gray/RGB/피라미드 계산에 쓴 시간 측정 (검출/인코딩 비용과 분리)
+    spent = [0.0]
+    originals = {name: getattr(frames, name) for name in ('_to_gray', '_to_rgb', '_pyr_down')}
+
+    def timed(fn):
+        def wrapper(image):
+            t = time.perf_counter()
+            try:
+                return fn(image)
+            finally:
+                spent[0] += time.perf_counter() - t
+        return wrapper
+    for name, fn in originals.items():
+        setattr(frames, name, timed(fn))
+    t0 = time.perf_counter()
+    try:
+        for _ in range(ticks):
+            engine.execute_graph_once()
+    finally:
+        for name, fn in originals.items():
+            setattr(frames, name, fn)
+    tick_ms = (time.perf_counter() - t0) / ticks * 1000.0
+    engine.tick_watchdog.enabled = True
+    for node in consumers[:2]:
+        try:
+            os.remove(node.state['json_path'])
+        except OSError:
+            pass
+    st = derived_cache.snapshot()
+    derived_cache.enabled = True
+    return (st['misses'] + st['uncached']) / ticks, st['hits'] / ticks, spent[0] / ticks * 1000.0, tick_ms, st['frames']
+
+
+class BenchJpegSourceNode(BaseNode):
+    """Camera folder stand-in: one JPEG file's bytes per tick, as a lazy or decoded Frame."""
+    EXEC_ROLE = ExecRole.SOURCE
+
+    def __init__(self, node_id, data, lazy):
+        super().__init__(node_id, "Bench JPEG Source", "BENCH_JPEG")
+        self.out_frame = generate_uuid()
+        self.outputs[self.out_frame] = PortType.DATA
+        self.data = data
+        self.lazy = lazy
+
+    def execute(self):
+        import cv2
+        import numpy as np
+        if self.lazy:
+            frame = Frame.from_jpeg(self.data, source='bench')
+        else:
+            frame = Frame(cv2.imdecode(np.frombuffer(self.data, np.uint8), cv2.IMREAD_COLOR), source='bench')  # 기존 imread
+        self.output_data[self.out_frame] = frame
+        return None
+
+
+def jpeg_passthrough(lazy, with_aruco, ticks, width=640, height=480):
+    import cv2
+    import nodes.robots.go1 as go1
+    from core.frames import codec_stats
+
+    reset_graph()
+    ok, buf = cv2.imencode('.jpg', _marker_scene(width, height))
+    src = register_node(BenchJpegSourceNode(generate_uuid(), buf.tobytes(), lazy))
+    consumers = [register_node(BenchEncodeNode(generate_uuid(), 0)) for _ in range(2)]  # 스트림 + 저장
+    if with_aruco:
+        aruco = register_node(go1.ArUcoDetectNode(generate_uuid()))
+        aruco.state['json_path'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.bench_aruco.json')
+        consumers.append(aruco)
+    for node in consumers:
+        add_link(generate_uuid(), src.out_frame, node.in_frame, src.node_id, node.node_id)
+    engine.tick_watchdog.enabled = False
+    engine.is_running = True
+    engine.execute_graph_once()
+    codec_stats.update({'passthrough': 0, 'encoded': 0, 'decoded': 0, 'decode_failed': 0})
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        engine.execute_graph_once()
+    tick_ms = (time.perf_counter() - t0) / ticks * 1000.0
+    engine.tick_watchdog.enabled = True
+    if with_aruco:
+        try:
+            os.remove(aruco.state['json_path'])
+        except OSError:
+            pass
+    decodes = codec_stats['decoded'] if lazy else ticks  # 기존 경로는 소스가 매 프레임 디코딩
+    return decodes / ticks, codec_stats['encoded'] / ticks, codec_stats['passthrough'] / ticks, tick_ms
+
+
+def _file_frame_writer(folder, fps, width, height, seconds):
+    # gst multifilesink stand-in: one JPEG file per frame, written in place
+    import cv2
+    import numpy as np
+    image = np.zeros((height, width, 3), np.uint8)
+    period = 1.0 / fps
+    next_t = time.monotonic()
+    t_end = next_t + seconds
+    i = 0
+    while time.monotonic() < t_end:
+        image[:] = 0
+        image[:, (i * 8) % width:(i * 8) % width + 16] = 255
+        ok, buf = cv2.imencode('.jpg', image)
+        with open(os.path.join(folder, f"front_{i:06d}.jpg"), 'wb') as f:
+            f.write(buf.tobytes())
+        i += 1
+        next_t += period
+        time.sleep(max(0.0, next_t - time.monotonic()))
+
+
+def frame_handoff(mode, seconds=3.0, fps=30.0, poll_hz=100.0, width=640, height=480):
+    import multiprocessing
+    import shutil
+    import subprocess
+    import tempfile
+    import nodes.robots.go1 as go1
+    from core import frame_bus
+
+    class BenchVideoSource(go1.VideoSourceNode):
+        RING_KEY = 'bench_front'
+
+    use_ring = mode == 'ring'
+    use_slots = mode == 'slots'
+    has_inotify = go1._HAS_INOTIFY
+    if mode == 'poll':
+        go1._HAS_INOTIFY = False   # 폴더 인덱스의 폴링 폴백
+    node = BenchVideoSource(generate_uuid())
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    folder = tempfile.mkdtemp(prefix='pygui_bench_', dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+    node.state['receiver_folder'] = folder
+    if use_ring:
+        writer = subprocess.Popen([sys.executable, '-m', 'core.frame_bus', 'synthetic', '--ring', node.RING_KEY,
+                                   '--fps', str(fps), '--size', f'{width}x{height}', '--seconds', str(seconds + 1.0)],
+                                  cwd=root, stdout=subprocess.DEVNULL)
+    elif use_slots:
+        writer = subprocess.Popen([sys.executable, '-m', 'core.slot_store', 'synthetic', '--dir', folder,
+                                   '--fps', str(fps), '--size', f'{width}x{height}', '--seconds', str(seconds + 1.0)],
+                                  cwd=root, stdout=subprocess.DEVNULL)
+    else:
+        writer = multiprocessing.Process(target=_file_frame_writer, args=(folder, fps, width, height, seconds + 1.0))
+        writer.start()
+    time.sleep(0.5)   # 쓰는 쪽 기동 대기
+    latencies = []
+    poll_ms = []
+    cpu0 = time.process_time()
+    t_end = time.monotonic() + seconds
+    while time.monotonic() < t_end:
+        t0 = time.perf_counter()
+        if use_ring:
+            ring = frame_bus.open_reader(node.RING_KEY)
+            frame = node._read_ring(ring) if ring is not None else None
+        else:
+            frame = node._read_folder()
+        now = time.time()
+        poll_ms.append((time.perf_counter() - t0) * 1000.0)
+        if frame is not None:
+            node._last_frame = frame
+            latencies.append((now - frame.ts) * 1000.0)
+        time.sleep(1.0 / poll_hz)
+    cpu_pct = (time.process_time() - cpu0) / seconds * 100.0
+    if use_ring:
+        writer.terminate()
+        writer.wait()
+        frame_bus.close_all()
+    elif use_slots:
+        writer.wait()
+    else:
+        writer.join()
+    node._release_folder_index()
+    go1._HAS_INOTIFY = has_inotify
+    shutil.rmtree(folder, ignore_errors=True)
+    latencies.sort()
+    poll_ms.sort()
+    p50 = latencies[len(latencies) // 2] if latencies else 0.0
+    p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+    return len(latencies) / seconds, p50, p95, poll_ms[len(poll_ms) // 2], poll_ms[int(len(poll_ms) * 0.95)], cpu_pct
+
+
+def slot_writes(mode, frames=600, max_frames=100, width=640, height=480):
+    """VIS_SAVE Max Frames window: a new front_N file per frame + glob/sort/delete past max_frames,
+    vs publishing into max_frames fixed slots. Per-frame writer time and files in the folder."""
+    import shutil
+    import tempfile
+    import cv2
+    import nodes.robots.go1 as go1
+    from core import slot_store
+
+    ok, buf = cv2.imencode('.jpg', _marker_scene(width, height))
+    data = buf.tobytes()
+    folder = tempfile.mkdtemp(prefix='pygui_bench_', dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+    saver = go1.VideoFrameSaveNode(generate_uuid())
+    store = slot_store.SlotStore(folder, max_frames, writer=True) if mode == 'slots' else None
+    times = []
+    for i in range(frames):
+        t0 = time.perf_counter()
+        if store is not None:
+            store.publish(data)
+        else:
+            with open(os.path.join(folder, f"front_{i + 1:06d}.jpg"), 'wb') as f:
+                f.write(data)
+            saver._prune_saved_frames(folder, max_frames)
+        times.append((time.perf_counter() - t0) * 1000.0)
+    files = len(os.listdir(folder))
+    shutil.rmtree(folder, ignore_errors=True)
+    times.sort()
+    return times[len(times) // 2], times[int(len(times) * 0.95)], files
+
+
+def rtp_receiver(width, height, seconds=3.0, fps=30.0, port=19400):
+    import random
+    import subprocess
+    import cv2
+    import numpy as np
+    from core import rtp_jpeg
+
+    # 1) 정확성: 패킷 순서를 섞고 일부 프레임은 조각 하나를 빼서 조립
+    jpegs = rtp_jpeg._test_pattern_jpegs(width, height, 10)
+    depack = rtp_jpeg.RtpJpegDepacketizer()
+    seq = 0
+    identical = dropped_frames = 0
+    assemble_s = 0.0
+    rng = random.Random(1)
+    for i in range(100):
+        data = jpegs[i % len(jpegs)]
+        packets, seq = rtp_jpeg.packetize_jpeg(data, seq, i * 3000, 1)
+        order = list(range(len(packets)))
+        rng.shuffle(order)
+        if i % 10 == 9:
+            order.pop()
+            dropped_frames += 1
+        t0 = time.perf_counter()
+        out = None
+        for k in order:
+            out = depack.feed(packets[k], 0.0) or out
+        assemble_s += time.perf_counter() - t0
+        if out is not None:
+            a = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+            b = cv2.imdecode(np.frombuffer(out[0], np.uint8), cv2.IMREAD_COLOR)
+            identical += int(b is not None and np.array_equal(a, b))
+    st = depack.stats
+    correct = (identical, depack.stats['frames'], dropped_frames, st['incomplete'] + (1 if depack._pending else 0))
+
+    # 2) 30 fps 로컬 송신기 (다른 프로세스) -> RtpJpegReceiver: 송신 시각부터 프레임 완성까지 지연
+    latencies = []
+    rx = rtp_jpeg.RtpJpegReceiver(port)
+
+    def on_frame(jpeg, now):
+        frame_index = rx.latest_rtp_ts * fps / rtp_jpeg.RTP_CLOCK_HZ
+        latencies.append((now - (start_at + frame_index / fps)) * 1000.0)
+
+    rx.on_frame = on_frame
+    rx.start()
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    start_at = time.time() + 0.5
+    sender = subprocess.Popen([sys.executable, '-c',
+                               'import sys; from core import rtp_jpeg; '
+                               f'rtp_jpeg.run_sender("127.0.0.1", {port}, rtp_jpeg._test_pattern_jpegs({width}, {height}), '
+                               f'{fps}, {seconds}, start_at={start_at})'], cwd=root)
+    cpu0 = time.process_time()
+    sender.wait()
+    time.sleep(0.1)
+    cpu_pct = (time.process_time() - cpu0) / seconds * 100.0
+    paced = rx.snapshot()
+    rx.stop()
+
+    # 3) 최대 속도 송신: 수신기가 소화하는 frames/s
+    rx = rtp_jpeg.RtpJpegReceiver(port).start()
+    t0 = time.time()
+    subprocess.run([sys.executable, '-c',
+                    'from core import rtp_jpeg; '
+                    f'rtp_jpeg.run_sender("127.0.0.1", {port}, rtp_jpeg._test_pattern_jpegs({width}, {height}), 0, frames=1000)'],
+                   cwd=root, check=False)
+    elapsed = time.time() - t0
+    time.sleep(0.1)
+    flood = rx.snapshot()
+    rx.stop()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] if latencies else 0.0
+    p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+    return {
+        'correct': correct, 'assemble_ms': assemble_s / 100 * 1000.0,
+        'paced_frames': paced['frames'], 'paced_lost': paced['lost'], 'p50': p50, 'p95': p95, 'cpu': cpu_pct,
+        'flood_fps': flood['frames'] / elapsed, 'flood_lost': flood['lost'], 'flood_mbit': flood['bytes'] * 8 / elapsed / 1e6,
+    }
+
+
+class BenchCameraSlotNode(BaseNode):
+    """VIDEO_SRC stand-in: newest camera JPEG, from decode_pool or decoded lazily in the tick."""
+    EXEC_ROLE = ExecRole.SOURCE
+
+    def __init__(self, node_id, key, use_pool):
+        super().__init__(node_id, "Bench Camera Slot", "BENCH_CAM_SLOT")
+        self.out_frame = generate_uuid()
+        self.outputs[self.out_frame] = PortType.DATA
+        self.key = key
+        self.use_pool = use_pool
+        self.slot = (0, None)        # 틱 디코딩 모드: 수신 스레드가 (번호, JPEG 바이트)를 씀
+        self._seen = 0
+
+    def execute(self):
+        from core.frames import decode_pool
+        if self.use_pool:
+            count, frame = decode_pool.latest(self.key)
+        else:
+            count, data = self.slot
+            frame = None
+            if count != self._seen and data is not None:
+                frame = Frame.from_jpeg(data, source=self.key)
+        if count != self._seen and frame is not None:
+            self._seen = count
+            self.output_data[self.out_frame] = frame
+        return None
+
+
+class BenchScaledReaderNode(BaseNode):
+    """Vision stand-in that reads a frame at one pyramid level (0 = full size) and does a cheap op."""
+    EXEC_ROLE = ExecRole.DATA
+
+    def __init__(self, node_id, level):
+        super().__init__(node_id, "Bench Scaled Reader", "BENCH_SCALED")
+        self.in_frame = generate_uuid()
+        self.inputs[self.in_frame] = PortType.DATA
+        self.level = level
+
+    def execute(self):
+        from core.frames import frame_scaled
+        frame, is_new = self.fetch_frame(self.in_frame)
+        if is_new:
+            image = frame_scaled(frame, self.level)
+            self.output_data['mean'] = float(image[::16, ::16].mean())
+        return None
+
+
+def decode_offload(mode, level, seconds=3.0, fps=30.0, rate_hz=30.0, width=1280, height=720):
+    import threading
+    import cv2
+    from core.frames import decode_pool, derived_cache
+
+    reset_graph()
+    derived_cache.clear()
+    decode_pool.clear('bench_cam')
+    decode_pool._demand.clear()
+    decode_pool.reset_stats()
+    enabled, reduced = decode_pool.enabled, decode_pool.reduced_decode
+    decode_pool.enabled = mode != 'tick'
+    decode_pool.reduced_decode = mode == 'pool+reduced'
+    ok, buf = cv2.imencode('.jpg', _marker_scene(width, height))
+    data = buf.tobytes()
+    src = register_node(BenchCameraSlotNode(generate_uuid(), 'bench_cam', mode != 'tick'))
+    reader = register_node(BenchScaledReaderNode(generate_uuid(), level))
+    add_link(generate_uuid(), src.out_frame, reader.in_frame, src.node_id, reader.node_id)
+
+    stop = threading.Event()
+
+    def camera():
+        # 수신 스레드 대역: 30 fps로 JPEG 도착
+        n = 0
+        next_t = time.monotonic()
+        while not stop.is_set():
+            n += 1
+            if mode == 'tick':
+                src.slot = (n, data)
+            else:
+                decode_pool.submit('bench_cam', data)
+            next_t += 1.0 / fps
+            stop.wait(max(0.0, next_t - time.monotonic()))
+
+    engine.tick_watchdog.enabled = False
+    engine.is_running = True
+    thread = threading.Thread(target=camera, daemon=True)
+    thread.start()
+    time.sleep(0.3)   # 첫 프레임들로 요청 해상도(demand)가 잡힐 때까지
+    decode_pool.reset_stats()
+    ticks = []
+    next_t = time.monotonic()
+    t_end = next_t + seconds
+    while time.monotonic() < t_end:
+        t0 = time.perf_counter()
+        engine.execute_graph_once()
+        ticks.append((time.perf_counter() - t0) * 1000.0)
+        next_t += 1.0 / rate_hz
+        time.sleep(max(0.0, next_t - time.monotonic()))
+    stop.set()
+    thread.join()
+    engine.tick_watchdog.enabled = True
+    snap = decode_pool.snapshot()
+    decode_pool.enabled, decode_pool.reduced_decode = enabled, reduced
+    ticks.sort()
+    frames = snap['submitted'] if mode != 'tick' else len(ticks)
+    decode_ms = snap['reduced_p50_ms'] if snap['reduced_pool'] + snap['reduced_inline'] else snap['full_p50_ms']
+    return ticks[len(ticks) // 2], ticks[int(len(ticks) * 0.95)], decode_ms, snap['waited'], snap['dropped'], frames
+
+
+def time_ticks(ticks):
+    engine.is_running = True
+    engine.execute_graph_once()  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        engine.execute_graph_once()
+    return (time.perf_counter() - t0) / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="execute_graph_once tick time vs link count")
+    parser.add_argument('--ticks', type=int, default=200)
+    parser.add_argument('--sizes', type=str, default="10,25,50,100,149")
+    parser.add_argument('--pure', action='store_true')
+    parser.add_argument('--parallel', action='store_true')
+    parser.add_argument('--go1parallel', action='store_true')
+    parser.add_argument('--watchdog', action='store_true')
+    parser.add_argument('--fanin', action='store_true')
+    parser.add_argument('--events', action='store_true')
+    parser.add_argument('--rategroups', action='store_true')
+    parser.add_argument('--timers', action='store_true')
+    parser.add_argument('--errors', action='store_true')
+    parser.add_argument('--frames', action='store_true')
+    parser.add_argument('--framepool', action='store_true')
+    parser.add_argument('--demand', action='store_true')
+    parser.add_argument('--derived', action='store_true')
+    parser.add_argument('--jpeg', action='store_true')
+    parser.add_argument('--framebus', action='store_true')
+    parser.add_argument('--rtp', action='store_true')
+    parser.add_argument('--decode', action='store_true')
+    parser.add_argument('--slotstore', action='store_true')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    print(f"{'chain':>6} {'links':>6} {'tick(us)':>10} {'us/link':>8}")
+    for length in sizes:
+        n_links = build_chain(length)
+        avg = time_ticks(args.ticks)
+        print(f"{length:>6} {n_links:>6} {avg * 1e6:>10.1f} {avg * 1e6 / max(1, n_links):>8.2f}")
+
+    print(f"\n{'stages':>6} {'ticks to tail':>14}")
+    for length in (1, 3, 10):
+        print(f"{length:>6} {pipeline_lag(length):>14}")
+
+    if args.pure:
+        print(f"\n{'pure':>6} {'memo off(us)':>13} {'memo on(us)':>12} {'skipped':>8} {'executed':>9}")
+        for length in sizes:
+            build_pure_chain(length)
+            BenchPureNode.PURE = False
+            off = time_ticks(args.ticks)
+            BenchPureNode.PURE = True
+            engine.memo_stats.update({'skipped': 0, 'executed': 0})
+            on = time_ticks(args.ticks)
+            print(f"{length:>6} {off * 1e6:>13.1f} {on * 1e6:>12.1f} {engine.memo_stats['skipped']:>8} {engine.memo_stats['executed']:>9}")
+    if args.parallel:
+        from core.engine_config import PARALLEL_CONFIG
+        workers = int(PARALLEL_CONFIG.get('workers', 4)) or 4  # 설정이 직렬(0)이어도 비교용 풀 크기
+        print(f"\n{'branches':>8} {'serial(ms)':>11} {'pool(ms)':>9}  (workers={workers}, 2 nodes x 2 ms per branch)")
+        for count in (1, 2, 4):
+            build_branches(count)
+            PARALLEL_CONFIG['workers'] = 0
+            serial = time_ticks(max(10, args.ticks // 10))
+            PARALLEL_CONFIG['workers'] = workers
+            pooled = time_ticks(max(10, args.ticks // 10))
+            print(f"{count:>8} {serial * 1e3:>11.2f} {pooled * 1e3:>9.2f}")
+        engine.shutdown_worker_pool()
+    if args.go1parallel:
+        print(f"\n{'workers':>8} {'components':>11} {'tick(ms)':>9} {'overlap':>8}"
+              f"  (Go1 fisheye->ArUco | DA2 | driver+action, 640x480, {os.cpu_count()} CPU)")
+        for workers in (0, 4):
+            components, tick_ms, overlap = go1_components(workers, max(20, args.ticks // 2))
+            print(f"{workers:>8} {components:>11} {tick_ms:>9.2f} {overlap:>8.0%}")
+    if args.watchdog:
+        print(f"\n{'watchdog':>8} {'driver Hz':>10} {'gap p95(ms)':>12} {'demotions':>10}  (target 50 Hz / 20 ms)")
+        for on in (False, True):
+            hz, p95, demotions = driver_cadence(on)
+            print(f"{'on' if on else 'off':>8} {hz:>10.1f} {p95:>12.1f} {demotions:>10}")
+        engine.tick_watchdog.shutdown()
+    if args.fanin:
+        print(f"\n{'policy':>12} {'runs/tick':>10} {'avoided/tick':>13}")
+        for visit in (FlowVisit.PER_TRIGGER, FlowVisit.ONCE, FlowVisit.MERGE):
+            runs, avoided = fanin_calls(visit, args.ticks)
+            print(f"{visit.name:>12} {runs:>10.2f} {avoided:>13.2f}")
+    if args.events:
+        print(f"\n{'runner':>14} {'idle CPU %':>11} {'lat avg(ms)':>12} {'lat p95(ms)':>12} {'samples':>8}")
+        for event_driven in (False, True):
+            cpu, avg, p95, n = event_vs_polling(event_driven)
+            name = 'event+20Hz hb' if event_driven else 'polling 50Hz'
+            print(f"{name:>14} {cpu:>11.2f} {avg:>12.2f} {p95:>12.2f} {n:>8}")
+    if args.rategroups:
+        print(f"\n{'vision':>14} {'driver Hz':>10} {'gap p95(ms)':>12} {'vision Hz':>10}  (control 50 Hz, vision 15 Hz)")
+        for grouped in (False, True):
+            hz, p95, vhz = control_vs_vision(grouped)
+            print(f"{'own group' if grouped else 'inline':>14} {hz:>10.1f} {p95:>12.1f} {vhz:>10.1f}")
+    if args.timers:
+        print(f"\n{'periodic':>10} {'tick(us)':>9} {'polls':>6} {'skipped runs':>13}  (100 idle receivers, 0.5 s interval)")
+        for gated in (False, True):
+            avg, polls, skipped = periodic_tick_time(gated, args.ticks)
+            print(f"{'timers' if gated else 'per-tick':>10} {avg * 1e6:>9.1f} {polls:>6} {skipped:>13}")
+    if args.errors:
+        print(f"\n{'errors':>12} {'log lines':>10} {'tick(ms)':>9} {'execute() calls':>16}  (10 failing nodes, 3 s at 50 Hz)")
+        for name, quarantine_on, interval in (('per-error', False, 0.0), ('rate-limit', False, 5.0), ('quarantine', True, 5.0)):
+            n_lines, avg, calls, _ = failing_nodes(quarantine_on, interval)
+            print(f"{name:>12} {n_lines:>10} {avg * 1e3:>9.2f} {calls:>16}")
+    if args.frames:
+        print(f"\n{'vision':>12} {'CPU %':>6} {'frames':>7} {'processed':>10}  (15 fps camera, 50 Hz tick, 4 vision nodes, 3 s)")
+        for skip_seen in (False, True):
+            cpu, frames, processed = frame_reprocessing(skip_seen)
+            print(f"{'seq skip' if skip_seen else 'every tick':>12} {cpu:>6.1f} {frames:>7} {processed:>10}")
+    if args.framepool:
+        print(f"\n{'size':>10} {'pool':>5} {'allocs/tick':>12} {'traced peak(MB)':>16} {'RSS +(MB)':>10} {'pooled(MB)':>11} {'tick(ms)':>9}"
+              f"  (source + VIS_FISHEYE + VIS_ARUCO, pool allocations only)")
+        for width, height in ((640, 480), (1280, 720)):
+            for pool_on in (False, True):
+                allocs, peak, rss, dt, pooled = frame_pool_pipeline(pool_on, width, height, args.ticks)
+                print(f"{f'{width}x{height}':>10} {'on' if pool_on else 'off':>5} {allocs:>12.2f} {peak / 1048576.0:>16.1f}"
+                      f" {rss / 1048576.0:>10.1f} {pooled / 1048576.0:>11.1f} {dt * 1e3:>9.2f}")
+    if args.demand:
+        types = ('VIS_FISHEYE', 'VIS_ARUCO', 'VIS_DEPTH_DA2')
+        print(f"\n{'size':>10} {'outputs':>8} " + " ".join(f"{t + ' p50(ms)':>20}" for t in types)
+              + f" {'tick(ms)':>9} {'markers':>8}  (numeric outputs wired)")
+        for width, height in ((640, 480), (1280, 720)):
+            for demand_on in (False, True):
+                p50, markers, tick_ms = demand_outputs(demand_on, args.ticks, width, height)
+                print(f"{f'{width}x{height}':>10} {'demand' if demand_on else 'all':>8} "
+                      + " ".join(f"{p50.get(t, 0.0):>20.3f}" for t in types) + f" {tick_ms:>9.2f} {markers:>8}")
+    if args.derived:
+        print(f"\n{'size':>10} {'cache':>6} {'conversions/frame':>18} {'shared/frame':>13} {'convert(ms)':>12} {'tick(ms)':>9} {'kept frames':>12}"
+              f"  (2x VIS_ARUCO gray, DA2 RGB, 1/2 + 1/4 JPEG)")
+        for width, height in ((640, 480), (1280, 720)):
+            for cache_on in (False, True):
+                computed, shared, convert_ms, tick_ms, kept = derived_images(cache_on, args.ticks, width, height)
+                print(f"{f'{width}x{height}':>10} {'on' if cache_on else 'off':>6} {computed:>18.2f} {shared:>13.2f}"
+                      f" {convert_ms:>12.3f} {tick_ms:>9.2f} {kept:>12}")
+    if args.jpeg:
+        print(f"\n{'size':>10} {'consumers':>16} {'source':>8} {'decodes/frame':>14} {'encodes/frame':>14} {'passthrough':>12} {'tick(ms)':>9}")
+        for width, height in ((640, 480), (1280, 720)):
+            for with_aruco in (False, True):
+                for lazy in (False, True):
+                    dec, enc, passed, tick_ms = jpeg_passthrough(lazy, with_aruco, args.ticks, width, height)
+                    name = 'stream+save+aruco' if with_aruco else 'stream+save'
+                    print(f"{f'{width}x{height}':>10} {name:>16} {'jpeg' if lazy else 'decoded':>8} {dec:>14.2f} {enc:>14.2f}"
+                          f" {passed:>12.2f} {tick_ms:>9.2f}")
+    if args.framebus:
+        print(f"\n{'size':>10} {'handoff':>8} {'frames/s':>9} {'latency p50(ms)':>16} {'p95(ms)':>8}"
+              f" {'read p50(ms)':>13} {'p95(ms)':>8} {'reader CPU%':>12}  (30 fps writer process, 100 Hz VIDEO_SRC reads)")
+        for width, height in ((640, 480), (1280, 720)):
+            for mode in ('files', 'poll', 'ring', 'slots'):
+                rate, p50, p95, read50, read95, cpu = frame_handoff(mode, width=width, height=height)
+                print(f"{f'{width}x{height}':>10} {mode:>8} {rate:>9.1f} {p50:>16.1f} {p95:>8.1f}"
+                      f" {read50:>13.3f} {read95:>8.3f} {cpu:>12.1f}")
+    if args.slotstore:
+        print(f"\n{'size':>10} {'save':>8} {'write p50(ms)':>14} {'p95(ms)':>8} {'files in folder':>16}"
+              f"  (VIS_SAVE Max Frames 100, 600 frames)")
+        for width, height in ((640, 480), (1280, 720)):
+            for mode in ('files', 'slots'):
+                p50, p95, files = slot_writes(mode, width=width, height=height)
+                print(f"{f'{width}x{height}':>10} {mode:>8} {p50:>14.3f} {p95:>8.3f} {files:>16}")
+    if args.rtp:
+        print(f"\n{'size':>10} {'identical/assembled':>20} {'dropped/incomplete':>19} {'assemble(ms)':>13}"
+              f" {'30fps frames':>13} {'lost':>5} {'latency p50(ms)':>16} {'p95(ms)':>8} {'CPU%':>6}"
+              f" {'max fps':>8} {'Mbit/s':>7} {'lost pkts':>10}")
+        for width, height in ((640, 480), (1280, 720)):
+            r = rtp_receiver(width, height)
+            identical, assembled, dropped, incomplete = r['correct']
+            print(f"{f'{width}x{height}':>10} {f'{identical}/{assembled}':>20} {f'{dropped}/{incomplete}':>19} {r['assemble_ms']:>13.3f}"
+                  f" {r['paced_frames']:>13} {r['paced_lost']:>5} {r['p50']:>16.2f} {r['p95']:>8.2f} {r['cpu']:>6.1f}"
+                  f" {r['flood_fps']:>8.0f} {r['flood_mbit']:>7.0f} {r['flood_lost']:>10}")
+    if args.decode:
+        print(f"\n{'size':>10} {'reads':>6} {'decode':>13} {'tick p50(ms)':>13} {'tick p95(ms)':>13} {'decode p50(ms)':>15}"
+              f" {'waited':>7} {'dropped':>8}  (30 fps JPEG arrivals, 30 Hz tick)")
+        for width, height in ((640, 480), (1280, 720)):
+            for level in (0, 1):
+                for mode in (('tick', 'pool') if level == 0 else ('tick', 'pool', 'pool+reduced')):
+                    p50, p95, dec, waited, dropped, _ = decode_offload(mode, level, width=width, height=height)
+                    print(f"{f'{width}x{height}':>10} {'full' if level == 0 else '1/2':>6} {mode:>13} {p50:>13.2f} {p95:>13.2f}"
+                          f" {dec:>15.2f} {waited:>7} {dropped:>8}")
+    reset_graph()
+
+
+if __name__ == "__main__":
+    main()
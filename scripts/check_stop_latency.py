@@ -0,0 +1,171 @@
+"""
+Stop-latency check for the priority lane (headless, no DearPyGui required).
+
+A Go1 Server JSON Receiver (FILE mode) shares the control tick with a 30 ms
+CPU-bound vision stand-in (rate group 'vision' running inline, i.e. no group
+runner: the worst case) and a few logging nodes that read the raw JSON.
+Each round writes {"cmd": "stop"} to the JSON file; once the engine I/O loop
+has the response, exactly one tick is run and go1_node_intent is checked:
+
+  - stop must be True after that single tick
+  - with the priority lane on, the time from tick start to the intent write
+    must stay within priority.lane_budget_ms (it must not wait for vision)
+
+Run: python scripts/check_stop_latency.py [--rounds 5]
+Exits 1 if the priority-lane run misses either condition.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.engine as engine
+from core.engine import generate_uuid, PortType, ExecRole, add_link, clear_links, clear_nodes, register_node
+from core.engine_config import PRIORITY_CONFIG
+from nodes.base import BaseNode
+import nodes.robots.go1 as go1
+
+
+class VisionLoadNode(BaseNode):
+    """CPU-bound vision stand-in (holds the GIL like DA2 on CPU)."""
+    EXEC_ROLE = ExecRole.DATA
+    RATE_GROUP = 'vision'
+
+    def __init__(self, node_id, busy_sec=0.03):
+        super().__init__(node_id, "Vision Load", "CHECK_VISION")
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+        self.busy_sec = busy_sec
+
+    def execute(self):
+        end = time.perf_counter() + self.busy_sec
+        n = 0
+        while time.perf_counter() < end:
+            n += 1
+        self.output_data[self.out_val] = n
+        return None
+
+
+class JsonLogNode(BaseNode):
+    """Logging stand-in that reads the receiver's raw JSON (~1 ms)."""
+    EXEC_ROLE = ExecRole.DATA
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "JSON Log", "CHECK_LOG")
+        self.in_val = generate_uuid()
+        self.inputs[self.in_val] = PortType.DATA
+        self.out_val = generate_uuid()
+        self.outputs[self.out_val] = PortType.DATA
+
+    def execute(self):
+        raw = self.fetch_input_data(self.in_val)
+        end = time.perf_counter() + 0.001
+        while time.perf_counter() < end:
+            pass
+        self.output_data[self.out_val] = len(str(raw))
+        return None
+
+
+def build_graph(json_path, backup_dir, loggers=5):
+    clear_links()
+    clear_nodes()
+    recv = go1.Go1ServerJsonRecvNode(generate_uuid())
+    recv.state.update({'mode': 'FILE', 'source': json_path, 'poll_interval_sec': 0.01})
+    recv.backup_folder = backup_dir
+    register_node(recv)
+    register_node(VisionLoadNode(generate_uuid()))
+    prev_port = recv.out_raw_json
+    prev_id = recv.node_id
+    for _ in range(loggers):
+        log = register_node(JsonLogNode(generate_uuid()))
+        add_link(generate_uuid(), prev_port, log.in_val, prev_id, log.node_id)
+        prev_port, prev_id = log.out_val, log.node_id
+    return recv
+
+
+def write_json(path, payload):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f)
+
+
+def _response_has(req, marker):
+    try:
+        return marker in str(req.future.result())
+    except Exception:
+        return False
+
+
+def stop_round(recv, json_path, seq):
+    """Write a stop command, tick until its response is ready, then run one tick."""
+    go1.go1_node_intent['stop'] = False
+    marker = f'"seq": {seq}'
+    write_json(json_path, {'cmd': 'stop', 'seq': seq})
+    deadline = time.monotonic() + 2.0
+    # 응답이 준비될 때까지는 요청 제출/이전 응답 처리용 틱만 돌림 (stop 처리는 측정 틱에서)
+    while time.monotonic() < deadline:
+        req = recv._io_requests.get('json')
+        if req is not None and req.done():
+            if _response_has(req, marker):
+                break
+            engine.execute_graph_once()
+        elif req is None:
+            engine.execute_graph_once()
+        time.sleep(0.002)
+    else:
+        return False, None, None
+    go1.go1_node_intent['stop'] = False
+
+    t0 = time.monotonic()
+    engine.execute_graph_once()
+    tick_ms = (time.monotonic() - t0) * 1000.0
+    if not go1.go1_node_intent.get('stop'):
+        return False, None, tick_ms
+    return True, (go1.go1_node_intent['trigger_time'] - t0) * 1000.0, tick_ms
+
+
+def run_mode(priority_on, rounds, workdir):
+    PRIORITY_CONFIG['enabled'] = priority_on
+    engine.tick_watchdog.enabled = False  # 비전 노드를 강등하지 않는 최악 조건
+    engine._priority_on = priority_on
+    json_path = os.path.join(workdir, 'cmd.json')
+    write_json(json_path, {'cmd': 'none'})
+    backup_dir = os.path.join(workdir, 'backup')
+    os.makedirs(backup_dir, exist_ok=True)   # 수신 노드는 받은 JSON을 여기에 백업함
+    recv = build_graph(json_path, backup_dir)
+    engine.is_running = True
+    engine.run_generation += 1
+    results = [stop_round(recv, json_path, i) for i in range(rounds)]
+    engine.is_running = False
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="stop decision -> go1_node_intent within one tick")
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    budget_ms = float(PRIORITY_CONFIG.get('lane_budget_ms', 2.0))
+    failed = False
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f"{'lane':>5} {'round':>6} {'stop in 1 tick':>15} {'latency(ms)':>12} {'tick(ms)':>9}  (budget {budget_ms:.1f} ms)")
+        for priority_on in (False, True):
+            for i, (ok, latency, tick_ms) in enumerate(run_mode(priority_on, args.rounds, workdir)):
+                lat_text = f"{latency:.2f}" if latency is not None else "-"
+                tick_text = f"{tick_ms:.2f}" if tick_ms is not None else "-"
+                print(f"{'on' if priority_on else 'off':>5} {i:>6} {str(ok):>15} {lat_text:>12} {tick_text:>9}")
+                if priority_on and (not ok or latency is None or latency > budget_ms):
+                    failed = True
+    clear_links()
+    clear_nodes()
+    engine.engine_io.cancel_all()
+    print("FAIL" if failed else "OK: stop reached go1_node_intent within one tick and the lane budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,7 +10,7 @@ import importlib
 from collections import deque
 from core.engine import write_log
 
-from core.engine import node_registry, link_registry, system_log_buffer, state_change_log_buffer, generate_uuid, PortType, HwStatus
+from core.engine import node_registry, link_registry, link_in_index, add_link, remove_link, clear_links, register_node, unregister_node, clear_nodes, system_log_buffer, state_change_log_buffer, generate_uuid, PortType, HwStatus
 from core.input_manager import input_manager
 from core.config import GO1_MODULE_NAME
 from core.factory import NodeFactory
@@ -21,6 +21,12 @@ from nodes.robots.mt4 import (
     MT4_Z_OFFSET, MT4_UNITY_IP, MT4_FEEDBACK_PORT, mt4_homing_callback
 )
 import core.engine as engine_module
+import core.engine_runner as engine_runner_module
+from core.async_io import engine_io, cancel_all_io
+from core.frames import frame_pool, derived_cache, codec_stats, decode_pool, resident_memory_bytes
+from core import frame_bus, rtp_jpeg, slot_store
+from core.engine_config import RUNNER_CONFIG
+from core.profiler import node_profiler
 import nodes.robots.mt4 as mt4_module
 
 try:
@@ -302,10 +308,23 @@ def _ep_send_worker_action(cmd_str):
         return False
 
 
+def _ep_send_worker_camera_start(ring, url, prefer_sdk):
+    # EP_CAM_SRC(엔진 스레드)에서 호출: IPC 응답을 기다리지 않도록 별도 스레드에서 전송
+    if ep_manager is None:
+        return False
+    worker_id = _ep_pick_selected_worker()
+    if not worker_id:
+        return False
+    args = {'ring': ring, 'url': url, 'prefer_sdk': bool(prefer_sdk)}
+    threading.Thread(target=ep_manager.send_cmd, args=(worker_id, 'camera_start', args), daemon=True).start()
+    return True
+
+
 if ep01_module is not None:
     try:
         ep01_module.set_ep_drive_wheels_sender(_ep_send_worker_drive_wheels)
         ep01_module.set_ep_command_sender(_ep_send_worker_action)
+        ep01_module.set_ep_camera_ring_starter(_ep_send_worker_camera_start)
     except Exception:
         pass
 
@@ -595,7 +614,7 @@ class NodeUIRenderer:
             elif t in ["MT4_DRIVER", "GO1_DRIVER", "EP_DRIVER", "TELLO_DRIVER"]:
                 for k, fid in getattr(node, 'ui_fields', {}).items():
                     pin_id = node.in_pins[k]
-                    is_connected = any(l['target'] == pin_id for l in link_registry.values())
+                    is_connected = pin_id in link_in_index
                     if not is_connected: 
                         # MT4일 때만 수동 조작 오버라이드 딜레이 적용
                         override_time = getattr(mt4_module, 'mt4_manual_override_until', 0) if t == "MT4_DRIVER" else 0
@@ -603,7 +622,7 @@ class NodeUIRenderer:
                         else: node.state[k] = dpg.get_value(fid)
                 for k, fid in getattr(node, 'setting_fields', {}).items():
                     pin_id = node.setting_pins[k]
-                    is_connected = any(l['target'] == pin_id for l in link_registry.values())
+                    is_connected = pin_id in link_in_index
                     if not is_connected: node.state[k] = dpg.get_value(fid)
             elif t == "MT4_SAG" and hasattr(node, 'ui_sag'): node.state['sag_factor'] = dpg.get_value(node.ui_sag)
             elif t == "MT4_CALIB" and hasattr(node, 'ui_x'):
@@ -714,6 +733,8 @@ class NodeUIRenderer:
             elif t == "VIS_FLASK" and hasattr(node, 'ui_port'):
                 node.state['port'] = dpg.get_value(node.ui_port)
                 node.state['is_running'] = dpg.get_value(node.ui_run)
+                if hasattr(node, 'ui_downscale'):
+                    node.state['downscale'] = dpg.get_value(node.ui_downscale)
             elif t == "VIS_FISHEYE" and hasattr(node, 'ui_enabled'):
                 node.state['enabled'] = dpg.get_value(node.ui_enabled)
                 node.state['crop_enabled'] = dpg.get_value(node.ui_crop_enabled)
@@ -743,21 +764,45 @@ class NodeUIRenderer:
                 node.state['duration'] = dpg.get_value(node.ui_duration)
                 node.state['use_timer'] = dpg.get_value(node.ui_use_timer)
                 node.state['max_frames'] = dpg.get_value(node.ui_max_frames)
+                if hasattr(node, 'ui_downscale'):
+                    node.state['downscale'] = dpg.get_value(node.ui_downscale)
+                if hasattr(node, 'ui_slot_files'):
+                    node.state['slot_files'] = dpg.get_value(node.ui_slot_files)
             elif t == "EP_CAM_SRC" and hasattr(node, 'ui_url'):
                 node.state['url'] = dpg.get_value(node.ui_url)
                 node.state['prefer_sdk'] = dpg.get_value(node.chk_sdk)
             elif t == "EP_CAM_STREAM" and hasattr(node, 'ui_port'):
                 node.state['port'] = dpg.get_value(node.ui_port)
                 node.state['is_running'] = dpg.get_value(node.ui_run)
+                if hasattr(node, 'ui_downscale'):
+                    node.state['downscale'] = dpg.get_value(node.ui_downscale)
             elif t == "EP_VIS_SAVE" and hasattr(node, 'ui_folder'):
                 node.state['folder'] = dpg.get_value(node.ui_folder)
                 node.state['duration'] = dpg.get_value(node.ui_duration)
                 node.state['use_timer'] = dpg.get_value(node.ui_use_timer)
                 node.state['max_frames'] = dpg.get_value(node.ui_max_frames)
+                if hasattr(node, 'ui_downscale'):
+                    node.state['downscale'] = dpg.get_value(node.ui_downscale)
             elif t == "EP_SERVER_SENDER" and hasattr(node, 'combo_action'):
                 node.state['action'] = dpg.get_value(node.combo_action)
                 node.state['server_url'] = dpg.get_value(node.field_url)
 
+        if engine_module.is_running:
+            NodeUIRenderer._post_key_wakes()
+
+    KEY_WAKE_TYPES = ("COND_KEY", "MT4_KEYBOARD", "GO1_KEYBOARD", "EP_KEYBOARD", "TELLO_KEYBOARD")
+
+    @staticmethod
+    def _post_key_wakes():
+        # 키 눌림/뗌 엣지에서만 키보드 노드를 깨움 (이벤트 구동 러너)
+        for nid, node in node_registry.items():
+            if node.type_str not in NodeUIRenderer.KEY_WAKE_TYPES:
+                continue
+            sig = tuple(k for k, v in node.state.items() if v is True)
+            if sig != getattr(node, '_key_wake_sig', ()):
+                node._key_wake_sig = sig
+                engine_module.post_wake(nid)
+
     @staticmethod
     def sync_state_to_ui(node):
         t = node.type_str
@@ -865,6 +910,8 @@ class NodeUIRenderer:
         elif t == "VIS_FLASK" and hasattr(node, 'ui_port'):
             dpg.set_value(node.ui_port, node.state.get('port', 5000))
             dpg.set_value(node.ui_run, node.state.get('is_running', False))
+            if hasattr(node, 'ui_downscale'):
+                dpg.set_value(node.ui_downscale, int(node.state.get('downscale', 0)))
         elif t == "VIS_FISHEYE" and hasattr(node, 'ui_enabled'):
             dpg.set_value(node.ui_enabled, node.state.get('enabled', True))
             dpg.set_value(node.ui_crop_enabled, node.state.get('crop_enabled', True))
@@ -894,17 +941,25 @@ class NodeUIRenderer:
             dpg.set_value(node.ui_duration, node.state.get('duration', 10.0))
             dpg.set_value(node.ui_use_timer, node.state.get('use_timer', False))
             dpg.set_value(node.ui_max_frames, node.state.get('max_frames', 100))
+            if hasattr(node, 'ui_downscale'):
+                dpg.set_value(node.ui_downscale, int(node.state.get('downscale', 0)))
+            if hasattr(node, 'ui_slot_files'):
+                dpg.set_value(node.ui_slot_files, bool(node.state.get('slot_files', False)))
         elif t == "EP_CAM_SRC" and hasattr(node, 'ui_url'):
             dpg.set_value(node.ui_url, node.state.get('url', 'rtsp://192.168.42.2/live'))
             dpg.set_value(node.chk_sdk, node.state.get('prefer_sdk', True))
         elif t == "EP_CAM_STREAM" and hasattr(node, 'ui_port'):
             dpg.set_value(node.ui_port, node.state.get('port', 5050))
             dpg.set_value(node.ui_run, node.state.get('is_running', False))
+            if hasattr(node, 'ui_downscale'):
+                dpg.set_value(node.ui_downscale, int(node.state.get('downscale', 0)))
         elif t == "EP_VIS_SAVE" and hasattr(node, 'ui_folder'):
             dpg.set_value(node.ui_folder, node.state.get('folder', 'Captured_Images/ep01_saved'))
             dpg.set_value(node.ui_duration, node.state.get('duration', 10.0))
             dpg.set_value(node.ui_use_timer, node.state.get('use_timer', False))
             dpg.set_value(node.ui_max_frames, node.state.get('max_frames', 100))
+            if hasattr(node, 'ui_downscale'):
+                dpg.set_value(node.ui_downscale, int(node.state.get('downscale', 0)))
         elif t == "EP_SERVER_SENDER" and hasattr(node, 'combo_action'):
             dpg.set_value(node.combo_action, node.state.get('action', 'Start Sender'))
             dpg.set_value(node.field_url, node.state.get('server_url', 'http://210.110.250.33:5002/upload'))
@@ -1519,6 +1574,7 @@ class NodeUIRenderer:
             with dpg.node_attribute(attribute_type=dpg.mvNode_Attr_Static):
                 node.ui_port = dpg.add_input_int(label="Port", width=80, default_value=5000)
                 node.ui_run = dpg.add_checkbox(label="Start Server")
+                node.ui_downscale = dpg.add_input_int(label="Downscale", width=80, default_value=int(node.state.get('downscale', 0)), min_value=0, max_value=3, min_clamped=True, max_clamped=True)
 
     @staticmethod
     def _render_video_save(node):
@@ -1530,6 +1586,8 @@ class NodeUIRenderer:
                 dpg.add_text("Duration(s):"); node.ui_duration = dpg.add_input_float(width=80, default_value=float(node.state.get('duration', 10.0)), step=1.0)
                 node.ui_use_timer = dpg.add_checkbox(label="Use Timer", default_value=bool(node.state.get('use_timer', False)))
                 dpg.add_text("Max Frames:"); node.ui_max_frames = dpg.add_input_int(width=80, default_value=int(node.state.get('max_frames', 100)), step=10)
+                dpg.add_text("Downscale (0=full, 1=1/2, 2=1/4):"); node.ui_downscale = dpg.add_input_int(width=80, default_value=int(node.state.get('downscale', 0)), min_value=0, max_value=3, min_clamped=True, max_clamped=True)
+                node.ui_slot_files = dpg.add_checkbox(label="Slot Files (Max Frames ring + latest.idx)", default_value=bool(node.state.get('slot_files', False)))
             with dpg.node_attribute(tag=node.out_flow, attribute_type=dpg.mvNode_Attr_Output): dpg.add_text("Flow Out")
 
     @staticmethod
@@ -1644,6 +1702,7 @@ class NodeUIRenderer:
             with dpg.node_attribute(attribute_type=dpg.mvNode_Attr_Static):
                 node.ui_port = dpg.add_input_int(label="Port", width=80, default_value=5050)
                 node.ui_run = dpg.add_checkbox(label="Start Server")
+                node.ui_downscale = dpg.add_input_int(label="Downscale", width=80, default_value=int(node.state.get('downscale', 0)), min_value=0, max_value=3, min_clamped=True, max_clamped=True)
             with dpg.node_attribute(tag=node.out_flow, attribute_type=dpg.mvNode_Attr_Output):
                 dpg.add_text("Flow Out")
 
@@ -1666,6 +1725,19 @@ class NodeUIRenderer:
 
 # Callback functions
 def toggle_exec(s, a):
+    with engine_module.graph_lock:
+        _toggle_exec_locked()
+
+def _toggle_exec_locked():
+    if not engine_module.is_running:
+        # RUN: 그래프를 먼저 컴파일. 포트 타입 불일치/끊긴 링크만 차단하고,
+        # LOGIC_LOOP 없는 Flow 순환과 도달 불가 노드는 경고만 (순환은 MAX_STEPS가 틱마다 끊음)
+        plan = engine_module.compile_plan()
+        if not plan.ok:
+            engine_module.write_log(f"[Compile] RUN blocked: {len(plan.errors)} error(s), fix the graph and retry")
+            return
+        engine_module.write_log(f"[Compile] ok: {len(plan.order)} tick nodes, {len(plan.components)} components, "
+                                f"{len(plan.warnings)} warning(s)")
     engine_module.is_running = not engine_module.is_running
     if engine_module.is_running:
         engine_module.run_generation += 1
@@ -1673,6 +1745,9 @@ def toggle_exec(s, a):
             ep01_module.ep_node_intent['stop'] = True
             ep01_module.ep_node_intent['trigger_time'] = 0.0
     dpg.set_item_label("btn_run", "STOP" if engine_module.is_running else "RUN SCRIPT")
+    if not engine_module.is_running:
+        # STOP: 진행 중인 노드 비동기 I/O(HTTP 폴링/POST) 취소
+        cancel_all_io()
     if HAS_GO1 and engine_module.is_running:
         for node in node_registry.values():
             if node.type_str == 'VIDEO_SRC' and hasattr(node, '_auto_stopped_by_timer'):
@@ -1732,6 +1807,10 @@ def toggle_exec(s, a):
             pass
 
 def link_cb(s, a): 
+    with engine_module.graph_lock:
+        _link_cb_locked(s, a)
+
+def _link_cb_locked(s, a):
     p1_raw, p2_raw = a[0], a[1]
     p1 = dpg.get_item_alias(p1_raw) or p1_raw
     p2 = dpg.get_item_alias(p2_raw) or p2_raw
@@ -1746,13 +1825,18 @@ def link_cb(s, a):
     for nid, node in node_registry.items():
         if src in node.outputs: src_node_id = nid
         if dst in node.inputs: dst_node_id = nid
-    link_registry[lid] = {'source': src, 'target': dst, 'src_node_id': src_node_id, 'dst_node_id': dst_node_id}
+    add_link(lid, src, dst, src_node_id, dst_node_id)
     
 def del_link_cb(s, a): 
-    link_registry.pop(a, None)
-    if dpg.does_item_exist(a):
-        dpg.delete_item(a)
+    with engine_module.graph_lock:
+        remove_link(a)
+        if dpg.does_item_exist(a):
+            dpg.delete_item(a)
 def add_node_cb(s, a, u):
+    with engine_module.graph_lock:
+        _add_node_locked(u)
+
+def _add_node_locked(u):
     node = NodeFactory.create_node(u)
     if not node:
         return
@@ -1764,8 +1848,8 @@ def add_node_cb(s, a, u):
         while dpg.does_item_exist(new_id) or (new_id in node_registry):
             new_id = generate_uuid()
         node.node_id = new_id
-        node_registry.pop(old_id, None)
-        node_registry[new_id] = node
+        unregister_node(old_id)
+        register_node(node)
         engine_module.write_log(f"[UI] duplicate node tag detected: {old_id} -> {new_id}")
 
     try:
@@ -1773,17 +1857,20 @@ def add_node_cb(s, a, u):
     except Exception as e:
         # 렌더 실패 시 레지스트리 오염 방지
         if node_registry.get(node.node_id) is node:
-            node_registry.pop(node.node_id, None)
+            unregister_node(node.node_id)
         engine_module.write_log(f"[UI] node render failed: type={u}, id={node.node_id}, err={e}")
         raise
 
-def save_cb(s, a): save_graph(dpg.get_value("file_name_input"))
+def save_cb(s, a):
+    with engine_module.graph_lock:
+        save_graph(dpg.get_value("file_name_input"))
 def load_cb(s, a):
     selected = dpg.get_value("file_list_combo")
     if not selected:
         engine_module.write_log("Load Err: please select a file from the list first.")
         return
-    load_graph(selected)
+    with engine_module.graph_lock:
+        load_graph(selected)
 def update_file_list_ui(): update_ui_file_list()
 
 def update_ui_file_list(): 
@@ -1825,20 +1912,25 @@ def clear_editor():
             except Exception as e:
                 engine_module.write_log(f"Error deleting node: {e}")
     
-    # 3. 레지스트리 초기화
-    link_registry.clear()
-    node_registry.clear()
+    # 3. 레지스트리 초기화 (엔진 스레드가 틱 도중이면 끝날 때까지 대기)
+    with engine_module.graph_lock:
+        clear_links()
+        clear_nodes()
 
 def add_dpg_link(src, dst, src_node, dst_node):
     if not dpg.does_item_exist(src) or not dpg.does_item_exist(dst): return
     lid = dpg.add_node_link(src, dst, parent="node_editor")
-    link_registry[lid] = {'source': src, 'target': dst, 'src_node_id': src_node, 'dst_node_id': dst_node}
+    add_link(lid, src, dst, src_node, dst_node)
 
 def delete_selection(sender, app_data):
+    with engine_module.graph_lock:
+        _delete_selection_locked()
+
+def _delete_selection_locked():
     selected_links = dpg.get_selected_links("node_editor")
     selected_nodes = dpg.get_selected_nodes("node_editor")
     for lid in selected_links:
-        if lid in link_registry: del link_registry[lid]
+        remove_link(lid)
         if dpg.does_item_exist(lid): dpg.delete_item(lid)
     for raw_nid in selected_nodes:
         nid = dpg.get_item_alias(raw_nid) or raw_nid 
@@ -1848,9 +1940,9 @@ def delete_selection(sender, app_data):
         for lid, ldata in link_registry.items():
             if ldata['source'] in my_ports or ldata['target'] in my_ports: links_to_remove.append(lid)
         for lid in links_to_remove:
-            if lid in link_registry: del link_registry[lid]
+            remove_link(lid)
             if dpg.does_item_exist(lid): dpg.delete_item(lid)
-        del node_registry[nid]
+        unregister_node(nid)
         if dpg.does_item_exist(nid): dpg.delete_item(nid)
 
 # ================= [Performance Monitoring] =================
@@ -1867,6 +1959,112 @@ perf_history_y = {name: deque(maxlen=PERF_HISTORY_LEN) for name, _ in PERF_METRI
 perf_start_time = time.time()
 _last_perf_sample_time = 0.0
 
+PROFILE_REFRESH_INTERVAL = 1.0  # seconds
+PROFILE_TABLE_ROWS = 20
+_last_profile_refresh_time = 0.0
+
+# 격리된 노드(core/quarantine.py)는 에디터에서 빨간 타이틀바로 표시
+_quarantine_theme = None
+_quarantine_marked = set()
+
+_last_pool_sample = None  # (frame_pool 할당 수, 비전 틱 수) - 틱당 할당 계산용
+
+def _frame_pool_text():
+    global _last_pool_sample
+    ps = frame_pool.snapshot()
+    groups = engine_runner_module.rate_group_snapshot()
+    if 'vision' in groups:
+        ticks, tick_name = groups['vision']['ticks'], 'vision tick'
+    elif engine_runner_module.engine_runner is not None:
+        ticks, tick_name = engine_runner_module.engine_runner.snapshot()['ticks'], 'tick'
+    else:
+        ticks, tick_name = 0, 'tick'
+    allocs = ps['allocated'] + ps['overflow']
+    per_tick = 0.0
+    if _last_pool_sample is not None and ticks > _last_pool_sample[1]:
+        per_tick = (allocs - _last_pool_sample[0]) / (ticks - _last_pool_sample[1])
+    _last_pool_sample = (allocs, ticks)
+    total = allocs + ps['reused']
+    owners = ", ".join(f"{k} {v / 1048576.0:.1f} MB" for k, v in sorted(ps['bytes_by_owner'].items())) or "-"
+    rss = resident_memory_bytes()
+    text = (f"Frame pool: {ps['buffers']} buffers ({ps['in_use']} in use), {ps['pooled_bytes'] / 1048576.0:.1f} MB [{owners}]"
+            f" | allocs/{tick_name} {per_tick:.2f} | reuse {ps['reused'] * 100.0 / total if total else 0.0:.0f}%"
+            f" (overflow {ps['overflow']})")
+    ds = derived_cache.snapshot()
+    lookups = ds['hits'] + ds['misses']
+    text += (f" | derived: hit {ds['hits'] * 100.0 / lookups if lookups else 0.0:.0f}%"
+             f" ({ds['misses']} computed, {ds['frames']} frames, {ds['cached_bytes'] / 1048576.0:.1f} MB)")
+    text += (f" | JPEG: passthrough {codec_stats['passthrough']} / encoded {codec_stats['encoded']}"
+             f" / decoded {codec_stats['decoded']} (+{codec_stats['decoded_reduced']} reduced)")
+    dp = decode_pool.snapshot()
+    if dp['submitted']:
+        text += (f" | decode pool: full p50 {dp['full_p50_ms']:.1f} ms / reduced p50 {dp['reduced_p50_ms']:.1f} ms,"
+                 f" ready p95 {dp['ready_p95_ms']:.1f} ms, in tick {dp['full_inline'] + dp['reduced_inline']}"
+                 f" (waited {dp['waited']}), dropped {dp['dropped']}")
+    rings = frame_bus.snapshot()
+    if rings:
+        text += " | rings: " + ", ".join(f"{key} #{r['latest']} (torn {r['torn']})" for key, r in sorted(rings.items()))
+    stores = slot_store.snapshot()
+    if stores:
+        text += " | slot files: " + ", ".join(f"{os.path.basename(key)} #{st['latest']}/{st['slots']}"
+                                              for key, st in sorted(stores.items()))
+    for port, rx in sorted(rtp_jpeg.snapshot().items()):
+        text += (f" | RTP :{port} {rx['frames']} frames (lost {rx['lost']} pkts, reordered {rx['reordered']},"
+                 f" incomplete {rx['incomplete']})")
+    if rss is not None:
+        text += f" | RSS {rss / 1048576.0:.0f} MB"
+    return text
+
+def _refresh_quarantine_marks():
+    global _quarantine_theme
+    if _quarantine_theme is None:
+        with dpg.theme() as _quarantine_theme:
+            with dpg.theme_component(dpg.mvNode):
+                dpg.add_theme_color(dpg.mvNodeCol_TitleBar, (170, 30, 30), category=dpg.mvThemeCat_Nodes)
+                dpg.add_theme_color(dpg.mvNodeCol_TitleBarHovered, (200, 45, 45), category=dpg.mvThemeCat_Nodes)
+                dpg.add_theme_color(dpg.mvNodeCol_TitleBarSelected, (220, 60, 60), category=dpg.mvThemeCat_Nodes)
+    current = engine_module.node_quarantine.quarantined_ids()
+    for nid in _quarantine_marked - current:
+        if dpg.does_item_exist(nid):
+            dpg.bind_item_theme(nid, 0)
+    for nid in current - _quarantine_marked:
+        if dpg.does_item_exist(nid):
+            dpg.bind_item_theme(nid, _quarantine_theme)
+    _quarantine_marked.clear()
+    _quarantine_marked.update(current)
+
+def _fill_profile_table(table_tag, rows, with_node_cols):
+    if not dpg.does_item_exist(table_tag):
+        return
+    dpg.delete_item(table_tag, children_only=True, slot=1)
+    for r in rows[:PROFILE_TABLE_ROWS]:
+        with dpg.table_row(parent=table_tag):
+            if with_node_cols:
+                dpg.add_text(r['name'])
+            dpg.add_text(r['type'])
+            dpg.add_text(str(r['calls']))
+            dpg.add_text(f"{r['p50_ms']:.3f}")
+            dpg.add_text(f"{r['p95_ms']:.3f}")
+            dpg.add_text(f"{r['max_ms']:.3f}")
+
+def refresh_profiler_tables():
+    snap = node_profiler.snapshot(set(node_registry.keys()))
+    _fill_profile_table("perf_profile_nodes", snap['nodes'], True)
+    _fill_profile_table("perf_profile_types", snap['types'], False)
+
+def profiler_dump_cb(sender=None, app_data=None, user_data=None):
+    try:
+        path = node_profiler.dump_json(engine_module.SAVE_DIR, set(node_registry.keys()))
+        engine_module.write_log(f"[Profiler] dumped: {path}")
+        if dpg.does_item_exist("perf_profile_status"):
+            dpg.set_value("perf_profile_status", f"Saved: {os.path.basename(path)}")
+    except Exception as e:
+        engine_module.write_log(f"[Profiler] dump failed: {e}")
+
+def profiler_reset_cb(sender=None, app_data=None, user_data=None):
+    node_profiler.reset()
+    refresh_profiler_tables()
+
 
 def __init_ui__():
     threading.Thread(target=network_monitor_thread, daemon=True).start()
@@ -2064,6 +2262,12 @@ def __init_ui__():
 
             # ================= [Performance Tab] =================
             with dpg.tab(label="Performance"):
+                dpg.add_text("Engine: -", tag="perf_engine_runner", color=(255,200,0))
+                dpg.add_text("Watchdog: -", tag="perf_watchdog", color=(255,160,80))
+                dpg.add_text("Rate groups: -", tag="perf_rate_groups", color=(160,220,255))
+                dpg.add_text("Timers: -", tag="perf_timers", color=(200,180,255))
+                dpg.add_text("Errors: -", tag="perf_quarantine", color=(255,110,110))
+                dpg.add_text("Frame pool: -", tag="perf_frame_pool", color=(180,255,180))
                 for row in range(2):
                     with dpg.group(horizontal=True):
                         for col in range(2):
@@ -2077,6 +2281,22 @@ def __init_ui__():
                                     with dpg.plot_axis(dpg.mvYAxis, label="FPS", tag=f"perf_yaxis_{name}"):
                                         dpg.add_line_series([], [], label=label, tag=f"perf_series_{name}")
 
+                # --- Node Profiler (node.execute() latency, rolling window) ---
+                with dpg.group(horizontal=True):
+                    dpg.add_text("Node Profiler (ms, rolling)", color=(0,255,180))
+                    dpg.add_button(label="Dump JSON", callback=profiler_dump_cb, width=90)
+                    dpg.add_button(label="Reset", callback=profiler_reset_cb, width=60)
+                    dpg.add_text("", tag="perf_profile_status", color=(180,180,180))
+                with dpg.group(horizontal=True):
+                    with dpg.child_window(width=760, height=300, border=True):
+                        with dpg.table(tag="perf_profile_nodes", header_row=True, resizable=True, borders_innerH=True, borders_outerH=True, borders_innerV=True, borders_outerV=True):
+                            for col in ["Node", "Type", "Calls", "p50", "p95", "Max"]:
+                                dpg.add_table_column(label=col)
+                    with dpg.child_window(width=440, height=300, border=True):
+                        with dpg.table(tag="perf_profile_types", header_row=True, resizable=True, borders_innerH=True, borders_outerH=True, borders_innerV=True, borders_outerV=True):
+                            for col in ["Type", "Calls", "p50", "p95", "Max"]:
+                                dpg.add_table_column(label=col)
+
         dpg.add_separator()
         
         # ================= [Node Palette] =================
@@ -2158,7 +2378,13 @@ def start_gui():
     LOGIC_RATE = 0.02
     last_fb_time = 0
 
-    global _last_perf_sample_time
+    # runner.mode == 'thread': 엔진 틱은 전용 스레드가 고정 주기로 수행하고,
+    # GUI 루프는 UI 값 -> node.state 동기화만 담당한다 (렌더링 지연이 틱 주기에 영향 X).
+    use_engine_thread = str(RUNNER_CONFIG.get('mode', 'thread')).lower() == 'thread'
+    if use_engine_thread:
+        engine_runner_module.start_engine_runner()
+
+    global _last_perf_sample_time, _last_profile_refresh_time
 
     while dpg.is_dearpygui_running():
         if ep_manager is not None:
@@ -2179,6 +2405,64 @@ def start_gui():
                     dpg.fit_axis_data(f"perf_yaxis_{name}")
                 if dpg.does_item_exist(f"perf_text_{name}"):
                     dpg.set_value(f"perf_text_{name}", f"{label}: {fps:.1f}")
+            if engine_runner_module.engine_runner is not None and dpg.does_item_exist("perf_engine_runner"):
+                rs = engine_runner_module.engine_runner.snapshot()
+                dpg.set_value(
+                    "perf_engine_runner",
+                    f"Engine: {rs['actual_hz']:.1f}/{rs['rate_hz']:.0f} Hz | tick avg {rs['tick_avg_ms']:.2f} ms, max {rs['tick_max_ms']:.2f} ms"
+                    f" | jitter avg {rs['jitter_avg_ms']:.2f} ms, max {rs['jitter_max_ms']:.2f} ms"
+                    f" | overruns {rs['overruns']} (skipped {rs['skipped_ticks']})"
+                    f" | memo skipped {engine_module.memo_stats['skipped']}/{engine_module.memo_stats['skipped'] + engine_module.memo_stats['executed']}"
+                    f" | components {len(engine_module.get_tick_plan().components)}"
+                    f" | dup flow avoided {engine_module.flow_visit_stats['last_tick_avoided']}/tick ({engine_module.flow_visit_stats['avoided']} total)"
+                    f" | safety lane {engine_module.priority_stats['last_lane_ms']:.2f}/{engine_module.priority_stats['max_lane_ms']:.2f} ms"
+                    f" (over budget {engine_module.priority_stats['over_budget']})"
+                    f" | io pending {engine_io.pending_count()} (timeouts {engine_io.stats['timeouts']})"
+                    + (f" | event-driven: wake ticks {rs['wake_ticks']}, heartbeats {rs['heartbeats']}" if rs['event_driven'] else "")
+                )
+            if dpg.does_item_exist("perf_rate_groups"):
+                plan = engine_module.get_tick_plan()
+                parts = []
+                for name, gs in engine_runner_module.rate_group_snapshot().items():
+                    parts.append(f"{name} {gs['actual_hz']:.1f}/{gs['rate_hz']:.0f} Hz ({len(plan.rate_groups.get(name, ()))} nodes,"
+                                 f" avg {gs['tick_avg_ms']:.1f} ms, overruns {gs['overruns']})")
+                dpg.set_value("perf_rate_groups", "Rate groups: " + (" | ".join(parts) or "inline (no group runners)"))
+            if dpg.does_item_exist("perf_timers"):
+                ts = engine_module.engine_timers.snapshot()
+                upcoming = ", ".join(
+                    f"{label or nid} {due_in * 1000.0:.0f} ms" for nid, label, due_in in engine_module.engine_timers.upcoming(6)
+                ) or "none"
+                dpg.set_value(
+                    "perf_timers",
+                    f"Timers: armed {ts['pending']} | fired {ts['fired']} | tick runs skipped {ts['skipped']}"
+                    f" | early wakes {ts['expired_by_wake']} | next: {upcoming}"
+                )
+            _refresh_quarantine_marks()
+            if dpg.does_item_exist("perf_frame_pool"):
+                dpg.set_value("perf_frame_pool", _frame_pool_text())
+            if dpg.does_item_exist("perf_quarantine"):
+                qs = engine_module.node_quarantine.snapshot()
+                held = ", ".join(
+                    f"{q['label']} (retry in {q['retry_in']:.1f} s: {q['last_error'][:60]})" for q in qs['quarantined']
+                ) or "none"
+                dpg.set_value(
+                    "perf_quarantine",
+                    f"Errors: {qs['errors']} (log suppressed {qs['suppressed_logs']}) | failing nodes {qs['failing']}"
+                    f" | quarantines {qs['quarantines']} / recoveries {qs['recoveries']} | skipped runs {qs['skipped_runs']}"
+                    f" | quarantined: {held}"
+                )
+            if dpg.does_item_exist("perf_watchdog"):
+                ws = engine_module.tick_watchdog.snapshot()
+                bg = ", ".join(f"{d['label']} ({d['last_ms']:.1f} ms)" for d in ws['demoted']) or "none"
+                dpg.set_value(
+                    "perf_watchdog",
+                    f"Watchdog: slice {ws['slice_ms']:.1f} ms | overruns {ws['overruns']} | demotions {ws['demotions']}"
+                    f" / promotions {ws['promotions']} | background: {bg}"
+                )
+
+        if now_perf - _last_profile_refresh_time >= PROFILE_REFRESH_INTERVAL:
+            _last_profile_refresh_time = now_perf
+            refresh_profiler_tables()
 
         # --- MT4 UI Update ---
         if mt4_dashboard["last_pkt_time"] > 0: dpg.set_value("mt4_dash_status", f"Status: {mt4_dashboard['status']}")
@@ -2383,12 +2667,18 @@ def start_gui():
 
         # --- Node Engine Tick ---
         if engine_module.is_running and (time.time() - last_logic_time > LOGIC_RATE):
-            NodeUIRenderer.sync_ui_to_state()
-            engine_module.execute_graph_once()           
+            if use_engine_thread:
+                with engine_module.graph_lock:
+                    NodeUIRenderer.sync_ui_to_state()
+            else:
+                NodeUIRenderer.sync_ui_to_state()
+                engine_module.execute_graph_once()
             last_logic_time = time.time()
             
         dpg.render_dearpygui_frame()
 
+    engine_runner_module.stop_engine_runner()
+
     if ep_manager is not None:
         try:
             ep_manager.stop_all_workers()